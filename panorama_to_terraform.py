@@ -44,337 +44,725 @@ Usage:
     python panorama_to_terraform.py <input_file.xml> [--output-dir <dir>]
 """
 
-import xml.etree.ElementTree as ET
 import argparse
 import os
-import json
 import re
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import attrgetter, methodcaller
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Iterable, Iterator, NamedTuple, Optional
+
+try:
+    # lxml evaluates find/findall paths in C (libxml2); fall back to the
+    # standard library when it isn't installed.
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+
+def _compile_path(path: str):
+    """Compile a findall() path once; returns a callable taking the context element"""
+    if HAS_LXML:
+        return ET.XPath(path)
+    # ElementPath caches its compiled form of the path string
+    return methodcaller('iterfind', path)
+
+
+@lru_cache(maxsize=None)
+def _member_xpath(path: str):
+    """Compiled lxml XPath returning the <member> elements under .//path"""
+    return ET.XPath(f'.//{path}/member')
+
+
+@lru_cache(maxsize=None)
+def _text_xpath(path: str):
+    """Compiled lxml XPath returning find(path).text as a 0- or 1-item list"""
+    # .text is the element's leading text node, i.e. its first child node
+    # when that is text
+    return ET.XPath(f'({path})[1]/node()[1][self::text()]', smart_strings=False)
+
+
+if HAS_LXML:
+    def _text(element: ET.Element, path: str) -> Optional[str]:
+        """Safely get text from an XML element"""
+        texts = _text_xpath(path)(element)
+        return sys.intern(texts[0]) if texts else None
+    
+    def _members(element: ET.Element, path: str) -> List[str]:
+        """Get list of members from an XML element"""
+        # Member names (zones, addresses, applications, ...) repeat across
+        # thousands of rules; interning keeps one copy of each string.
+        # .text rather than text(), which would also return child tails
+        return [sys.intern(member.text)
+                for member in _member_xpath(path)(element)
+                if member.text]
+else:
+    def _text(element: ET.Element, path: str) -> Optional[str]:
+        """Safely get text from an XML element"""
+        elem = element.find(path)
+        return sys.intern(elem.text) if elem is not None and elem.text is not None else None
+    
+    def _members(element: ET.Element, path: str) -> List[str]:
+        """Get list of members from an XML element"""
+        if '/' in path:
+            containers = element.iterfind(f'.//{path}')
+        else:
+            # Same matches and order as findall('.//path'), without the
+            # path evaluation or an intermediate list
+            containers = element.iter(path)
+        return [sys.intern(member.text)
+                for container in containers
+                for member in container
+                if member.tag == 'member' and member.text]
+
+
+class _AnchoredPath(NamedTuple):
+    """Compiled lookup path, evaluated from each indexed anchor element (root if None)"""
+    anchor: Optional[str]
+    find: Callable
+
+
+# Device-group entries are cached as an anchor of their own, since most
+# object and rule paths start below them
+_DG_ENTRY_PREFIX = './/device-group/entry/'
+
+
+def _anchored_path(path: str) -> _AnchoredPath:
+    """Split a path into (anchor tag, compiled child path)
+
+    './/a/b/c' is evaluated as 'b/c' from each indexed <a> in document
+    order, which is the order findall() returns. Paths that don't start
+    with './/' are evaluated from the root (anchor None).
+    """
+    if path.startswith(_DG_ENTRY_PREFIX):
+        return _AnchoredPath('device-group/entry', _compile_path(path[len(_DG_ENTRY_PREFIX):]))
+    if path.startswith('.//'):
+        tag, _, rest = path[3:].partition('/')
+        return _AnchoredPath(tag, _compile_path(rest))
+    return _AnchoredPath(None, _compile_path(path))
+
+
+def _compile_paths(*paths: str) -> tuple:
+    """Compile a sequence of findall() paths, keeping their order
+
+    Matches are yielded path by path, so the list order is the order the
+    parsers see entries in. './/x/entry' also matches the device-group,
+    shared and device-level copies of x: first-wins parsers list it alone,
+    since narrower paths after it would only repeat entries already seen.
+    Address and service objects and groups list the device-group and
+    shared paths before './/x/entry' on purpose, so those copies are seen
+    first and take precedence; the repeats are skipped by their override
+    rules. BGP and OSPF don't dedup by name, so their lists are kept whole.
+    """
+    return tuple(_anchored_path(path) for path in paths)
+
+
+class _Record(Mapping):
+    """Parsed object with a fixed set of fields (__slots__, no per-instance dict)
+
+    Fields are passed as keyword arguments; any not given default to None.
+    Records can also be used like the dicts the parsers used to return
+    (record['name'], record.get('description'), dict(record)); json.dumps()
+    needs to_dict().
+    """
+    __slots__ = ()
+    
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields.pop(field, None))
+        if fields:
+            raise TypeError(f"{type(self).__name__} has no field(s): {', '.join(fields)}")
+    
+    def __getitem__(self, field: str):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+    
+    def __setitem__(self, field: str, value):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        setattr(self, field, value)
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self):
+        return len(self.__slots__)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Fields as a dict, e.g. for JSON output"""
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    def __repr__(self):
+        fields = ', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())
+        return f'{type(self).__name__}({fields})'
+
+
+class AddressObj(_Record):
+    """Address object; type is None when no value element was present"""
+    __slots__ = ('name', 'type', 'value', 'description', 'tags')
+    name: str
+    type: Optional[str]
+    value: Optional[str]
+    description: Optional[str]
+    tags: List[str]
+
+
+class ServiceObj(_Record):
+    """Service object; protocol is None when neither tcp nor udp was present"""
+    __slots__ = ('name', 'protocol', 'port', 'description')
+    name: str
+    protocol: Optional[str]
+    port: Optional[str]
+    description: Optional[str]
+
+
+class SecurityRule(_Record):
+    """Security policy rule"""
+    __slots__ = ('name', 'source_zones', 'source_addresses', 'destination_zones',
+                 'destination_addresses', 'applications', 'services', 'action',
+                 'description', 'log_start', 'log_end', 'disabled')
+    name: str
+    source_zones: List[str]
+    source_addresses: List[str]
+    destination_zones: List[str]
+    destination_addresses: List[str]
+    applications: List[str]
+    services: List[str]
+    action: Optional[str]
+    description: Optional[str]
+    log_start: bool
+    log_end: bool
+    disabled: bool
+
+
+class NatRule(_Record):
+    """NAT policy rule; translation fields are None when not configured"""
+    __slots__ = ('name', 'source_zones', 'destination_zone', 'source_addresses',
+                 'destination_addresses', 'service', 'description',
+                 'source_translation_type', 'source_translation_address',
+                 'destination_translation_address', 'destination_translation_port',
+                 'disabled')
+    name: str
+    source_zones: List[str]
+    destination_zone: Optional[str]
+    source_addresses: List[str]
+    destination_addresses: List[str]
+    service: Optional[str]
+    description: Optional[str]
+    source_translation_type: Optional[str]
+    source_translation_address: Optional[List[str]]
+    destination_translation_address: Optional[str]
+    destination_translation_port: Optional[str]
+    disabled: bool
+
+
+class PBFRule(_Record):
+    """Policy-Based Forwarding rule; action is a dict keyed by 'type'"""
+    __slots__ = ('name', 'uuid', 'description', 'disabled', 'source_zones',
+                 'source_addresses', 'source_users', 'destination_addresses',
+                 'applications', 'services', 'action', 'enforce_symmetric_return')
+    name: str
+    uuid: Optional[str]
+    description: Optional[str]
+    disabled: bool
+    source_zones: List[str]
+    source_addresses: List[str]
+    source_users: List[str]
+    destination_addresses: List[str]
+    applications: List[str]
+    services: List[str]
+    action: Optional[Dict[str, Any]]
+    enforce_symmetric_return: Optional[bool]
+
+
+class Zone(_Record):
+    """Security zone"""
+    __slots__ = ('name', 'type', 'interfaces', 'zone_protection_profile')
+    name: str
+    type: str
+    interfaces: List[str]
+    zone_protection_profile: Optional[str]
+
+
+class Interface(_Record):
+    """Network interface; tag is only set for VLAN interfaces and subinterfaces"""
+    __slots__ = ('name', 'type', 'mode', 'ip_addresses', 'ipv6_addresses', 'zone',
+                 'virtual_router', 'management_profile', 'comment', 'tag')
+    name: str
+    type: str
+    mode: Optional[str]
+    ip_addresses: List[str]
+    ipv6_addresses: List[str]
+    zone: Optional[str]
+    virtual_router: Optional[str]
+    management_profile: Optional[str]
+    comment: Optional[str]
+    tag: Optional[str]
+
+
+class StaticRoute(_Record):
+    """Static route of a virtual or logical router"""
+    __slots__ = ('name', 'destination', 'nexthop_ip', 'nexthop_interface', 'metric')
+    name: str
+    destination: Optional[str]
+    nexthop_ip: Optional[str]
+    nexthop_interface: Optional[str]
+    metric: Optional[str]
+
+
+class VirtualRouter(_Record):
+    """Virtual router, or logical router when router_type is 'logical'"""
+    __slots__ = ('name', 'template', 'router_type', 'interfaces', 'static_routes')
+    name: str
+    template: Optional[str]
+    router_type: Optional[str]
+    interfaces: List[str]
+    static_routes: List[StaticRoute]
+
+
+class SecurityProfile(_Record):
+    """Security profile (antivirus, vulnerability, ...); only the name is converted"""
+    __slots__ = ('name', 'description')
+    name: str
+    description: Optional[str]
+
+
+class SecurityProfileGroup(_Record):
+    """Security profile group; each field lists the referenced profile names"""
+    __slots__ = ('name', 'virus', 'spyware', 'vulnerability', 'url_filtering',
+                 'file_blocking', 'wildfire_analysis')
+    name: str
+    virus: List[str]
+    spyware: List[str]
+    vulnerability: List[str]
+    url_filtering: List[str]
+    file_blocking: List[str]
+    wildfire_analysis: List[str]
+
+
+# lxml iterparse options for every parse of an export. Nothing looks
+# elements up by ID, so skip the ID table. Indentation whitespace, comments
+# and processing instructions are never read, so don't build nodes for them
+# (ElementTree drops comments and PIs too); left in, they would also split
+# text that the lookups expect as a single node.
+_LXML_PARSE_OPTIONS = {'collect_ids': False, 'remove_blank_text': True,
+                       'remove_comments': True, 'remove_pis': True}
 
 
 class PanoramaParser:
     """Parse Palo Alto Panorama XML configuration"""
     
-    def __init__(self, xml_file: str):
+    def __init__(self, xml_file: str, huge_tree: bool = False):
         self.xml_file = xml_file
-        self.tree = ET.parse(xml_file)
-        self.root = self.tree.getroot()
-        
+        # Build the tree and the anchor index in a single pass, rather than
+        # every lookup path scanning the whole document again.
+        indexed_tags = self._indexed_tags()
+        self._index = {tag: [] for tag in indexed_tags}
+        if HAS_LXML:
+            # huge_tree lifts libxml2's depth and text-size limits, which
+            # also guard against hostile input, so it is only set on request.
+            context = ET.iterparse(xml_file, events=('start',), tag=sorted(indexed_tags),
+                                   huge_tree=huge_tree, **_LXML_PARSE_OPTIONS)
+            for _, elem in context:
+                self._index[elem.tag].append(elem)
+        else:
+            context = ET.iterparse(xml_file, events=('start',))
+            index = self._index
+            for _, elem in context:
+                elements = index.get(elem.tag)
+                if elements is not None:
+                    elements.append(elem)
+        self.root = context.root
+        self.tree = ET.ElementTree(self.root)
+        
+        self._dg_entries = [entry for dg in self._index['device-group']
+                            for entry in dg.iterfind('entry')]
+        self._index['device-group/entry'] = self._dg_entries
+    
+    @classmethod
+    def _indexed_tags(cls) -> set:
+        """Anchor tags of the compiled paths defined on this class and its bases"""
+        # Device groups are always indexed; parse_device_groups() reads them
+        tags = {'device-group'}
+        
+        def collect(value):
+            # A compiled path, or tuples (possibly nested) holding them
+            if isinstance(value, _AnchoredPath):
+                if value.anchor:
+                    tags.add(value.anchor.partition('/')[0])
+            elif isinstance(value, tuple):
+                for item in value:
+                    collect(item)
+        
+        for klass in cls.__mro__:
+            for value in vars(klass).values():
+                collect(value)
+        return tags
+    
+    def _select_all(self, xpaths: tuple) -> Iterator:
+        """Evaluate compiled paths in order, yielding their matches as one sequence"""
+        for xpath in xpaths:
+            yield from self._select(xpath)
+    
+    def _select(self, xpath: tuple) -> Iterator:
+        """Evaluate a path compiled by _anchored_path(), yielding the matches"""
+        anchor, find = xpath
+        if anchor is None:
+            yield from find(self.root)
+            return
+        contexts = self._index.get(anchor)
+        if contexts is None:
+            # Compiled outside the class attributes, so not indexed while
+            # loading; find the anchors now, in document order
+            contexts = self._index[anchor] = list(self.root.iter(anchor))
+        for context in contexts:
+            yield from find(context)
+    
+    def parse_all(self) -> Dict[str, Any]:
+        """Run every parser, keyed by object type (the parse_* method suffix)"""
+        return {
+            name[len('parse_'):]: getattr(self, name)()
+            for name in self._PARSERS
+        }
+    
     def parse_device_groups(self) -> List[Dict]:
         """Parse device groups from Panorama config"""
         device_groups = []
         
         # Find device-group elements
-        for dg in self.root.findall(".//device-group/entry"):
+        for dg in self._dg_entries:
             name = dg.get('name')
             if name:
                 device_groups.append({
                     'name': name,
-                    'description': self._get_text(dg, 'description')
+                    'description': _text(dg, 'description')
                 })
         
         return device_groups
     
+    _TAGS_PATHS = _compile_paths(
+        ".//tag/entry",
+    )
+    
     def parse_tags(self) -> List[Dict]:
         """Parse tags"""
         tags = []
         seen_names = set()
         
-        paths = [
-            ".//tag/entry",
-            ".//device-group/entry/tag/entry"
-        ]
-        
-        for path in paths:
-            for tag in self.root.findall(path):
-                name = tag.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                tag_obj = {
-                    'name': name,
-                    'color': self._get_text(tag, 'color'),
-                    'comments': self._get_text(tag, 'comments')
-                }
-                
-                tags.append(tag_obj)
+        for tag in self._select_all(self._TAGS_PATHS):
+            name = tag.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            tag_obj = {
+                'name': name,
+                'color': _text(tag, 'color'),
+                'comments': _text(tag, 'comments')
+            }
+            
+            tags.append(tag_obj)
         
         return tags
     
+    _REGIONS_PATHS = _compile_paths(
+        ".//region/entry",
+    )
+    
     def parse_regions(self) -> List[Dict]:
         """Parse regions (geographic locations)"""
         regions = []
         seen_names = set()
         
-        paths = [
-            ".//region/entry",
-            ".//device-group/entry/region/entry"
-        ]
-        
-        for path in paths:
-            for region in self.root.findall(path):
-                name = region.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                addresses = []
-                for addr in region.findall('.//address/member'):
-                    if addr.text:
-                        addresses.append(addr.text)
-                
-                region_obj = {
-                    'name': name,
-                    'addresses': addresses
-                }
-                
-                regions.append(region_obj)
+        for region in self._select_all(self._REGIONS_PATHS):
+            name = region.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            addresses = _members(region, 'address')
+            
+            region_obj = {
+                'name': name,
+                'addresses': addresses
+            }
+            
+            regions.append(region_obj)
         
         return regions
     
+    _CUSTOM_URL_CATEGORIES_PATHS = _compile_paths(
+        ".//custom-url-category/entry",
+    )
+    
     def parse_custom_url_categories(self) -> List[Dict]:
         """Parse custom URL categories"""
         categories = []
         seen_names = set()
         
-        paths = [
-            ".//custom-url-category/entry",
-            ".//device-group/entry/custom-url-category/entry"
-        ]
-        
-        for path in paths:
-            for cat in self.root.findall(path):
-                name = cat.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                url_list = []
-                for url in cat.findall('.//list/member'):
-                    if url.text:
-                        url_list.append(url.text)
-                
-                cat_obj = {
-                    'name': name,
-                    'type': self._get_text(cat, 'type'),
-                    'list': url_list,
-                    'description': self._get_text(cat, 'description')
-                }
-                
-                categories.append(cat_obj)
+        for cat in self._select_all(self._CUSTOM_URL_CATEGORIES_PATHS):
+            name = cat.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            url_list = _members(cat, 'list')
+            
+            cat_obj = {
+                'name': name,
+                'type': _text(cat, 'type'),
+                'list': url_list,
+                'description': _text(cat, 'description')
+            }
+            
+            categories.append(cat_obj)
         
         return categories
     
+    _APPLICATION_GROUPS_PATHS = _compile_paths(
+        ".//application-group/entry",
+    )
+    
     def parse_application_groups(self) -> List[Dict]:
         """Parse application groups"""
         app_groups = []
         seen_names = set()
         
-        paths = [
-            ".//application-group/entry",
-            ".//device-group/entry/application-group/entry"
-        ]
-        
-        for path in paths:
-            for ag in self.root.findall(path):
-                name = ag.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                members = []
-                for member in ag.findall('.//members/member'):
-                    if member.text:
-                        members.append(member.text)
-                
-                ag_obj = {
-                    'name': name,
-                    'members': members
-                }
-                
-                app_groups.append(ag_obj)
+        for ag in self._select_all(self._APPLICATION_GROUPS_PATHS):
+            name = ag.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            members = _members(ag, 'members')
+            
+            ag_obj = {
+                'name': name,
+                'members': members
+            }
+            
+            app_groups.append(ag_obj)
         
         return app_groups
     
+    _APPLICATION_FILTERS_PATHS = _compile_paths(
+        ".//application-filter/entry",
+    )
+    
     def parse_application_filters(self) -> List[Dict]:
         """Parse application filters"""
         app_filters = []
         seen_names = set()
         
-        paths = [
-            ".//application-filter/entry",
-            ".//device-group/entry/application-filter/entry"
-        ]
-        
-        for path in paths:
-            for af in self.root.findall(path):
-                name = af.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                af_obj = {
-                    'name': name,
-                    'category': self._get_members(af, 'category'),
-                    'subcategory': self._get_members(af, 'subcategory'),
-                    'technology': self._get_members(af, 'technology'),
-                    'risk': self._get_members(af, 'risk'),
-                    'evasive': self._get_text(af, 'evasive'),
-                    'excessive_bandwidth_use': self._get_text(af, 'excessive-bandwidth-use'),
-                    'prone_to_misuse': self._get_text(af, 'prone-to-misuse'),
-                    'is_saas': self._get_text(af, 'is-saas'),
-                    'transfers_files': self._get_text(af, 'transfers-files'),
-                    'tunnels_other_apps': self._get_text(af, 'tunnels-other-apps'),
-                    'used_by_malware': self._get_text(af, 'used-by-malware'),
-                }
-                
-                app_filters.append(af_obj)
+        for af in self._select_all(self._APPLICATION_FILTERS_PATHS):
+            name = af.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            af_obj = {
+                'name': name,
+                'category': _members(af, 'category'),
+                'subcategory': _members(af, 'subcategory'),
+                'technology': _members(af, 'technology'),
+                'risk': _members(af, 'risk'),
+                'evasive': _text(af, 'evasive'),
+                'excessive_bandwidth_use': _text(af, 'excessive-bandwidth-use'),
+                'prone_to_misuse': _text(af, 'prone-to-misuse'),
+                'is_saas': _text(af, 'is-saas'),
+                'transfers_files': _text(af, 'transfers-files'),
+                'tunnels_other_apps': _text(af, 'tunnels-other-apps'),
+                'used_by_malware': _text(af, 'used-by-malware'),
+            }
+            
+            app_filters.append(af_obj)
         
         return app_filters
     
+    _EXTERNAL_LISTS_PATHS = _compile_paths(
+        ".//external-list/entry",
+    )
+    
+    _EDL_TYPES = ('ip', 'domain', 'url')
+    _EDL_RECURRING = ('hourly', 'five-minute', 'daily')
+    
     def parse_external_lists(self) -> List[Dict]:
         """Parse external dynamic lists"""
         ext_lists = []
         seen_names = set()
         
-        paths = [
-            ".//external-list/entry",
-            ".//device-group/entry/external-list/entry"
-        ]
-        
-        for path in paths:
-            for ext_list in self.root.findall(path):
-                name = ext_list.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                # Determine type
-                list_type = None
-                url = None
-                recurring = None
-                
-                type_elem = ext_list.find('type')
-                if type_elem is not None:
-                    if type_elem.find('ip') is not None:
-                        list_type = 'ip'
-                        url = self._get_text(type_elem, 'ip/url')
-                        # Check for recurring schedule
-                        if type_elem.find('.//recurring/hourly') is not None:
-                            recurring = 'hourly'
-                        elif type_elem.find('.//recurring/five-minute') is not None:
-                            recurring = 'five-minute'
-                        elif type_elem.find('.//recurring/daily') is not None:
-                            recurring = 'daily'
-                    elif type_elem.find('domain') is not None:
-                        list_type = 'domain'
-                        url = self._get_text(type_elem, 'domain/url')
-                        if type_elem.find('.//recurring/hourly') is not None:
-                            recurring = 'hourly'
-                        elif type_elem.find('.//recurring/five-minute') is not None:
-                            recurring = 'five-minute'
-                        elif type_elem.find('.//recurring/daily') is not None:
-                            recurring = 'daily'
-                    elif type_elem.find('url') is not None:
-                        list_type = 'url'
-                        url = self._get_text(type_elem, 'url/url')
-                        if type_elem.find('.//recurring/hourly') is not None:
-                            recurring = 'hourly'
-                        elif type_elem.find('.//recurring/five-minute') is not None:
-                            recurring = 'five-minute'
-                        elif type_elem.find('.//recurring/daily') is not None:
-                            recurring = 'daily'
-                
-                ext_list_obj = {
-                    'name': name,
-                    'type': list_type,
-                    'url': url,
-                    'recurring': recurring,
-                    'description': self._get_text(ext_list, 'description')
-                }
-                
-                ext_lists.append(ext_list_obj)
+        for ext_list in self._select_all(self._EXTERNAL_LISTS_PATHS):
+            name = ext_list.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            # Determine type
+            list_type = None
+            url = None
+            recurring = None
+            
+            type_elem = ext_list.find('type')
+            if type_elem is not None:
+                # The first known type present, in priority order
+                type_tags = {child.tag for child in type_elem}
+                list_type = next((t for t in self._EDL_TYPES if t in type_tags), None)
+                if list_type is not None:
+                    url = _text(type_elem, f'{list_type}/url')
+                    # Check for recurring schedule
+                    rec = type_elem.find('.//recurring')
+                    if rec is not None:
+                        rec_tags = {child.tag for child in rec}
+                        recurring = next((r for r in self._EDL_RECURRING if r in rec_tags), None)
+            
+            ext_list_obj = {
+                'name': name,
+                'type': list_type,
+                'url': url,
+                'recurring': recurring,
+                'description': _text(ext_list, 'description')
+            }
+            
+            ext_lists.append(ext_list_obj)
         
         return ext_lists
     
-    def parse_address_objects(self) -> List[Dict]:
+    _ADDRESS_OBJECTS_PATHS = _compile_paths(
+        ".//device-group/entry/address/entry",
+        ".//shared/address/entry",
+        ".//address/entry",
+    )
+    
+    def parse_address_objects(self) -> List[AddressObj]:
         """Parse address objects"""
-        # Use dictionary to track objects by name, allowing overrides
-        addresses_dict = {}
-        
         # Parse in order: device groups first, then shared
         # This allows device-group definitions to override shared references
-        paths = [
-            ".//device-group/entry/address/entry",
-            ".//shared/address/entry",
-            ".//address/entry"
-        ]
+        return self._collect_address_objects(self._select_all(self._ADDRESS_OBJECTS_PATHS))
+    
+    def _collect_address_objects(self, entries: Iterable) -> List[AddressObj]:
+        """Build address objects from <entry> elements given in override order"""
+        # Use dictionary to track objects by name, allowing overrides
+        addresses_dict = {}
         
-        for path in paths:
-            for addr in self.root.findall(path):
-                name = addr.get('name')
-                if not name:
-                    continue
-                
-                # Check if this is just a reference (only has <id> tag, no actual content)
-                has_id_only = (addr.find('id') is not None and 
-                              addr.find('ip-netmask') is None and 
-                              addr.find('ip-range') is None and
-                              addr.find('fqdn') is None and
-                              addr.find('description') is None)
-                
-                if has_id_only:
-                    # Skip reference-only entries
-                    continue
-                
-                addr_obj = {'name': name}
-                
-                # Check for IP netmask
-                ip_netmask = addr.find('ip-netmask')
-                if ip_netmask is not None:
-                    addr_obj['type'] = 'ip-netmask'
-                    addr_obj['value'] = ip_netmask.text
-                
-                # Check for IP range
-                ip_range = addr.find('ip-range')
-                if ip_range is not None:
-                    addr_obj['type'] = 'ip-range'
-                    addr_obj['value'] = ip_range.text
-                
-                # Check for FQDN
-                fqdn = addr.find('fqdn')
-                if fqdn is not None:
-                    addr_obj['type'] = 'fqdn'
-                    addr_obj['value'] = fqdn.text
-                
-                # Description
-                desc = addr.find('description')
-                if desc is not None:
-                    addr_obj['description'] = desc.text
-                
-                # Tags
-                tags = []
-                tag_member = addr.findall('.//tag/member')
-                for tag in tag_member:
-                    if tag.text:
-                        tags.append(tag.text)
-                addr_obj['tags'] = tags
-                
-                # Only add/override if this entry has content (value defined)
-                # OR if we haven't seen this name yet
-                if ('value' in addr_obj or name not in addresses_dict):
-                    addresses_dict[name] = addr_obj
+        for addr in entries:
+            name = addr.get('name')
+            if not name:
+                continue
+            
+            ip_netmask = addr.find('ip-netmask')
+            ip_range = addr.find('ip-range')
+            fqdn = addr.find('fqdn')
+            has_value = ip_netmask is not None or ip_range is not None or fqdn is not None
+            
+            # Without a value this entry can't override one already seen
+            if not has_value and name in addresses_dict:
+                continue
+            
+            # Check if this is just a reference (only has <id> tag, no actual content)
+            if not has_value and self._is_reference(addr, ('description',)):
+                # Skip reference-only entries
+                continue
+            
+            addr_obj = AddressObj(name=name)
+            
+            # Check for IP netmask
+            if ip_netmask is not None:
+                addr_obj.type = 'ip-netmask'
+                addr_obj.value = ip_netmask.text
+            
+            # Check for IP range
+            if ip_range is not None:
+                addr_obj.type = 'ip-range'
+                addr_obj.value = ip_range.text
+            
+            # Check for FQDN
+            if fqdn is not None:
+                addr_obj.type = 'fqdn'
+                addr_obj.value = fqdn.text
+            
+            # Description
+            desc = addr.find('description')
+            if desc is not None:
+                addr_obj.description = desc.text
+            
+            # Tags
+            addr_obj.tags = _members(addr, 'tag')
+            
+            # Entries with a value override earlier ones; anything else
+            # reaching here is the first entry for this name
+            addresses_dict[name] = addr_obj
         
         return list(addresses_dict.values())
     
+    @classmethod
+    def stream_address_objects(cls, xml_file: str, huge_tree: bool = False) -> List[AddressObj]:
+        """Parse only the address objects, streaming the file instead of loading it
+        
+        Returns the same list as parse_address_objects(). Only the address
+        <entry> subtrees are kept; every other element is cleared and
+        dropped once parsed, so memory stays bounded for very large exports.
+        """
+        # Entries matched by each of _ADDRESS_OBJECTS_PATHS, in document order
+        dg_entries, shared_entries, all_entries = [], [], []
+        kwargs = dict(_LXML_PARSE_OPTIONS, huge_tree=huge_tree) if HAS_LXML else {}
+        ancestors = []
+        open_entries = 0
+        
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end'), **kwargs):
+            if event == 'start':
+                if elem.tag == 'entry' and ancestors and ancestors[-1].tag == 'address':
+                    owner = ancestors[-2] if len(ancestors) > 1 else None
+                    if (owner is not None and owner.tag == 'entry'
+                            and len(ancestors) > 2 and ancestors[-3].tag == 'device-group'):
+                        dg_entries.append(elem)
+                    elif owner is not None and owner.tag == 'shared':
+                        shared_entries.append(elem)
+                    all_entries.append(elem)
+                    open_entries += 1
+                ancestors.append(elem)
+                continue
+            
+            ancestors.pop()
+            if open_entries:
+                # Inside an address entry: keep the subtree intact
+                if elem.tag == 'entry' and ancestors and ancestors[-1].tag == 'address':
+                    open_entries -= 1
+                else:
+                    continue
+            else:
+                elem.clear()
+            # Drop finished siblings; kept address entries stay referenced
+            # from the lists above
+            if ancestors:
+                del ancestors[-1][:-1]
+        
+        # Helpers only: no tree is loaded for this instance
+        parser = cls.__new__(cls)
+        return parser._collect_address_objects(dg_entries + shared_entries + all_entries)
+    
+    _ADDRESS_GROUPS_PATHS = _compile_paths(
+        ".//device-group/entry/address-group/entry",
+        ".//shared/address-group/entry",
+        ".//address-group/entry",
+    )
+    
     def parse_address_groups(self) -> List[Dict]:
         """Parse address groups"""
         # Use dictionary to track groups by name, allowing overrides
@@ -382,107 +770,101 @@ class PanoramaParser:
         
         # Parse in order: device groups first, then shared
         # This allows device-group definitions to override shared references
-        paths = [
-            ".//device-group/entry/address-group/entry",
-            ".//shared/address-group/entry",
-            ".//address-group/entry"
-        ]
-        
-        for path in paths:
-            for grp in self.root.findall(path):
-                name = grp.get('name')
-                if not name:
-                    continue
-                
-                # Check if this is just a reference (only has <id> tag, no actual content)
-                # References are used in Panorama to inherit shared objects
-                has_id_only = (grp.find('id') is not None and 
-                              grp.find('.//static') is None and 
-                              grp.find('.//dynamic') is None and
-                              grp.find('description') is None)
-                
-                if has_id_only:
-                    # Skip reference-only entries (they're just pointers to shared objects)
-                    continue
-                
-                # Parse members
-                members = []
-                static_members = grp.findall('.//static/member')
-                for member in static_members:
-                    if member.text:
-                        members.append(member.text)
-                
-                dynamic_filter = grp.find('.//dynamic/filter')
-                
-                group_obj = {
-                    'name': name,
-                    'static_members': members,
-                    'dynamic_filter': dynamic_filter.text if dynamic_filter is not None else None,
-                    'description': self._get_text(grp, 'description')
-                }
-                
-                # Only add/override if this entry has content (members or dynamic filter)
-                # OR if we haven't seen this name yet
-                if (members or dynamic_filter is not None or name not in groups_dict):
-                    groups_dict[name] = group_obj
+        for grp in self._select_all(self._ADDRESS_GROUPS_PATHS):
+            name = grp.get('name')
+            if not name:
+                continue
+            
+            # Parse members
+            members = _members(grp, 'static')
+            
+            dynamic_filter = grp.find('.//dynamic/filter')
+            
+            # Without members or a filter this entry can't override one already seen
+            has_content = members or dynamic_filter is not None
+            if not has_content and name in groups_dict:
+                continue
+            
+            # Check if this is just a reference (only has <id> tag, no actual content)
+            # References are used in Panorama to inherit shared objects
+            if self._is_reference(grp, ('static', 'dynamic', 'description')):
+                # Skip reference-only entries (they're just pointers to shared objects)
+                continue
+            
+            group_obj = {
+                'name': name,
+                'static_members': members,
+                'dynamic_filter': dynamic_filter.text if dynamic_filter is not None else None,
+                'description': _text(grp, 'description')
+            }
+            
+            # Entries with content override earlier ones; anything else
+            # reaching here is the first entry for this name
+            groups_dict[name] = group_obj
         
         return list(groups_dict.values())
     
-    def parse_service_objects(self) -> List[Dict]:
+    _SERVICE_OBJECTS_PATHS = _compile_paths(
+        ".//device-group/entry/service/entry",
+        ".//shared/service/entry",
+        ".//service/entry",
+    )
+    
+    def parse_service_objects(self) -> List[ServiceObj]:
         """Parse service objects"""
         # Use dictionary to track objects by name, allowing overrides
         services_dict = {}
         
         # Parse in order: device groups first, then shared
-        paths = [
-            ".//device-group/entry/service/entry",
-            ".//shared/service/entry",
-            ".//service/entry"
-        ]
-        
-        for path in paths:
-            for svc in self.root.findall(path):
-                name = svc.get('name')
-                if not name:
-                    continue
-                
-                # Check if this is just a reference (only has <id> tag, no actual content)
-                has_id_only = (svc.find('id') is not None and 
-                              svc.find('protocol') is None and
-                              svc.find('description') is None)
-                
-                if has_id_only:
-                    # Skip reference-only entries
-                    continue
-                
-                service_obj = {'name': name}
-                
-                # Protocol and port
-                protocol = svc.find('protocol')
-                if protocol is not None:
-                    tcp = protocol.find('tcp')
-                    udp = protocol.find('udp')
-                    
-                    if tcp is not None:
-                        service_obj['protocol'] = 'tcp'
-                        port = tcp.find('port')
-                        if port is not None:
-                            service_obj['port'] = port.text
-                    elif udp is not None:
-                        service_obj['protocol'] = 'udp'
-                        port = udp.find('port')
-                        if port is not None:
-                            service_obj['port'] = port.text
-                
-                service_obj['description'] = self._get_text(svc, 'description')
-                
-                # Only add/override if this entry has content (protocol defined)
-                # OR if we haven't seen this name yet
-                if ('protocol' in service_obj or name not in services_dict):
-                    services_dict[name] = service_obj
+        for svc in self._select_all(self._SERVICE_OBJECTS_PATHS):
+            name = svc.get('name')
+            if not name:
+                continue
+            
+            protocol = svc.find('protocol')
+            tcp = udp = None
+            if protocol is not None:
+                tcp = protocol.find('tcp')
+                udp = protocol.find('udp')
+            
+            # Without tcp/udp this entry can't override one already seen
+            if tcp is None and udp is None and name in services_dict:
+                continue
+            
+            # Check if this is just a reference (only has <id> tag, no actual content)
+            if protocol is None and self._is_reference(svc, ('description',)):
+                # Skip reference-only entries
+                continue
+            
+            service_obj = ServiceObj(name=name)
+            
+            # Protocol and port
+            if protocol is not None:
+                if tcp is not None:
+                    service_obj.protocol = 'tcp'
+                    port = tcp.find('port')
+                    if port is not None:
+                        service_obj.port = port.text
+                elif udp is not None:
+                    service_obj.protocol = 'udp'
+                    port = udp.find('port')
+                    if port is not None:
+                        service_obj.port = port.text
+            
+            service_obj.description = _text(svc, 'description')
+            
+            # Entries with a protocol override earlier ones; anything else
+            # reaching here is the first entry for this name
+            services_dict[name] = service_obj
         
         return list(services_dict.values())
     
+    _SERVICE_GROUPS_PATHS = _compile_paths(
+        ".//device-group/entry/service-group/entry",
+        ".//shared/service-group/entry",
+        ".//service-group/entry",
+    )
+    
     def parse_service_groups(self) -> List[Dict]:
         """Parse service groups"""
         groups = []
@@ -490,1164 +872,827 @@ class PanoramaParser:
         groups_dict = {}
         
         # Parse in order: device groups first, then shared
-        paths = [
-            ".//device-group/entry/service-group/entry",
-            ".//shared/service-group/entry",
-            ".//service-group/entry"
-        ]
-        
-        for path in paths:
-            for grp in self.root.findall(path):
-                name = grp.get('name')
-                if not name:
-                    continue
-                
-                # Check if this is just a reference (only has <id> tag, no actual content)
-                has_id_only = (grp.find('id') is not None and 
-                              grp.find('.//members') is None and
-                              grp.find('description') is None)
-                
-                if has_id_only:
-                    # Skip reference-only entries
-                    continue
-                
-                members = []
-                for member in grp.findall('.//members/member'):
-                    if member.text:
-                        members.append(member.text)
-                
-                group_obj = {
-                    'name': name,
-                    'members': members,
-                    'description': self._get_text(grp, 'description')
-                }
-                
-                # Only add/override if this entry has content (members defined)
-                # OR if we haven't seen this name yet
-                if (members or name not in groups_dict):
-                    groups_dict[name] = group_obj
+        for grp in self._select_all(self._SERVICE_GROUPS_PATHS):
+            name = grp.get('name')
+            if not name:
+                continue
+            
+            members = _members(grp, 'members')
+            
+            # Without members this entry can't override one already seen
+            if not members and name in groups_dict:
+                continue
+            
+            # Check if this is just a reference (only has <id> tag, no actual content)
+            if self._is_reference(grp, ('members', 'description')):
+                # Skip reference-only entries
+                continue
+            
+            group_obj = {
+                'name': name,
+                'members': members,
+                'description': _text(grp, 'description')
+            }
+            
+            # Entries with members override earlier ones; anything else
+            # reaching here is the first entry for this name
+            groups_dict[name] = group_obj
         
         return list(groups_dict.values())
     
-    def parse_security_rules(self) -> List[Dict]:
+    _SECURITY_RULES_PATHS = _compile_paths(
+        ".//security/rules/entry",
+    )
+    
+    def parse_security_rules(self) -> List[SecurityRule]:
         """Parse security policy rules"""
         rules = []
         seen_names = set()
-        
-        paths = [
-            ".//security/rules/entry",
-            ".//device-group/entry/pre-rulebase/security/rules/entry",
-            ".//device-group/entry/post-rulebase/security/rules/entry"
-        ]
-        
-        for path in paths:
-            for rule in self.root.findall(path):
-                name = rule.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                rule_obj = {
-                    'name': name,
-                    'source_zones': self._get_members(rule, 'from'),
-                    'source_addresses': self._get_members(rule, 'source'),
-                    'destination_zones': self._get_members(rule, 'to'),
-                    'destination_addresses': self._get_members(rule, 'destination'),
-                    'applications': self._get_members(rule, 'application'),
-                    'services': self._get_members(rule, 'service'),
-                    'action': self._get_text(rule, 'action'),
-                    'description': self._get_text(rule, 'description')
-                }
-                
-                # Log settings
-                log_start = rule.find('log-start')
-                log_end = rule.find('log-end')
-                rule_obj['log_start'] = log_start.text == 'yes' if log_start is not None else False
-                rule_obj['log_end'] = log_end.text == 'yes' if log_end is not None else False
-                
-                # Disabled status
-                disabled = rule.find('disabled')
-                rule_obj['disabled'] = disabled.text == 'yes' if disabled is not None else False
-                
-                rules.append(rule_obj)
+        # Bound once; these run several times per rule
+        get_members = _members
+        get_text = _text
+        add_rule = rules.append
+        
+        for rule in self._select_all(self._SECURITY_RULES_PATHS):
+            name = rule.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            rule_obj = SecurityRule(
+                name=name,
+                source_zones=get_members(rule, 'from'),
+                source_addresses=get_members(rule, 'source'),
+                destination_zones=get_members(rule, 'to'),
+                destination_addresses=get_members(rule, 'destination'),
+                applications=get_members(rule, 'application'),
+                services=get_members(rule, 'service'),
+                action=get_text(rule, 'action'),
+                description=get_text(rule, 'description')
+            )
+            
+            # Log settings
+            log_start = rule.find('log-start')
+            log_end = rule.find('log-end')
+            rule_obj.log_start = log_start.text == 'yes' if log_start is not None else False
+            rule_obj.log_end = log_end.text == 'yes' if log_end is not None else False
+            
+            # Disabled status
+            disabled = rule.find('disabled')
+            rule_obj.disabled = disabled.text == 'yes' if disabled is not None else False
+            
+            add_rule(rule_obj)
         
         return rules
     
-    def parse_nat_rules(self) -> List[Dict]:
+    _NAT_RULES_PATHS = _compile_paths(
+        ".//nat/rules/entry",
+    )
+    
+    def parse_nat_rules(self) -> List[NatRule]:
         """Parse NAT policy rules"""
         rules = []
         seen_names = set()
-        
-        paths = [
-            ".//nat/rules/entry",
-            ".//device-group/entry/pre-rulebase/nat/rules/entry",
-            ".//device-group/entry/post-rulebase/nat/rules/entry"
-        ]
-        
-        for path in paths:
-            for rule in self.root.findall(path):
-                name = rule.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                rule_obj = {
-                    'name': name,
-                    'source_zones': self._get_members(rule, 'from'),
-                    'destination_zone': self._get_text(rule, 'to-interface'),
-                    'source_addresses': self._get_members(rule, 'source'),
-                    'destination_addresses': self._get_members(rule, 'destination'),
-                    'service': self._get_text(rule, 'service'),
-                    'description': self._get_text(rule, 'description')
-                }
-                
-                # Source translation
-                source_translation = rule.find('.//source-translation')
-                if source_translation is not None:
-                    dynamic_ip_and_port = source_translation.find('dynamic-ip-and-port')
-                    if dynamic_ip_and_port is not None:
-                        translated_address = dynamic_ip_and_port.find('.//translated-address')
-                        if translated_address is not None:
-                            members = []
-                            for member in translated_address.findall('member'):
-                                if member.text:
-                                    members.append(member.text)
-                            rule_obj['source_translation_type'] = 'dynamic-ip-and-port'
-                            rule_obj['source_translation_address'] = members
-                
-                # Destination translation
-                destination_translation = rule.find('.//destination-translation')
-                if destination_translation is not None:
-                    translated_address = destination_translation.find('translated-address')
-                    translated_port = destination_translation.find('translated-port')
-                    
+        # Bound once; these run several times per rule
+        get_members = _members
+        get_text = _text
+        add_rule = rules.append
+        
+        for rule in self._select_all(self._NAT_RULES_PATHS):
+            name = rule.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            rule_obj = NatRule(
+                name=name,
+                source_zones=get_members(rule, 'from'),
+                destination_zone=get_text(rule, 'to-interface'),
+                source_addresses=get_members(rule, 'source'),
+                destination_addresses=get_members(rule, 'destination'),
+                service=get_text(rule, 'service'),
+                description=get_text(rule, 'description')
+            )
+            
+            # Source translation
+            source_translation = rule.find('.//source-translation')
+            if source_translation is not None:
+                dynamic_ip_and_port = source_translation.find('dynamic-ip-and-port')
+                if dynamic_ip_and_port is not None:
+                    translated_address = dynamic_ip_and_port.find('.//translated-address')
                     if translated_address is not None:
-                        rule_obj['destination_translation_address'] = translated_address.text
-                    if translated_port is not None:
-                        rule_obj['destination_translation_port'] = translated_port.text
-                
-                # Disabled status
-                disabled = rule.find('disabled')
-                rule_obj['disabled'] = disabled.text == 'yes' if disabled is not None else False
+                        members = []
+                        for member in translated_address.iterfind('member'):
+                            if member.text:
+                                members.append(member.text)
+                        rule_obj.source_translation_type = 'dynamic-ip-and-port'
+                        rule_obj.source_translation_address = members
+            
+            # Destination translation
+            destination_translation = rule.find('.//destination-translation')
+            if destination_translation is not None:
+                translated_address = destination_translation.find('translated-address')
+                translated_port = destination_translation.find('translated-port')
                 
-                rules.append(rule_obj)
+                if translated_address is not None:
+                    rule_obj.destination_translation_address = translated_address.text
+                if translated_port is not None:
+                    rule_obj.destination_translation_port = translated_port.text
+            
+            # Disabled status
+            disabled = rule.find('disabled')
+            rule_obj.disabled = disabled.text == 'yes' if disabled is not None else False
+            
+            add_rule(rule_obj)
         
         return rules
     
+    _SCHEDULES_PATHS = _compile_paths(
+        ".//schedule/entry",
+    )
+    
     def parse_schedules(self) -> List[Dict]:
         """Parse schedules"""
         schedules = []
         seen_names = set()
         
-        paths = [
-            ".//schedule/entry",
-            ".//device-group/entry/schedule/entry"
-        ]
-        
-        for path in paths:
-            for sched in self.root.findall(path):
-                name = sched.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                sched_obj = {
-                    'name': name,
-                    'schedule_type': None,
-                    'recurring': []
-                }
-                
-                # Check for recurring schedule
-                recurring = sched.find('schedule-type/recurring')
-                if recurring is not None:
-                    sched_obj['schedule_type'] = 'recurring'
-                    for entry in recurring.findall('entry'):
-                        rec_name = entry.get('name')
-                        rec_obj = {
-                            'name': rec_name
-                        }
-                        sched_obj['recurring'].append(rec_obj)
-                
-                # Check for non-recurring schedule
-                non_recurring = sched.find('schedule-type/non-recurring')
-                if non_recurring is not None:
-                    sched_obj['schedule_type'] = 'non-recurring'
-                
-                schedules.append(sched_obj)
+        for sched in self._select_all(self._SCHEDULES_PATHS):
+            name = sched.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            sched_obj = {
+                'name': name,
+                'schedule_type': None,
+                'recurring': []
+            }
+            
+            # Check for recurring schedule
+            recurring = sched.find('schedule-type/recurring')
+            if recurring is not None:
+                sched_obj['schedule_type'] = 'recurring'
+                for entry in recurring.iterfind('entry'):
+                    rec_name = entry.get('name')
+                    rec_obj = {
+                        'name': rec_name
+                    }
+                    sched_obj['recurring'].append(rec_obj)
+            
+            # Check for non-recurring schedule
+            non_recurring = sched.find('schedule-type/non-recurring')
+            if non_recurring is not None:
+                sched_obj['schedule_type'] = 'non-recurring'
+            
+            schedules.append(sched_obj)
         
         return schedules
     
+    _DECRYPTION_RULES_PATHS = _compile_paths(
+        ".//decryption/rules/entry",
+    )
+    
     def parse_decryption_rules(self) -> List[Dict]:
         """Parse decryption policy rules"""
         rules = []
         seen_names = set()
-        
-        paths = [
-            ".//decryption/rules/entry",
-            ".//device-group/entry/pre-rulebase/decryption/rules/entry",
-            ".//device-group/entry/post-rulebase/decryption/rules/entry"
-        ]
-        
-        for path in paths:
-            for rule in self.root.findall(path):
-                name = rule.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                rule_obj = {
-                    'name': name,
-                    'uuid': rule.get('uuid'),
-                    'source_zones': self._get_members(rule, 'from'),
-                    'destination_zones': self._get_members(rule, 'to'),
-                    'source_addresses': self._get_members(rule, 'source'),
-                    'destination_addresses': self._get_members(rule, 'destination'),
-                    'source_users': self._get_members(rule, 'source-user'),
-                    'categories': self._get_members(rule, 'category'),
-                    'services': self._get_members(rule, 'service'),
-                    'action': self._get_text(rule, 'action'),
-                    'type': None,
-                    'profile': self._get_text(rule, 'profile'),
-                    'description': self._get_text(rule, 'description'),
-                    'disabled': self._get_text(rule, 'disabled') == 'yes',
-                    'log_setting': self._get_text(rule, 'log-setting')
-                }
-                
-                # Determine type
-                type_elem = rule.find('type')
-                if type_elem is not None:
-                    if type_elem.find('ssl-forward-proxy') is not None:
-                        rule_obj['type'] = 'ssl-forward-proxy'
-                    elif type_elem.find('ssl-inbound-inspection') is not None:
-                        rule_obj['type'] = 'ssl-inbound-inspection'
-                    elif type_elem.find('ssh-proxy') is not None:
-                        rule_obj['type'] = 'ssh-proxy'
-                
-                rules.append(rule_obj)
+        # Bound once; these run several times per rule
+        get_members = _members
+        get_text = _text
+        add_rule = rules.append
+        
+        for rule in self._select_all(self._DECRYPTION_RULES_PATHS):
+            name = rule.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            rule_obj = {
+                'name': name,
+                'uuid': rule.get('uuid'),
+                'source_zones': get_members(rule, 'from'),
+                'destination_zones': get_members(rule, 'to'),
+                'source_addresses': get_members(rule, 'source'),
+                'destination_addresses': get_members(rule, 'destination'),
+                'source_users': get_members(rule, 'source-user'),
+                'categories': get_members(rule, 'category'),
+                'services': get_members(rule, 'service'),
+                'action': get_text(rule, 'action'),
+                'type': None,
+                'profile': get_text(rule, 'profile'),
+                'description': get_text(rule, 'description'),
+                'disabled': get_text(rule, 'disabled') == 'yes',
+                'log_setting': get_text(rule, 'log-setting')
+            }
+            
+            # Determine type
+            type_elem = rule.find('type')
+            if type_elem is not None:
+                if type_elem.find('ssl-forward-proxy') is not None:
+                    rule_obj['type'] = 'ssl-forward-proxy'
+                elif type_elem.find('ssl-inbound-inspection') is not None:
+                    rule_obj['type'] = 'ssl-inbound-inspection'
+                elif type_elem.find('ssh-proxy') is not None:
+                    rule_obj['type'] = 'ssh-proxy'
+            
+            add_rule(rule_obj)
         
         return rules
     
-    def parse_pbf_rules(self) -> List[Dict]:
+    _PBF_RULES_PATHS = _compile_paths(
+        ".//pbf/rules/entry",
+    )
+    
+    def parse_pbf_rules(self) -> List[PBFRule]:
         """Parse Policy-Based Forwarding rules"""
         rules = []
         seen_names = set()
+        get_members = _members
+        get_text = _text
+        add_rule = rules.append
         
-        paths = [
-            ".//pbf/rules/entry",
-            ".//device-group/entry/pre-rulebase/pbf/rules/entry",
-            ".//device-group/entry/post-rulebase/pbf/rules/entry"
-        ]
-        
-        for path in paths:
-            for rule in self.root.findall(path):
-                name = rule.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                rule_obj = {
-                    'name': name,
-                    'uuid': rule.get('uuid'),
-                    'description': self._get_text(rule, 'description'),
-                    'disabled': self._get_text(rule, 'disabled') == 'yes',
-                    'source_zones': [],
-                    'source_addresses': self._get_members(rule, 'source'),
-                    'source_users': self._get_members(rule, 'source-user'),
-                    'destination_addresses': self._get_members(rule, 'destination'),
-                    'applications': self._get_members(rule, 'application'),
-                    'services': self._get_members(rule, 'service'),
-                    'action': None
-                }
-                
-                # Get source zones
-                from_elem = rule.find('from')
-                if from_elem is not None:
-                    for zone in from_elem.findall('.//zone/member'):
-                        if zone.text:
-                            rule_obj['source_zones'].append(zone.text)
-                
-                # Get action
-                action_elem = rule.find('action')
-                if action_elem is not None:
-                    forward = action_elem.find('forward')
-                    if forward is not None:
-                        nexthop_ip = self._get_text(forward, 'nexthop/ip-address')
-                        egress_iface = self._get_text(forward, 'egress-interface')
-                        rule_obj['action'] = {
+        for rule in self._select_all(self._PBF_RULES_PATHS):
+            name = rule.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            rule_obj = PBFRule(
+                name=name,
+                uuid=rule.get('uuid'),
+                description=get_text(rule, 'description'),
+                disabled=get_text(rule, 'disabled') == 'yes',
+                source_zones=[],
+                source_addresses=get_members(rule, 'source'),
+                source_users=get_members(rule, 'source-user'),
+                destination_addresses=get_members(rule, 'destination'),
+                applications=get_members(rule, 'application'),
+                services=get_members(rule, 'service')
+            )
+            
+            # Get source zones
+            from_elem = rule.find('from')
+            if from_elem is not None:
+                rule_obj.source_zones.extend(get_members(from_elem, 'zone'))
+            
+            # Get action; <action> holds one of forward, discard or no-pbf
+            action_elem = rule.find('action')
+            if action_elem is not None:
+                for child in action_elem:
+                    if child.tag == 'forward':
+                        rule_obj.action = {
                             'type': 'forward',
-                            'nexthop_ip': nexthop_ip,
-                            'egress_interface': egress_iface
-                        }
-                    
-                    discard = action_elem.find('discard')
-                    if discard is not None:
-                        rule_obj['action'] = {
-                            'type': 'discard'
+                            'nexthop_ip': get_text(child, 'nexthop/ip-address'),
+                            'egress_interface': get_text(child, 'egress-interface')
                         }
-                    
-                    no_pbf = action_elem.find('no-pbf')
-                    if no_pbf is not None:
-                        rule_obj['action'] = {
-                            'type': 'no-pbf'
+                        break
+                    if child.tag in ('discard', 'no-pbf'):
+                        rule_obj.action = {
+                            'type': child.tag
                         }
-                
-                # Enforce symmetric return
-                enforce_sym = rule.find('.//enforce-symmetric-return/enabled')
-                if enforce_sym is not None:
-                    rule_obj['enforce_symmetric_return'] = enforce_sym.text == 'yes'
-                
-                rules.append(rule_obj)
+                        break
+            
+            # Enforce symmetric return
+            enforce_sym = rule.find('.//enforce-symmetric-return/enabled')
+            if enforce_sym is not None:
+                rule_obj.enforce_symmetric_return = enforce_sym.text == 'yes'
+            
+            add_rule(rule_obj)
         
         return rules
     
+    _APPLICATION_OVERRIDE_RULES_PATHS = _compile_paths(
+        ".//application-override/rules/entry",
+    )
+    
     def parse_application_override_rules(self) -> List[Dict]:
         """Parse Application Override rules"""
         rules = []
         seen_names = set()
         
-        paths = [
-            ".//application-override/rules/entry",
-            ".//device-group/entry/pre-rulebase/application-override/rules/entry",
-            ".//device-group/entry/post-rulebase/application-override/rules/entry"
-        ]
-        
-        for path in paths:
-            for rule in self.root.findall(path):
-                name = rule.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                rule_obj = {
-                    'name': name,
-                    'description': self._get_text(rule, 'description'),
-                    'disabled': self._get_text(rule, 'disabled') == 'yes',
-                    'source_zones': self._get_members(rule, 'from'),
-                    'destination_zones': self._get_members(rule, 'to'),
-                    'source_addresses': self._get_members(rule, 'source'),
-                    'destination_addresses': self._get_members(rule, 'destination'),
-                    'port': self._get_text(rule, 'port'),
-                    'protocol': self._get_text(rule, 'protocol'),
-                    'application': self._get_text(rule, 'application')
-                }
-                
-                rules.append(rule_obj)
+        for rule in self._select_all(self._APPLICATION_OVERRIDE_RULES_PATHS):
+            name = rule.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            rule_obj = {
+                'name': name,
+                'description': _text(rule, 'description'),
+                'disabled': _text(rule, 'disabled') == 'yes',
+                'source_zones': _members(rule, 'from'),
+                'destination_zones': _members(rule, 'to'),
+                'source_addresses': _members(rule, 'source'),
+                'destination_addresses': _members(rule, 'destination'),
+                'port': _text(rule, 'port'),
+                'protocol': _text(rule, 'protocol'),
+                'application': _text(rule, 'application')
+            }
+            
+            rules.append(rule_obj)
         
         return rules
     
-    def parse_zones(self) -> List[Dict]:
+    _ZONES_PATHS = _compile_paths(
+        ".//zone/entry",
+    )
+    
+    _ZONE_TYPES = ('layer2', 'tap', 'virtual-wire', 'tunnel')
+    
+    def parse_zones(self) -> List[Zone]:
         """Parse zone configurations"""
         zones = []
         seen_names = set()
         
-        paths = [
-            ".//zone/entry",
-            ".//vsys/entry/zone/entry",
-            ".//devices/entry/vsys/entry/zone/entry"
-        ]
-        
-        for path in paths:
-            for zone in self.root.findall(path):
-                name = zone.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                # Determine zone type
-                zone_type = 'layer3'
-                if zone.find('network/layer2') is not None:
-                    zone_type = 'layer2'
-                elif zone.find('network/tap') is not None:
-                    zone_type = 'tap'
-                elif zone.find('network/virtual-wire') is not None:
-                    zone_type = 'virtual-wire'
-                elif zone.find('network/tunnel') is not None:
-                    zone_type = 'tunnel'
-                
-                # Get interfaces
-                interfaces = []
-                for iface in zone.findall('.//network/*/member'):
-                    if iface.text:
-                        interfaces.append(iface.text)
-                
-                # Get zone protection profile
-                zone_profile = zone.find('.//zone-protection-profile')
-                
-                zone_obj = {
-                    'name': name,
-                    'type': zone_type,
-                    'interfaces': interfaces,
-                    'zone_protection_profile': zone_profile.text if zone_profile is not None else None
-                }
-                
-                zones.append(zone_obj)
+        for zone in self._select_all(self._ZONES_PATHS):
+            name = zone.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            # Share the string with the interned rule from/to members
+            name = sys.intern(name)
+            seen_names.add(name)
+            
+            # Determine zone type from the children of <network>, checked in
+            # order of precedence; layer3 when none is present
+            network = zone.find('network')
+            network_tags = {child.tag for child in network} if network is not None else ()
+            zone_type = next((t for t in self._ZONE_TYPES if t in network_tags), 'layer3')
+            
+            # Get interfaces
+            interfaces = _members(zone, 'network/*')
+            
+            # Get zone protection profile
+            zone_profile = zone.find('.//zone-protection-profile')
+            
+            zone_obj = Zone(
+                name=name,
+                type=zone_type,
+                interfaces=interfaces,
+                zone_protection_profile=zone_profile.text if zone_profile is not None else None
+            )
+            
+            zones.append(zone_obj)
         
         return zones
     
-    def parse_interfaces(self) -> List[Dict]:
+    # Per-interface sub-lookups, compiled once
+    _IP_ENTRY_PATH = _compile_path(".//ip/entry")
+    _IPV6_ENTRY_PATH = _compile_path(".//ipv6/address/entry")
+    _UNIT_ENTRY_PATH = _compile_path(".//units/entry")
+    
+    _ETH_PATHS = _compile_paths(
+        ".//network/interface/ethernet/entry",
+    )
+    _VLAN_PATHS = _compile_paths(
+        ".//network/interface/vlan/units/entry",
+    )
+    _LOOPBACK_PATHS = _compile_paths(
+        ".//network/interface/loopback/units/entry",
+    )
+    _TUNNEL_PATHS = _compile_paths(
+        ".//network/interface/tunnel/units/entry",
+    )
+    _AGGREGATE_PATHS = _compile_paths(
+        ".//network/interface/aggregate-ethernet/entry",
+    )
+    
+    _ETH_L2_MODES = ('layer2', 'virtual-wire', 'tap', 'ha', 'aggregate-group')
+    
+    def _new_interface(self, name: str, iface_type: str, mode: Optional[str],
+                       iface: ET.Element) -> Interface:
+        """Start an interface record with empty address lists"""
+        return Interface(
+            name=name,
+            type=iface_type,
+            mode=mode,
+            ip_addresses=[],
+            ipv6_addresses=[],
+            comment=_text(iface, 'comment')
+        )
+    
+    def parse_interfaces(self) -> List[Interface]:
         """Parse interface configurations"""
         interfaces = []
         seen_names = set()
         
         # Ethernet interfaces
-        eth_paths = [
-            ".//network/interface/ethernet/entry",
-            ".//devices/entry/network/interface/ethernet/entry"
-        ]
-        
-        for path in eth_paths:
-            for iface in self.root.findall(path):
-                name = iface.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                iface_obj = {
-                    'name': name,
-                    'type': 'ethernet',
-                    'mode': None,
-                    'ip_addresses': [],
-                    'ipv6_addresses': [],
-                    'zone': None,
-                    'virtual_router': None,
-                    'management_profile': None,
-                    'comment': self._get_text(iface, 'comment')
-                }
-                
-                # Determine mode (layer3, layer2, virtual-wire, tap, ha, aggregate-group)
-                if iface.find('layer3') is not None:
-                    iface_obj['mode'] = 'layer3'
-                    l3 = iface.find('layer3')
-                    
-                    # Get IP addresses
-                    for ip in l3.findall('.//ip/entry'):
-                        ip_name = ip.get('name')
-                        if ip_name:
-                            iface_obj['ip_addresses'].append(ip_name)
-                    
-                    # Get IPv6 addresses
-                    for ip in l3.findall('.//ipv6/address/entry'):
-                        ip_name = ip.get('name')
-                        if ip_name:
-                            iface_obj['ipv6_addresses'].append(ip_name)
-                    
-                    # Management profile
-                    mgmt_profile = l3.find('interface-management-profile')
-                    if mgmt_profile is not None:
-                        iface_obj['management_profile'] = mgmt_profile.text
-                    
-                elif iface.find('layer2') is not None:
-                    iface_obj['mode'] = 'layer2'
-                elif iface.find('virtual-wire') is not None:
-                    iface_obj['mode'] = 'virtual-wire'
-                elif iface.find('tap') is not None:
-                    iface_obj['mode'] = 'tap'
-                elif iface.find('ha') is not None:
-                    iface_obj['mode'] = 'ha'
-                elif iface.find('aggregate-group') is not None:
-                    iface_obj['mode'] = 'aggregate-group'
-                
-                interfaces.append(iface_obj)
-        
-        # VLAN interfaces
-        vlan_paths = [
-            ".//network/interface/vlan/units/entry",
-            ".//devices/entry/network/interface/vlan/units/entry"
-        ]
-        
-        for path in vlan_paths:
-            for iface in self.root.findall(path):
-                name = iface.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                iface_obj = {
-                    'name': f'vlan.{name}',
-                    'type': 'vlan',
-                    'mode': 'layer3',
-                    'ip_addresses': [],
-                    'ipv6_addresses': [],
-                    'zone': None,
-                    'virtual_router': None,
-                    'management_profile': None,
-                    'comment': self._get_text(iface, 'comment'),
-                    'tag': self._get_text(iface, 'tag')
-                }
+        for iface in self._select_all(self._ETH_PATHS):
+            name = iface.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            name = sys.intern(name)
+            seen_names.add(name)
+            
+            iface_obj = self._new_interface(name, 'ethernet', None, iface)
+            
+            # Determine mode (layer3, layer2, virtual-wire, tap, ha, aggregate-group)
+            # from one pass over the children, in that order of precedence
+            children = {child.tag: child for child in iface}
+            l3 = children.get('layer3')
+            if l3 is not None:
+                iface_obj.mode = 'layer3'
                 
                 # Get IP addresses
-                for ip in iface.findall('.//ip/entry'):
-                    ip_name = ip.get('name')
-                    if ip_name:
-                        iface_obj['ip_addresses'].append(ip_name)
+                iface_obj.ip_addresses = self._get_entry_names(l3, self._IP_ENTRY_PATH)
                 
                 # Get IPv6 addresses
-                for ip in iface.findall('.//ipv6/address/entry'):
-                    ip_name = ip.get('name')
-                    if ip_name:
-                        iface_obj['ipv6_addresses'].append(ip_name)
+                iface_obj.ipv6_addresses = self._get_entry_names(l3, self._IPV6_ENTRY_PATH)
                 
                 # Management profile
-                mgmt_profile = iface.find('interface-management-profile')
+                mgmt_profile = l3.find('interface-management-profile')
                 if mgmt_profile is not None:
-                    iface_obj['management_profile'] = mgmt_profile.text
+                    iface_obj.management_profile = mgmt_profile.text
                 
-                interfaces.append(iface_obj)
+            else:
+                iface_obj.mode = next((mode for mode in self._ETH_L2_MODES if mode in children), None)
+            
+            interfaces.append(iface_obj)
         
-        # Loopback interfaces
-        loopback_paths = [
-            ".//network/interface/loopback/units/entry",
-            ".//devices/entry/network/interface/loopback/units/entry"
-        ]
+        # VLAN interfaces
+        for iface in self._select_all(self._VLAN_PATHS):
+            name = iface.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            iface_obj = self._new_interface(f'vlan.{name}', 'vlan', 'layer3', iface)
+            iface_obj.tag = _text(iface, 'tag')
+            
+            # Get IP addresses
+            iface_obj.ip_addresses = self._get_entry_names(iface, self._IP_ENTRY_PATH)
+            
+            # Get IPv6 addresses
+            iface_obj.ipv6_addresses = self._get_entry_names(iface, self._IPV6_ENTRY_PATH)
+            
+            # Management profile
+            mgmt_profile = iface.find('interface-management-profile')
+            if mgmt_profile is not None:
+                iface_obj.management_profile = mgmt_profile.text
+            
+            interfaces.append(iface_obj)
         
-        for path in loopback_paths:
-            for iface in self.root.findall(path):
-                name = iface.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                iface_obj = {
-                    'name': f'loopback.{name}',
-                    'type': 'loopback',
-                    'mode': 'layer3',
-                    'ip_addresses': [],
-                    'ipv6_addresses': [],
-                    'zone': None,
-                    'virtual_router': None,
-                    'management_profile': None,
-                    'comment': self._get_text(iface, 'comment')
-                }
-                
-                # Get IP addresses
-                for ip in iface.findall('.//ip/entry'):
-                    ip_name = ip.get('name')
-                    if ip_name:
-                        iface_obj['ip_addresses'].append(ip_name)
-                
-                # Get IPv6 addresses
-                for ip in iface.findall('.//ipv6/address/entry'):
-                    ip_name = ip.get('name')
-                    if ip_name:
-                        iface_obj['ipv6_addresses'].append(ip_name)
-                
-                interfaces.append(iface_obj)
+        # Loopback interfaces
+        for iface in self._select_all(self._LOOPBACK_PATHS):
+            name = iface.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            iface_obj = self._new_interface(f'loopback.{name}', 'loopback', 'layer3', iface)
+            
+            # Get IP addresses
+            iface_obj.ip_addresses = self._get_entry_names(iface, self._IP_ENTRY_PATH)
+            
+            # Get IPv6 addresses
+            iface_obj.ipv6_addresses = self._get_entry_names(iface, self._IPV6_ENTRY_PATH)
+            
+            interfaces.append(iface_obj)
         
         # Tunnel interfaces
-        tunnel_paths = [
-            ".//network/interface/tunnel/units/entry",
-            ".//devices/entry/network/interface/tunnel/units/entry"
-        ]
+        for iface in self._select_all(self._TUNNEL_PATHS):
+            name = iface.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            iface_obj = self._new_interface(f'tunnel.{name}', 'tunnel', 'layer3', iface)
+            
+            # Get IP addresses
+            iface_obj.ip_addresses = self._get_entry_names(iface, self._IP_ENTRY_PATH)
+            
+            # Get IPv6 addresses
+            iface_obj.ipv6_addresses = self._get_entry_names(iface, self._IPV6_ENTRY_PATH)
+            
+            # Management profile
+            mgmt_profile = iface.find('interface-management-profile')
+            if mgmt_profile is not None:
+                iface_obj.management_profile = mgmt_profile.text
+            
+            interfaces.append(iface_obj)
         
-        for path in tunnel_paths:
-            for iface in self.root.findall(path):
-                name = iface.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                iface_obj = {
-                    'name': f'tunnel.{name}',
-                    'type': 'tunnel',
-                    'mode': 'layer3',
-                    'ip_addresses': [],
-                    'ipv6_addresses': [],
-                    'zone': None,
-                    'virtual_router': None,
-                    'management_profile': None,
-                    'comment': self._get_text(iface, 'comment')
-                }
-                
-                # Get IP addresses
-                for ip in iface.findall('.//ip/entry'):
-                    ip_name = ip.get('name')
-                    if ip_name:
-                        iface_obj['ip_addresses'].append(ip_name)
+        # Aggregate interfaces (ae)
+        for iface in self._select_all(self._AGGREGATE_PATHS):
+            name = iface.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            name = sys.intern(name)
+            seen_names.add(name)
+            
+            iface_obj = self._new_interface(name, 'aggregate', None, iface)
+            
+            # Determine mode
+            l3 = iface.find('layer3')
+            if l3 is not None:
+                iface_obj.mode = 'layer3'
                 
-                # Get IPv6 addresses
-                for ip in iface.findall('.//ipv6/address/entry'):
-                    ip_name = ip.get('name')
-                    if ip_name:
-                        iface_obj['ipv6_addresses'].append(ip_name)
+                # Get IP addresses from main interface
+                iface_obj.ip_addresses = self._get_entry_names(l3, self._IP_ENTRY_PATH)
                 
                 # Management profile
-                mgmt_profile = iface.find('interface-management-profile')
+                mgmt_profile = l3.find('interface-management-profile')
                 if mgmt_profile is not None:
-                    iface_obj['management_profile'] = mgmt_profile.text
-                
-                interfaces.append(iface_obj)
-        
-        # Aggregate interfaces (ae)
-        aggregate_paths = [
-            ".//network/interface/aggregate-ethernet/entry",
-            ".//devices/entry/network/interface/aggregate-ethernet/entry"
-        ]
-        
-        for path in aggregate_paths:
-            for iface in self.root.findall(path):
-                name = iface.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                iface_obj = {
-                    'name': name,
-                    'type': 'aggregate',
-                    'mode': None,
-                    'ip_addresses': [],
-                    'ipv6_addresses': [],
-                    'zone': None,
-                    'virtual_router': None,
-                    'management_profile': None,
-                    'comment': self._get_text(iface, 'comment')
-                }
-                
-                # Determine mode
-                if iface.find('layer3') is not None:
-                    iface_obj['mode'] = 'layer3'
-                    l3 = iface.find('layer3')
-                    
-                    # Get IP addresses from main interface
-                    for ip in l3.findall('.//ip/entry'):
-                        ip_name = ip.get('name')
-                        if ip_name:
-                            iface_obj['ip_addresses'].append(ip_name)
-                    
-                    # Management profile
-                    mgmt_profile = l3.find('interface-management-profile')
-                    if mgmt_profile is not None:
-                        iface_obj['management_profile'] = mgmt_profile.text
-                    
-                    # Get subinterfaces (units)
-                    for unit in l3.findall('.//units/entry'):
-                        unit_name = unit.get('name')
-                        if unit_name and unit_name not in seen_names:
-                            seen_names.add(unit_name)
-                            
-                            unit_obj = {
-                                'name': unit_name,
-                                'type': 'aggregate-subinterface',
-                                'mode': 'layer3',
-                                'ip_addresses': [],
-                                'ipv6_addresses': [],
-                                'zone': None,
-                                'virtual_router': None,
-                                'management_profile': None,
-                                'comment': self._get_text(unit, 'comment'),
-                                'tag': self._get_text(unit, 'tag')
-                            }
-                            
-                            # Get IP addresses
-                            for ip in unit.findall('.//ip/entry'):
-                                ip_name = ip.get('name')
-                                if ip_name:
-                                    unit_obj['ip_addresses'].append(ip_name)
-                            
-                            # Management profile
-                            unit_mgmt = unit.find('interface-management-profile')
-                            if unit_mgmt is not None:
-                                unit_obj['management_profile'] = unit_mgmt.text
-                            
-                            interfaces.append(unit_obj)
-                
-                elif iface.find('layer2') is not None:
-                    iface_obj['mode'] = 'layer2'
-                
-                interfaces.append(iface_obj)
+                    iface_obj.management_profile = mgmt_profile.text
+                
+                # Get subinterfaces (units)
+                for unit in self._UNIT_ENTRY_PATH(l3):
+                    unit_name = unit.get('name')
+                    if unit_name and unit_name not in seen_names:
+                        unit_name = sys.intern(unit_name)
+                        seen_names.add(unit_name)
+                        
+                        unit_obj = self._new_interface(unit_name, 'aggregate-subinterface', 'layer3', unit)
+                        unit_obj.tag = _text(unit, 'tag')
+                        
+                        # Get IP addresses
+                        unit_obj.ip_addresses = self._get_entry_names(unit, self._IP_ENTRY_PATH)
+                        
+                        # Management profile
+                        unit_mgmt = unit.find('interface-management-profile')
+                        if unit_mgmt is not None:
+                            unit_obj.management_profile = unit_mgmt.text
+                        
+                        interfaces.append(unit_obj)
+            
+            elif iface.find('layer2') is not None:
+                iface_obj.mode = 'layer2'
+            
+            interfaces.append(iface_obj)
         
         return interfaces
     
-    def parse_virtual_routers(self) -> List[Dict]:
+    _TEMPLATE_PATH = _anchored_path(".//template/entry")
+    _STATIC_ROUTES_PATH = _compile_path(".//routing-table/ip/static-route/entry")
+    _TEMPLATE_VR_PATH = _compile_path(".//network/virtual-router/entry")
+    _DEVICE_VR_PATH = _anchored_path(".//devices/entry/network/virtual-router/entry")
+    
+    def parse_virtual_routers(self) -> List[VirtualRouter]:
         """Parse virtual router configurations"""
-        vrouters_dict = {}
-        
-        # Parse from templates first (most authoritative source)
-        for template in self.root.findall('.//template/entry'):
-            template_name = template.get('name')
-            
-            for vr in template.findall('.//network/virtual-router/entry'):
-                name = vr.get('name')
-                if not name:
-                    continue
-                
-                # Get interfaces
-                interfaces = []
-                for iface in vr.findall('.//interface/member'):
-                    if iface.text:
-                        interfaces.append(iface.text)
-                
-                # Get static routes
-                static_routes = []
-                for route in vr.findall('.//routing-table/ip/static-route/entry'):
-                    route_name = route.get('name')
-                    destination = self._get_text(route, 'destination')
-                    nexthop_ip = self._get_text(route, 'nexthop/ip-address')
-                    nexthop_iface = self._get_text(route, 'nexthop/next-vr')
-                    metric = self._get_text(route, 'metric')
-                    
-                    if route_name:
-                        static_routes.append({
-                            'name': route_name,
-                            'destination': destination,
-                            'nexthop_ip': nexthop_ip,
-                            'nexthop_interface': nexthop_iface,
-                            'metric': metric
-                        })
-                
-                vr_obj = {
-                    'name': name,
-                    'template': template_name,
-                    'interfaces': interfaces,
-                    'static_routes': static_routes
-                }
-                
-                # Create a unique key based on name + interface signature
-                # This handles cases where multiple templates have VRs with same name
-                interface_signature = ','.join(sorted(interfaces[:5]))  # First 5 interfaces as signature
-                unique_key = f"{name}_{interface_signature}"
-                
-                # Only add if we haven't seen this exact configuration
-                # Or if this has more interfaces (more complete definition)
-                if unique_key not in vrouters_dict or len(interfaces) > len(vrouters_dict[unique_key]['interfaces']):
-                    vrouters_dict[unique_key] = vr_obj
-        
-        # Also check device-level VRs (less common but possible)
-        for vr in self.root.findall('.//devices/entry/network/virtual-router/entry'):
-            name = vr.get('name')
-            if not name:
-                continue
-            
-            interfaces = []
-            for iface in vr.findall('.//interface/member'):
-                if iface.text:
-                    interfaces.append(iface.text)
-            
-            static_routes = []
-            for route in vr.findall('.//routing-table/ip/static-route/entry'):
-                route_name = route.get('name')
-                destination = self._get_text(route, 'destination')
-                nexthop_ip = self._get_text(route, 'nexthop/ip-address')
-                nexthop_iface = self._get_text(route, 'nexthop/next-vr')
-                metric = self._get_text(route, 'metric')
-                
-                if route_name:
-                    static_routes.append({
-                        'name': route_name,
-                        'destination': destination,
-                        'nexthop_ip': nexthop_ip,
-                        'nexthop_interface': nexthop_iface,
-                        'metric': metric
-                    })
-            
-            vr_obj = {
-                'name': name,
-                'template': 'device-specific',
-                'interfaces': interfaces,
-                'static_routes': static_routes
-            }
-            
-            interface_signature = ','.join(sorted(interfaces[:5]))
-            unique_key = f"{name}_{interface_signature}"
-            
-            if unique_key not in vrouters_dict or len(interfaces) > len(vrouters_dict[unique_key]['interfaces']):
-                vrouters_dict[unique_key] = vr_obj
-        
-        return list(vrouters_dict.values())
+        return self._parse_routers(self._TEMPLATE_VR_PATH, self._DEVICE_VR_PATH, 'next-vr')
+    
+    _TEMPLATE_LR_PATH = _compile_path(".//network/logical-router/entry")
+    _DEVICE_LR_PATH = _anchored_path(".//devices/entry/network/logical-router/entry")
     
-    def parse_logical_routers(self) -> List[Dict]:
+    def parse_logical_routers(self) -> List[VirtualRouter]:
         """Parse logical router configurations (Advanced Routing Engine)
         
         Logical routers are part of PAN-OS 10.2+ Advanced Routing Engine.
         They replace virtual routers with industry-standard configuration.
         """
-        lrouters_dict = {}
+        return self._parse_routers(self._TEMPLATE_LR_PATH, self._DEVICE_LR_PATH, 'next-lr',
+                                   router_type='logical')
+    
+    def _parse_routers(self, template_path, device_path: tuple, nexthop_tag: str,
+                       router_type: Optional[str] = None) -> List[VirtualRouter]:
+        """Parse virtual or logical routers from templates, then device config
         
-        # Parse from templates first (most authoritative source)
-        for template in self.root.findall('.//template/entry'):
-            template_name = template.get('name')
-            
-            for lr in template.findall('.//network/logical-router/entry'):
-                name = lr.get('name')
-                if not name:
-                    continue
-                
-                # Get interfaces
-                interfaces = []
-                for iface in lr.findall('.//interface/member'):
-                    if iface.text:
-                        interfaces.append(iface.text)
-                
-                # Get static routes
-                static_routes = []
-                for route in lr.findall('.//routing-table/ip/static-route/entry'):
-                    route_name = route.get('name')
-                    destination = self._get_text(route, 'destination')
-                    nexthop_ip = self._get_text(route, 'nexthop/ip-address')
-                    nexthop_iface = self._get_text(route, 'nexthop/next-lr')  # next-lr for logical routers
-                    metric = self._get_text(route, 'metric')
-                    
-                    if route_name:
-                        static_routes.append({
-                            'name': route_name,
-                            'destination': destination,
-                            'nexthop_ip': nexthop_ip,
-                            'nexthop_interface': nexthop_iface,
-                            'metric': metric
-                        })
-                
-                lr_obj = {
-                    'name': name,
-                    'template': template_name,
-                    'router_type': 'logical',  # Mark as logical router
-                    'interfaces': interfaces,
-                    'static_routes': static_routes
-                }
-                
-                # Create a unique key based on name + interface signature
-                interface_signature = ','.join(sorted(interfaces[:5]))
-                unique_key = f"{name}_{interface_signature}"
-                
-                if unique_key not in lrouters_dict or len(interfaces) > len(lrouters_dict[unique_key]['interfaces']):
-                    lrouters_dict[unique_key] = lr_obj
+        Multiple templates can define a router with the same name; routers
+        with the same name and interface signature (first 5 interfaces) are
+        treated as one, keeping the definition with the most interfaces.
+        """
+        routers = {}
         
-        # Also check device-level logical routers
-        for lr in self.root.findall('.//devices/entry/network/logical-router/entry'):
-            name = lr.get('name')
+        for router, template_name in self._router_candidates(template_path, device_path):
+            name = router.get('name')
             if not name:
                 continue
             
-            interfaces = []
-            for iface in lr.findall('.//interface/member'):
-                if iface.text:
-                    interfaces.append(iface.text)
-            
-            static_routes = []
-            for route in lr.findall('.//routing-table/ip/static-route/entry'):
-                route_name = route.get('name')
-                destination = self._get_text(route, 'destination')
-                nexthop_ip = self._get_text(route, 'nexthop/ip-address')
-                nexthop_iface = self._get_text(route, 'nexthop/next-lr')
-                metric = self._get_text(route, 'metric')
-                
-                if route_name:
-                    static_routes.append({
-                        'name': route_name,
-                        'destination': destination,
-                        'nexthop_ip': nexthop_ip,
-                        'nexthop_interface': nexthop_iface,
-                        'metric': metric
-                    })
-            
-            lr_obj = {
-                'name': name,
-                'template': 'device-specific',
-                'router_type': 'logical',
-                'interfaces': interfaces,
-                'static_routes': static_routes
-            }
+            interfaces = _members(router, 'interface')
             
-            interface_signature = ','.join(sorted(interfaces[:5]))
-            unique_key = f"{name}_{interface_signature}"
+            # Skip before building routes if an equally complete definition was kept
+            key = (name, tuple(sorted(interfaces[:5])))
+            count = len(interfaces)
+            current = routers.get(key)
+            if current is not None and current[0] >= count:
+                continue
             
-            if unique_key not in lrouters_dict or len(interfaces) > len(lrouters_dict[unique_key]['interfaces']):
-                lrouters_dict[unique_key] = lr_obj
+            routers[key] = (count, self._build_router(router, name, template_name, interfaces,
+                                                      nexthop_tag, router_type))
         
-        return list(lrouters_dict.values())
+        return [router_obj for _, router_obj in routers.values()]
     
-    def parse_security_profiles(self) -> Dict[str, List[Dict]]:
-        """Parse security profiles (antivirus, vulnerability, spyware, url-filtering, file-blocking, wildfire)"""
-        profiles = {
-            'antivirus': [],
-            'vulnerability': [],
-            'anti_spyware': [],
-            'url_filtering': [],
-            'file_blocking': [],
-            'wildfire_analysis': []
-        }
-        
-        seen_names = {key: set() for key in profiles.keys()}
-        
-        # Antivirus profiles
-        av_paths = [
-            ".//profiles/virus/entry",
-            ".//device-group/entry/profiles/virus/entry",
-            ".//shared/profiles/virus/entry"
-        ]
-        
-        for path in av_paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names['antivirus']:
-                    continue
-                
-                seen_names['antivirus'].add(name)
-                profiles['antivirus'].append({
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                })
-        
-        # Vulnerability profiles
-        vuln_paths = [
-            ".//profiles/vulnerability/entry",
-            ".//device-group/entry/profiles/vulnerability/entry",
-            ".//shared/profiles/vulnerability/entry"
-        ]
-        
-        for path in vuln_paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names['vulnerability']:
-                    continue
-                
-                seen_names['vulnerability'].add(name)
-                profiles['vulnerability'].append({
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                })
-        
-        # Anti-spyware profiles
-        spy_paths = [
-            ".//profiles/spyware/entry",
-            ".//device-group/entry/profiles/spyware/entry",
-            ".//shared/profiles/spyware/entry"
-        ]
-        
-        for path in spy_paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names['anti_spyware']:
-                    continue
-                
-                seen_names['anti_spyware'].add(name)
-                profiles['anti_spyware'].append({
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                })
-        
-        # URL filtering profiles
-        url_paths = [
-            ".//profiles/url-filtering/entry",
-            ".//device-group/entry/profiles/url-filtering/entry",
-            ".//shared/profiles/url-filtering/entry"
-        ]
-        
-        for path in url_paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names['url_filtering']:
-                    continue
-                
-                seen_names['url_filtering'].add(name)
-                profiles['url_filtering'].append({
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                })
-        
-        # File blocking profiles
-        fb_paths = [
-            ".//profiles/file-blocking/entry",
-            ".//device-group/entry/profiles/file-blocking/entry",
-            ".//shared/profiles/file-blocking/entry"
+    def _router_candidates(self, template_path, device_path: tuple) -> Iterator:
+        """Yield (router element, template name) pairs, templates first"""
+        # Templates are the most authoritative source; device-level routers
+        # are less common but possible
+        for template in self._select(self._TEMPLATE_PATH):
+            template_name = template.get('name')
+            for router in template_path(template):
+                yield router, template_name
+        
+        for router in self._select(device_path):
+            yield router, 'device-specific'
+    
+    def _build_router(self, router: ET.Element, name: str, template_name: str,
+                      interfaces: List[str], nexthop_tag: str,
+                      router_type: Optional[str]) -> VirtualRouter:
+        """Build a router record; nexthop_tag is next-vr or next-lr"""
+        static_routes = [
+            StaticRoute(
+                name=route.get('name'),
+                destination=_text(route, 'destination'),
+                nexthop_ip=_text(route, 'nexthop/ip-address'),
+                nexthop_interface=_text(route, f'nexthop/{nexthop_tag}'),
+                metric=_text(route, 'metric')
+            )
+            for route in self._STATIC_ROUTES_PATH(router)
+            if route.get('name')
         ]
         
-        for path in fb_paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names['file_blocking']:
-                    continue
-                
-                seen_names['file_blocking'].add(name)
-                profiles['file_blocking'].append({
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                })
-        
-        # WildFire analysis profiles
-        wf_paths = [
-            ".//profiles/wildfire-analysis/entry",
-            ".//device-group/entry/profiles/wildfire-analysis/entry",
-            ".//shared/profiles/wildfire-analysis/entry"
-        ]
+        return VirtualRouter(
+            name=name,
+            template=template_name,
+            router_type=router_type,
+            interfaces=interfaces,
+            static_routes=static_routes
+        )
+    
+    _SECURITY_PROFILE_PATHS = tuple(
+        (key, _compile_paths(f".//profiles/{segment}/entry"))
+        for key, segment in (
+            ('antivirus', 'virus'),
+            ('vulnerability', 'vulnerability'),
+            ('anti_spyware', 'spyware'),
+            ('url_filtering', 'url-filtering'),
+            ('file_blocking', 'file-blocking'),
+            ('wildfire_analysis', 'wildfire-analysis'),
+        )
+    )
+    
+    def parse_security_profiles(self) -> Dict[str, List[SecurityProfile]]:
+        """Parse security profiles (antivirus, vulnerability, spyware, url-filtering, file-blocking, wildfire)"""
+        profiles = {}
         
-        for path in wf_paths:
-            for prof in self.root.findall(path):
+        for key, paths in self._SECURITY_PROFILE_PATHS:
+            entries = profiles[key] = []
+            seen_names = set()
+            
+            for prof in self._select_all(paths):
                 name = prof.get('name')
-                if not name or name in seen_names['wildfire_analysis']:
+                if not name or name in seen_names:
                     continue
                 
-                seen_names['wildfire_analysis'].add(name)
-                profiles['wildfire_analysis'].append({
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                })
+                seen_names.add(name)
+                entries.append(SecurityProfile(
+                    name=name,
+                    description=_text(prof, 'description')
+                ))
         
         return profiles
     
-    def parse_security_profile_groups(self) -> List[Dict]:
+    _SECURITY_PROFILE_GROUPS_PATHS = _compile_paths(
+        ".//profile-group/entry",
+    )
+    
+    def parse_security_profile_groups(self) -> List[SecurityProfileGroup]:
         """Parse security profile groups"""
         groups = []
         seen_names = set()
         
-        paths = [
-            ".//profile-group/entry",
-            ".//device-group/entry/profile-group/entry",
-            ".//shared/profile-group/entry"
-        ]
-        
-        for path in paths:
-            for grp in self.root.findall(path):
-                name = grp.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                group_obj = {
-                    'name': name,
-                    'virus': self._get_members(grp, 'virus'),
-                    'spyware': self._get_members(grp, 'spyware'),
-                    'vulnerability': self._get_members(grp, 'vulnerability'),
-                    'url_filtering': self._get_members(grp, 'url-filtering'),
-                    'file_blocking': self._get_members(grp, 'file-blocking'),
-                    'wildfire_analysis': self._get_members(grp, 'wildfire-analysis')
-                }
-                
-                groups.append(group_obj)
+        for grp in self._select_all(self._SECURITY_PROFILE_GROUPS_PATHS):
+            name = grp.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            groups.append(SecurityProfileGroup(
+                name=name,
+                virus=_members(grp, 'virus'),
+                spyware=_members(grp, 'spyware'),
+                vulnerability=_members(grp, 'vulnerability'),
+                url_filtering=_members(grp, 'url-filtering'),
+                file_blocking=_members(grp, 'file-blocking'),
+                wildfire_analysis=_members(grp, 'wildfire-analysis')
+            ))
         
         return groups
     
+    _ZONE_PROTECTION_PROFILES_PATHS = _compile_paths(
+        ".//zone-protection-profile/entry",
+    )
+    
     def parse_zone_protection_profiles(self) -> List[Dict]:
         """Parse zone protection profiles"""
         profiles = []
         seen_names = set()
         
-        paths = [
-            ".//zone-protection-profile/entry",
-            ".//device-group/entry/zone-protection-profile/entry",
-            ".//network/profiles/zone-protection-profile/entry"
-        ]
-        
-        for path in paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                prof_obj = {
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                }
-                
-                profiles.append(prof_obj)
+        for prof in self._select_all(self._ZONE_PROTECTION_PROFILES_PATHS):
+            name = prof.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            prof_obj = {
+                'name': name,
+                'description': _text(prof, 'description')
+            }
+            
+            profiles.append(prof_obj)
         
         return profiles
     
+    _LOG_SETTINGS_PATHS = _compile_paths(
+        ".//log-settings/profiles/entry",
+    )
+    
     def parse_log_settings(self) -> List[Dict]:
         """Parse log forwarding profiles"""
         profiles = []
         seen_names = set()
         
-        paths = [
-            ".//log-settings/profiles/entry",
-            ".//device-group/entry/log-settings/profiles/entry",
-            ".//shared/log-settings/profiles/entry"
-        ]
-        
-        for path in paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                prof_obj = {
-                    'name': name,
-                    'description': self._get_text(prof, 'description')
-                }
-                
-                profiles.append(prof_obj)
+        for prof in self._select_all(self._LOG_SETTINGS_PATHS):
+            name = prof.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            prof_obj = {
+                'name': name,
+                'description': _text(prof, 'description')
+            }
+            
+            profiles.append(prof_obj)
         
         return profiles
     
+    _QOS_PROFILES_PATHS = _compile_paths(
+        ".//qos/profile/entry",
+    )
+    
     def parse_qos_profiles(self) -> List[Dict]:
         """Parse QoS profiles"""
         profiles = []
         seen_names = set()
         
-        paths = [
-            ".//qos/profile/entry",
-            ".//device-group/entry/qos/profile/entry",
-            ".//network/qos/profile/entry"
-        ]
-        
-        for path in paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                prof_obj = {
-                    'name': name,
-                    'class_bandwidth_type': {}
-                }
-                
-                # Parse class bandwidth settings
-                for cls in prof.findall('.//class/entry'):
-                    cls_name = cls.get('name')
-                    if cls_name:
-                        prof_obj['class_bandwidth_type'][cls_name] = {
-                            'priority': self._get_text(cls, 'priority')
-                        }
-                
-                profiles.append(prof_obj)
+        for prof in self._select_all(self._QOS_PROFILES_PATHS):
+            name = prof.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            prof_obj = {
+                'name': name,
+                'class_bandwidth_type': {}
+            }
+            
+            # Parse class bandwidth settings
+            for cls in prof.iterfind('.//class/entry'):
+                cls_name = cls.get('name')
+                if cls_name:
+                    prof_obj['class_bandwidth_type'][cls_name] = {
+                        'priority': _text(cls, 'priority')
+                    }
+            
+            profiles.append(prof_obj)
         
         return profiles
     
+    _TUNNEL_MONITOR_PROFILES_PATHS = _compile_paths(
+        ".//network/tunnel/global-protect-gateway/Default/tunnel-monitor/monitor-profile/entry",
+        ".//network/tunnel-monitor/monitor-profile/entry",
+    )
+    
     def parse_tunnel_monitor_profiles(self) -> List[Dict]:
         """Parse tunnel monitor profiles"""
         profiles = []
         seen_names = set()
         
-        paths = [
-            ".//network/tunnel/global-protect-gateway/Default/tunnel-monitor/monitor-profile/entry",
-            ".//network/tunnel-monitor/monitor-profile/entry",
-            ".//devices/entry/network/tunnel-monitor/monitor-profile/entry"
-        ]
-        
-        for path in paths:
-            for prof in self.root.findall(path):
-                name = prof.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                prof_obj = {
-                    'name': name,
-                    'interval': self._get_text(prof, 'interval'),
-                    'threshold': self._get_text(prof, 'threshold'),
-                    'action': self._get_text(prof, 'action')
-                }
-                
-                profiles.append(prof_obj)
+        for prof in self._select_all(self._TUNNEL_MONITOR_PROFILES_PATHS):
+            name = prof.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            prof_obj = {
+                'name': name,
+                'interval': _text(prof, 'interval'),
+                'threshold': _text(prof, 'threshold'),
+                'action': _text(prof, 'action')
+            }
+            
+            profiles.append(prof_obj)
         
         return profiles
     
+    _BGP_PATHS = _compile_paths(
+        ".//network/virtual-router/entry/protocol/bgp",
+        ".//devices/entry/network/virtual-router/entry/protocol/bgp",
+    )
+    
     def parse_bgp(self) -> Dict[str, Any]:
         """Parse BGP configuration"""
         bgp_config = {
@@ -1659,66 +1704,66 @@ class PanoramaParser:
             'redistribution_rules': []
         }
         
-        paths = [
-            ".//network/virtual-router/entry/protocol/bgp",
-            ".//devices/entry/network/virtual-router/entry/protocol/bgp"
-        ]
-        
-        for path in paths:
-            for bgp in self.root.findall(path):
-                if bgp.find('enable') is not None and bgp.find('enable').text == 'yes':
-                    bgp_config['enabled'] = True
-                    
-                    # Router ID
-                    router_id = bgp.find('router-id')
-                    if router_id is not None:
-                        bgp_config['router_id'] = router_id.text
-                    
-                    # AS Number
-                    local_as = bgp.find('local-as')
-                    if local_as is not None:
-                        bgp_config['as_number'] = local_as.text
-                    
-                    # Peer Groups
-                    for pg in bgp.findall('.//peer-group/entry'):
-                        pg_name = pg.get('name')
-                        if pg_name:
-                            peer_group = {
-                                'name': pg_name,
-                                'type': self._get_text(pg, 'type'),
-                                'export_nexthop': self._get_text(pg, 'export-nexthop'),
-                                'import_nexthop': self._get_text(pg, 'import-nexthop')
-                            }
-                            bgp_config['peer_groups'].append(peer_group)
-                    
-                    # BGP Peers
-                    for peer in bgp.findall('.//peer/entry'):
-                        peer_name = peer.get('name')
-                        if peer_name:
-                            peer_config = {
-                                'name': peer_name,
-                                'peer_as': self._get_text(peer, 'peer-as'),
-                                'local_address_interface': self._get_text(peer, 'local-address/interface'),
-                                'local_address_ip': self._get_text(peer, 'local-address/ip'),
-                                'peer_address_ip': self._get_text(peer, 'peer-address/ip'),
-                                'enable': self._get_text(peer, 'enable') == 'yes',
-                                'peer_group': self._get_text(peer, 'peer-group')
-                            }
-                            bgp_config['peers'].append(peer_config)
-                    
-                    # Redistribution rules
-                    for redist in bgp.findall('.//redist-rules/entry'):
-                        rule_name = redist.get('name')
-                        if rule_name:
-                            redist_rule = {
-                                'name': rule_name,
-                                'enable': self._get_text(redist, 'enable') == 'yes',
-                                'address_family': self._get_text(redist, 'address-family-identifier')
-                            }
-                            bgp_config['redistribution_rules'].append(redist_rule)
+        for bgp in self._select_all(self._BGP_PATHS):
+            enable = bgp.find('enable')
+            if enable is not None and enable.text == 'yes':
+                bgp_config['enabled'] = True
+                
+                # Router ID
+                router_id = bgp.find('router-id')
+                if router_id is not None:
+                    bgp_config['router_id'] = router_id.text
+                
+                # AS Number
+                local_as = bgp.find('local-as')
+                if local_as is not None:
+                    bgp_config['as_number'] = local_as.text
+                
+                # Peer Groups
+                for pg in bgp.iterfind('peer-group/entry'):
+                    pg_name = pg.get('name')
+                    if pg_name:
+                        peer_group = {
+                            'name': pg_name,
+                            'type': _text(pg, 'type'),
+                            'export_nexthop': _text(pg, 'export-nexthop'),
+                            'import_nexthop': _text(pg, 'import-nexthop')
+                        }
+                        bgp_config['peer_groups'].append(peer_group)
+                
+                # BGP Peers (defined inside their peer group)
+                for peer in bgp.iterfind('peer-group/entry/peer/entry'):
+                    peer_name = peer.get('name')
+                    if peer_name:
+                        peer_config = {
+                            'name': peer_name,
+                            'peer_as': _text(peer, 'peer-as'),
+                            'local_address_interface': _text(peer, 'local-address/interface'),
+                            'local_address_ip': _text(peer, 'local-address/ip'),
+                            'peer_address_ip': _text(peer, 'peer-address/ip'),
+                            'enable': _text(peer, 'enable') == 'yes',
+                            'peer_group': _text(peer, 'peer-group')
+                        }
+                        bgp_config['peers'].append(peer_config)
+                
+                # Redistribution rules
+                for redist in bgp.iterfind('redist-rules/entry'):
+                    rule_name = redist.get('name')
+                    if rule_name:
+                        redist_rule = {
+                            'name': rule_name,
+                            'enable': _text(redist, 'enable') == 'yes',
+                            'address_family': _text(redist, 'address-family-identifier')
+                        }
+                        bgp_config['redistribution_rules'].append(redist_rule)
         
         return bgp_config if bgp_config['enabled'] else None
     
+    _OSPF_PATHS = _compile_paths(
+        ".//network/virtual-router/entry/protocol/ospf",
+        ".//devices/entry/network/virtual-router/entry/protocol/ospf",
+    )
+    
     def parse_ospf(self) -> Dict[str, Any]:
         """Parse OSPF configuration"""
         ospf_config = {
@@ -1728,294 +1773,365 @@ class PanoramaParser:
             'interfaces': []
         }
         
-        paths = [
-            ".//network/virtual-router/entry/protocol/ospf",
-            ".//devices/entry/network/virtual-router/entry/protocol/ospf"
-        ]
-        
-        for path in paths:
-            for ospf in self.root.findall(path):
-                if ospf.find('enable') is not None and ospf.find('enable').text == 'yes':
-                    ospf_config['enabled'] = True
-                    
-                    # Router ID
-                    router_id = ospf.find('router-id')
-                    if router_id is not None:
-                        ospf_config['router_id'] = router_id.text
-                    
-                    # OSPF Areas
-                    for area in ospf.findall('.//area/entry'):
-                        area_id = area.get('name')
-                        if area_id:
-                            area_config = {
-                                'area_id': area_id,
-                                'type': 'normal'
-                            }
-                            
-                            # Check for stub/nssa
-                            if area.find('type/stub') is not None:
-                                area_config['type'] = 'stub'
-                            elif area.find('type/nssa') is not None:
-                                area_config['type'] = 'nssa'
-                            
-                            # Area ranges
-                            ranges = []
-                            for range_entry in area.findall('.//range/entry'):
-                                range_name = range_entry.get('name')
-                                if range_name:
-                                    ranges.append(range_name)
-                            area_config['ranges'] = ranges
-                            
-                            ospf_config['areas'].append(area_config)
-                    
-                    # OSPF Interfaces
-                    for iface in ospf.findall('.//interface/entry'):
-                        iface_name = iface.get('name')
-                        if iface_name:
-                            iface_config = {
-                                'interface': iface_name,
-                                'enable': self._get_text(iface, 'enable') == 'yes',
-                                'passive': self._get_text(iface, 'passive') == 'yes',
-                                'link_type': self._get_text(iface, 'link-type'),
-                                'metric': self._get_text(iface, 'metric')
-                            }
-                            ospf_config['interfaces'].append(iface_config)
+        for ospf in self._select_all(self._OSPF_PATHS):
+            enable = ospf.find('enable')
+            if enable is not None and enable.text == 'yes':
+                ospf_config['enabled'] = True
+                
+                # Router ID
+                router_id = ospf.find('router-id')
+                if router_id is not None:
+                    ospf_config['router_id'] = router_id.text
+                
+                # OSPF Areas
+                for area in ospf.iterfind('area/entry'):
+                    area_id = area.get('name')
+                    if area_id:
+                        area_config = {
+                            'area_id': area_id,
+                            'type': 'normal'
+                        }
+                        
+                        # Check for stub/nssa
+                        if area.find('type/stub') is not None:
+                            area_config['type'] = 'stub'
+                        elif area.find('type/nssa') is not None:
+                            area_config['type'] = 'nssa'
+                        
+                        # Area ranges
+                        ranges = []
+                        for range_entry in area.iterfind('range/entry'):
+                            range_name = range_entry.get('name')
+                            if range_name:
+                                ranges.append(range_name)
+                        area_config['ranges'] = ranges
+                        
+                        ospf_config['areas'].append(area_config)
+                
+                # OSPF Interfaces (defined per area)
+                for iface in ospf.iterfind('area/entry/interface/entry'):
+                    iface_name = iface.get('name')
+                    if iface_name:
+                        iface_config = {
+                            'interface': iface_name,
+                            'enable': _text(iface, 'enable') == 'yes',
+                            'passive': _text(iface, 'passive') == 'yes',
+                            'link_type': _text(iface, 'link-type'),
+                            'metric': _text(iface, 'metric')
+                        }
+                        ospf_config['interfaces'].append(iface_config)
         
         return ospf_config if ospf_config['enabled'] else None
     
+    _IPSEC_TUNNELS_PATHS = _compile_paths(
+        ".//network/tunnel/ipsec/entry",
+    )
+    
     def parse_ipsec_tunnels(self) -> List[Dict]:
         """Parse IPsec VPN tunnel configurations"""
         tunnels = []
         seen_names = set()
         
-        paths = [
-            ".//network/tunnel/ipsec/entry",
-            ".//devices/entry/network/tunnel/ipsec/entry"
-        ]
-        
-        for path in paths:
-            for tunnel in self.root.findall(path):
-                name = tunnel.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                tunnel_config = {
-                    'name': name,
-                    'tunnel_interface': self._get_text(tunnel, 'tunnel-interface'),
-                    'type': 'auto-key',  # Default
-                    'peer_address': None,
-                    'local_address': None,
-                    'auth_type': None,
-                    'preshared_key': None,
-                    'ike_gateway': None,
-                    'ipsec_crypto_profile': None
-                }
+        for tunnel in self._select_all(self._IPSEC_TUNNELS_PATHS):
+            name = tunnel.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            tunnel_config = {
+                'name': name,
+                'tunnel_interface': _text(tunnel, 'tunnel-interface'),
+                'type': 'auto-key',  # Default
+                'peer_address': None,
+                'local_address': None,
+                'auth_type': None,
+                'preshared_key': None,
+                'ike_gateway': None,
+                'ipsec_crypto_profile': None
+            }
+            
+            # Check for auto-key (most common)
+            auto_key = tunnel.find('auto-key')
+            if auto_key is not None:
+                tunnel_config['type'] = 'auto-key'
                 
-                # Check for auto-key (most common)
-                auto_key = tunnel.find('auto-key')
-                if auto_key is not None:
-                    tunnel_config['type'] = 'auto-key'
-                    
-                    # IKE Gateway
-                    ike_gw = auto_key.find('ike-gateway/entry')
-                    if ike_gw is not None:
-                        tunnel_config['ike_gateway'] = ike_gw.get('name')
-                    
-                    # IPsec Crypto Profile
-                    ipsec_profile = auto_key.find('ipsec-crypto-profile')
-                    if ipsec_profile is not None:
-                        tunnel_config['ipsec_crypto_profile'] = ipsec_profile.text
-                    
-                    # Proxy IDs
-                    proxy_ids = []
-                    for proxy in auto_key.findall('.//proxy-id/entry'):
-                        proxy_name = proxy.get('name')
-                        if proxy_name:
-                            proxy_config = {
-                                'name': proxy_name,
-                                'local': self._get_text(proxy, 'local'),
-                                'remote': self._get_text(proxy, 'remote'),
-                                'protocol': self._get_text(proxy, 'protocol/number')
-                            }
-                            proxy_ids.append(proxy_config)
-                    tunnel_config['proxy_ids'] = proxy_ids
+                # IKE Gateway
+                ike_gw = auto_key.find('ike-gateway/entry')
+                if ike_gw is not None:
+                    tunnel_config['ike_gateway'] = ike_gw.get('name')
                 
-                # Check for manual key
-                manual_key = tunnel.find('manual-key')
-                if manual_key is not None:
-                    tunnel_config['type'] = 'manual-key'
+                # IPsec Crypto Profile
+                ipsec_profile = auto_key.find('ipsec-crypto-profile')
+                if ipsec_profile is not None:
+                    tunnel_config['ipsec_crypto_profile'] = ipsec_profile.text
                 
-                tunnels.append(tunnel_config)
+                # Proxy IDs
+                proxy_ids = []
+                for proxy in auto_key.iterfind('proxy-id/entry'):
+                    proxy_name = proxy.get('name')
+                    if proxy_name:
+                        proxy_config = {
+                            'name': proxy_name,
+                            'local': _text(proxy, 'local'),
+                            'remote': _text(proxy, 'remote'),
+                            'protocol': _text(proxy, 'protocol/number')
+                        }
+                        proxy_ids.append(proxy_config)
+                tunnel_config['proxy_ids'] = proxy_ids
+            
+            # Check for manual key
+            manual_key = tunnel.find('manual-key')
+            if manual_key is not None:
+                tunnel_config['type'] = 'manual-key'
+            
+            tunnels.append(tunnel_config)
         
         return tunnels
     
+    _IKE_GATEWAYS_PATHS = _compile_paths(
+        ".//network/ike/gateway/entry",
+    )
+    
     def parse_ike_gateways(self) -> List[Dict]:
         """Parse IKE gateway configurations"""
         gateways = []
         seen_names = set()
         
-        paths = [
-            ".//network/ike/gateway/entry",
-            ".//devices/entry/network/ike/gateway/entry"
-        ]
-        
-        for path in paths:
-            for gw in self.root.findall(path):
-                name = gw.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                gateway_config = {
-                    'name': name,
-                    'version': 'ikev1',  # Default
-                    'peer_address': None,
-                    'local_address': None,
-                    'pre_shared_key': '***CHANGE_ME***',  # Generic placeholder
-                    'auth_type': 'pre-shared-key',
-                    'ike_crypto_profile': None,
-                    'local_id': None,
-                    'peer_id': None
-                }
-                
-                # Version
-                protocol = gw.find('protocol')
-                if protocol is not None:
-                    if protocol.find('ikev1') is not None:
-                        gateway_config['version'] = 'ikev1'
-                    elif protocol.find('ikev2') is not None:
-                        gateway_config['version'] = 'ikev2'
-                    
-                    # IKE Crypto Profile
-                    version_node = protocol.find(gateway_config['version'])
+        for gw in self._select_all(self._IKE_GATEWAYS_PATHS):
+            name = gw.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            gateway_config = {
+                'name': name,
+                'version': 'ikev1',  # Default
+                'peer_address': None,
+                'local_address': None,
+                'pre_shared_key': '***CHANGE_ME***',  # Generic placeholder
+                'auth_type': 'pre-shared-key',
+                'ike_crypto_profile': None,
+                'local_id': None,
+                'peer_id': None
+            }
+            
+            # Version (ikev1 takes precedence when both are configured)
+            protocol = gw.find('protocol')
+            if protocol is not None:
+                versions = {child.tag: child for child in protocol}
+                for version in ('ikev1', 'ikev2'):
+                    version_node = versions.get(version)
                     if version_node is not None:
+                        gateway_config['version'] = version
+                        
+                        # IKE Crypto Profile
                         ike_profile = version_node.find('ike-crypto-profile')
                         if ike_profile is not None:
                             gateway_config['ike_crypto_profile'] = ike_profile.text
-                
-                # Peer address
-                peer_addr = gw.find('.//peer-address/ip')
-                if peer_addr is not None:
-                    gateway_config['peer_address'] = peer_addr.text
-                
-                peer_fqdn = gw.find('.//peer-address/fqdn')
-                if peer_fqdn is not None:
-                    gateway_config['peer_address'] = peer_fqdn.text
-                    gateway_config['peer_address_type'] = 'fqdn'
-                
-                # Local address
-                local_addr = gw.find('.//local-address/ip')
-                if local_addr is not None:
-                    gateway_config['local_address'] = local_addr.text
-                
-                local_iface = gw.find('.//local-address/interface')
-                if local_iface is not None:
-                    gateway_config['local_address_interface'] = local_iface.text
-                
-                # Authentication
-                auth = gw.find('authentication')
-                if auth is not None:
-                    # Check for pre-shared key (won't have actual value in export for security)
-                    if auth.find('pre-shared-key') is not None:
-                        gateway_config['auth_type'] = 'pre-shared-key'
-                        # Note: Actual key not in export for security reasons
-                        gateway_config['pre_shared_key'] = '***CHANGE_ME***'
-                    elif auth.find('certificate') is not None:
+                        break
+            
+            # Peer address
+            peer_addr = gw.find('.//peer-address/ip')
+            if peer_addr is not None:
+                gateway_config['peer_address'] = peer_addr.text
+            
+            peer_fqdn = gw.find('.//peer-address/fqdn')
+            if peer_fqdn is not None:
+                gateway_config['peer_address'] = peer_fqdn.text
+                gateway_config['peer_address_type'] = 'fqdn'
+            
+            # Local address
+            local_addr = gw.find('.//local-address/ip')
+            if local_addr is not None:
+                gateway_config['local_address'] = local_addr.text
+            
+            local_iface = gw.find('.//local-address/interface')
+            if local_iface is not None:
+                gateway_config['local_address_interface'] = local_iface.text
+            
+            # Authentication
+            auth = gw.find('authentication')
+            if auth is not None:
+                # Check for pre-shared key (won't have actual value in export for security)
+                if auth.find('pre-shared-key') is not None:
+                    gateway_config['auth_type'] = 'pre-shared-key'
+                    # Note: Actual key not in export for security reasons
+                    gateway_config['pre_shared_key'] = '***CHANGE_ME***'
+                else:
+                    cert = auth.find('certificate')
+                    if cert is not None:
                         gateway_config['auth_type'] = 'certificate'
-                        cert = auth.find('certificate')
-                        if cert is not None:
-                            gateway_config['certificate_profile'] = self._get_text(cert, 'profile')
-                
-                # Local/Peer IDs
-                gateway_config['local_id'] = self._get_text(gw, 'local-id/id')
-                gateway_config['peer_id'] = self._get_text(gw, 'peer-id/id')
-                
-                gateways.append(gateway_config)
+                        gateway_config['certificate_profile'] = _text(cert, 'profile')
+            
+            # Local/Peer IDs
+            gateway_config['local_id'] = _text(gw, 'local-id/id')
+            gateway_config['peer_id'] = _text(gw, 'peer-id/id')
+            
+            gateways.append(gateway_config)
         
         return gateways
     
+    _IKE_CRYPTO_PROFILES_PATHS = _compile_paths(
+        ".//network/ike/crypto-profiles/ike-crypto-profiles/entry",
+    )
+    
     def parse_ike_crypto_profiles(self) -> List[Dict]:
         """Parse IKE crypto profiles"""
         profiles = []
         seen_names = set()
         
-        paths = [
-            ".//network/ike/crypto-profiles/ike-crypto-profiles/entry",
-            ".//devices/entry/network/ike/crypto-profiles/ike-crypto-profiles/entry"
-        ]
-        
-        for path in paths:
-            for profile in self.root.findall(path):
-                name = profile.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                profile_config = {
-                    'name': name,
-                    'dh_groups': self._get_members(profile, 'dh-group'),
-                    'authentications': self._get_members(profile, 'authentication'),
-                    'encryptions': self._get_members(profile, 'encryption'),
-                    'lifetime_hours': self._get_text(profile, 'lifetime/hours')
-                }
-                
-                profiles.append(profile_config)
+        for profile in self._select_all(self._IKE_CRYPTO_PROFILES_PATHS):
+            name = profile.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            profile_config = {
+                'name': name,
+                'dh_groups': _members(profile, 'dh-group'),
+                'authentications': _members(profile, 'authentication'),
+                'encryptions': _members(profile, 'encryption'),
+                'lifetime_hours': _text(profile, 'lifetime/hours')
+            }
+            
+            profiles.append(profile_config)
         
         return profiles
     
+    _IPSEC_CRYPTO_PROFILES_PATHS = _compile_paths(
+        ".//network/ike/crypto-profiles/ipsec-crypto-profiles/entry",
+    )
+    
     def parse_ipsec_crypto_profiles(self) -> List[Dict]:
         """Parse IPsec crypto profiles"""
         profiles = []
         seen_names = set()
         
-        paths = [
-            ".//network/ike/crypto-profiles/ipsec-crypto-profiles/entry",
-            ".//devices/entry/network/ike/crypto-profiles/ipsec-crypto-profiles/entry"
-        ]
-        
-        for path in paths:
-            for profile in self.root.findall(path):
-                name = profile.get('name')
-                if not name or name in seen_names:
-                    continue
-                
-                seen_names.add(name)
-                
-                profile_config = {
-                    'name': name,
-                    'protocol': 'esp',  # Default
-                    'encryptions': self._get_members(profile, 'esp/encryption'),
-                    'authentications': self._get_members(profile, 'esp/authentication'),
-                    'dh_group': self._get_text(profile, 'dh-group'),
-                    'lifetime_hours': self._get_text(profile, 'lifetime/hours'),
-                    'lifetime_kb': self._get_text(profile, 'lifetime/kilobytes')
-                }
-                
-                # Check if AH is used instead of ESP
-                if profile.find('ah') is not None:
-                    profile_config['protocol'] = 'ah'
-                    profile_config['authentications'] = self._get_members(profile, 'ah/authentication')
-                
-                profiles.append(profile_config)
+        for profile in self._select_all(self._IPSEC_CRYPTO_PROFILES_PATHS):
+            name = profile.get('name')
+            if not name or name in seen_names:
+                continue
+            
+            seen_names.add(name)
+            
+            # AH is used instead of ESP when present
+            ah = profile.find('ah')
+            
+            profile_config = {
+                'name': name,
+                'protocol': 'esp' if ah is None else 'ah',
+                'encryptions': _members(profile, 'esp/encryption'),
+                'authentications': (_members(profile, 'esp/authentication') if ah is None
+                                    else _members(ah, 'authentication')),
+                'dh_group': _text(profile, 'dh-group'),
+                'lifetime_hours': _text(profile, 'lifetime/hours'),
+                'lifetime_kb': _text(profile, 'lifetime/kilobytes')
+            }
+            
+            profiles.append(profile_config)
         
         return profiles
     
+    # parse_all() order; matches the order main() reports them in
+    _PARSERS = (
+        'parse_device_groups',
+        'parse_tags',
+        'parse_regions',
+        'parse_custom_url_categories',
+        'parse_application_groups',
+        'parse_application_filters',
+        'parse_external_lists',
+        'parse_schedules',
+        'parse_address_objects',
+        'parse_address_groups',
+        'parse_service_objects',
+        'parse_service_groups',
+        'parse_security_rules',
+        'parse_nat_rules',
+        'parse_decryption_rules',
+        'parse_pbf_rules',
+        'parse_application_override_rules',
+        'parse_zones',
+        'parse_interfaces',
+        'parse_virtual_routers',
+        'parse_logical_routers',
+        'parse_security_profiles',
+        'parse_security_profile_groups',
+        'parse_zone_protection_profiles',
+        'parse_log_settings',
+        'parse_qos_profiles',
+        'parse_tunnel_monitor_profiles',
+        'parse_bgp',
+        'parse_ospf',
+        'parse_ike_gateways',
+        'parse_ipsec_tunnels',
+        'parse_ike_crypto_profiles',
+        'parse_ipsec_crypto_profiles',
+    )
+    
+    def _is_reference(self, element: ET.Element, content_tags: tuple) -> bool:
+        """Check for a Panorama reference entry: an <id> child and none of content_tags"""
+        child_tags = {child.tag for child in element}
+        return 'id' in child_tags and child_tags.isdisjoint(content_tags)
+    
+    def _get_entry_names(self, element: ET.Element, xpath) -> List[str]:
+        """Get the non-empty name attributes of the entries matched by a compiled path"""
+        return [name for name in (entry.get('name') for entry in xpath(element)) if name]
+    
     def _get_text(self, element: ET.Element, path: str) -> Optional[str]:
-        """Safely get text from an XML element"""
-        elem = element.find(path)
-        return elem.text if elem is not None else None
+        """Safely get text from an XML element (kept for subclasses; see _text())"""
+        return _text(element, path)
     
     def _get_members(self, element: ET.Element, path: str) -> List[str]:
-        """Get list of members from an XML element"""
-        members = []
-        for member in element.findall(f'.//{path}/member'):
-            if member.text:
-                members.append(member.text)
-        return members
+        """Get list of members from an XML element (kept for subclasses; see _members())"""
+        return _members(element, path)
+
+
+_UNSAFE_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+# Backslash, double quote and newline escapes for Terraform strings
+_TF_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n'})
+_TF_ESCAPE_CHARS = re.compile(r'[\\"\n]')
+
+# Terraform literals for parsed yes/no flags
+_TF_BOOL = {True: 'true', False: 'false'}
+
+
+@lru_cache(maxsize=4096)
+def _tf_string(value: Optional[str]) -> str:
+    """Quote and escape a string for Terraform"""
+    # Cached: the same zone, address and profile names are quoted for
+    # every rule that references them. Bounded, since one-off values such
+    # as descriptions would otherwise be kept for the whole run
+    if value is None:
+        return '""'
+    # Most values have nothing to escape; a regex scan is much cheaper
+    # than translate() with a dict table
+    if _TF_ESCAPE_CHARS.search(value) is None:
+        return f'"{value}"'
+    # Escape special characters in one pass
+    return f'"{value.translate(_TF_ESCAPES)}"'
+
+
+def _tf_list(values: List[str]) -> str:
+    """Terraform list of quoted strings"""
+    return f"[{', '.join(map(_tf_string, values))}]"
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """Sanitize a name for Terraform resource names (cached; names repeat across resources)"""
+    # Replace spaces and special characters with underscores
+    sanitized = _UNSAFE_NAME_CHARS.sub('_', name)
+    # Remove leading/trailing underscores
+    sanitized = sanitized.strip('_')
+    # Ensure it doesn't start with a number
+    if sanitized and sanitized[0].isdigit():
+        sanitized = f'_{sanitized}'
+    return sanitized.lower()
 
 
 class TerraformGenerator:
@@ -2027,24 +2143,28 @@ class TerraformGenerator:
         
     def sanitize_name(self, name: str) -> str:
         """Sanitize names for Terraform resource names"""
-        # Replace spaces and special characters with underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        # Remove leading/trailing underscores
-        sanitized = sanitized.strip('_')
-        # Ensure it doesn't start with a number
-        if sanitized and sanitized[0].isdigit():
-            sanitized = f'_{sanitized}'
-        return sanitized.lower()
+        return _sanitize_name(name)
     
     def escape_string(self, value: str) -> str:
         """Escape strings for Terraform"""
-        if value is None:
-            return '""'
-        # Escape special characters
-        value = value.replace('\\', '\\\\')
-        value = value.replace('"', '\\"')
-        value = value.replace('\n', '\\n')
-        return f'"{value}"'
+        return _tf_string(value)
+    
+    def _write(self, filename: str, text: str):
+        """Write a generated file as UTF-8 with LF line endings on every platform"""
+        with open(self.output_dir / filename, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+    
+    def _append_fields(self, parts: List[str], obj: Dict, fields: tuple):
+        """Append '  tf_key = value' for each (key, tf_key, formatter) whose value is set"""
+        for key, tf_key, fmt in fields:
+            value = obj.get(key)
+            if value:
+                parts.append(f'  {tf_key} = {fmt(value)}\n')
+    
+    def generate_all(self, calls: List[tuple]):
+        """Run (generate_* method, *args) calls in order; each writes its own file"""
+        for method, *args in calls:
+            method(*args)
     
     def generate_provider_config(self):
         """Generate provider.tf file"""
@@ -2067,8 +2187,7 @@ provider "panos" {
 }
 '''
         
-        with open(self.output_dir / 'provider.tf', 'w') as f:
-            f.write(content)
+        self._write('provider.tf', content)
     
     def generate_variables(self):
         """Generate variables.tf file"""
@@ -2098,574 +2217,539 @@ variable "device_group" {
 }
 '''
         
-        with open(self.output_dir / 'variables.tf', 'w') as f:
-            f.write(content)
+        self._write('variables.tf', content)
     
-    def generate_address_objects(self, addresses: List[Dict]):
+    def generate_address_objects(self, addresses: List[AddressObj]):
         """Generate address objects Terraform configuration"""
         if not addresses:
             return
         
-        content = '# Address Objects\n\n'
+        parts = ['# Address Objects\n\n']
         
         for addr in addresses:
-            resource_name = self.sanitize_name(addr['name'])
+            resource_name = self.sanitize_name(addr.name)
             
-            content += f'resource "panos_address_object" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(addr["name"])}\n'
+            parts.append(f'resource "panos_address_object" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(addr.name)}\n')
             
-            if addr.get('description'):
-                content += f'  description = {self.escape_string(addr["description"])}\n'
+            if addr.description:
+                parts.append(f'  description = {self.escape_string(addr.description)}\n')
             
-            addr_type = addr.get('type', 'ip-netmask')
-            value = addr.get('value', '')
+            addr_type = addr.type or 'ip-netmask'
+            value = addr.value or ''
             
             if addr_type == 'ip-netmask':
-                content += f'  value = {self.escape_string(value)}\n'
+                parts.append(f'  value = {self.escape_string(value)}\n')
             elif addr_type == 'ip-range':
-                content += f'  type = "ip-range"\n'
-                content += f'  value = {self.escape_string(value)}\n'
+                parts.append(f'  type = "ip-range"\n')
+                parts.append(f'  value = {self.escape_string(value)}\n')
             elif addr_type == 'fqdn':
-                content += f'  type = "fqdn"\n'
-                content += f'  value = {self.escape_string(value)}\n'
+                parts.append(f'  type = "fqdn"\n')
+                parts.append(f'  value = {self.escape_string(value)}\n')
             
-            if addr.get('tags'):
-                tags_str = ', '.join([self.escape_string(tag) for tag in addr['tags']])
-                content += f'  tags = [{tags_str}]\n'
+            if addr.tags:
+                parts.append(f'  tags = {_tf_list(addr.tags)}\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'address_objects.tf', 'w') as f:
-            f.write(content)
+        self._write('address_objects.tf', ''.join(parts))
+    
+    # (record key, Terraform argument, formatter) emitted when the value is set
+    _ADDRESS_GROUP_FIELDS = (
+        ('description', 'description', _tf_string),
+        ('static_members', 'static_value', _tf_list),
+        ('dynamic_filter', 'dynamic_value', _tf_string),
+    )
     
     def generate_address_groups(self, groups: List[Dict]):
         """Generate address groups Terraform configuration"""
         if not groups:
             return
         
-        content = '# Address Groups\n\n'
+        parts = ['# Address Groups\n\n']
         
         for grp in groups:
             resource_name = self.sanitize_name(grp['name'])
             
-            content += f'resource "panos_address_group" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(grp["name"])}\n'
-            
-            if grp.get('description'):
-                content += f'  description = {self.escape_string(grp["description"])}\n'
-            
-            if grp.get('static_members'):
-                members_str = ', '.join([self.escape_string(m) for m in grp['static_members']])
-                content += f'  static_value = [{members_str}]\n'
-            
-            if grp.get('dynamic_filter'):
-                content += f'  dynamic_value = {self.escape_string(grp["dynamic_filter"])}\n'
-            
-            content += '}\n\n'
+            parts.append(f'resource "panos_address_group" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(grp["name"])}\n')
+            self._append_fields(parts, grp, self._ADDRESS_GROUP_FIELDS)
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'address_groups.tf', 'w') as f:
-            f.write(content)
+        self._write('address_groups.tf', ''.join(parts))
     
-    def generate_service_objects(self, services: List[Dict]):
+    def generate_service_objects(self, services: List[ServiceObj]):
         """Generate service objects Terraform configuration"""
         if not services:
             return
         
-        content = '# Service Objects\n\n'
+        parts = ['# Service Objects\n\n']
         
         for svc in services:
-            resource_name = self.sanitize_name(svc['name'])
+            resource_name = self.sanitize_name(svc.name)
             
-            content += f'resource "panos_service_object" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(svc["name"])}\n'
+            parts.append(f'resource "panos_service_object" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(svc.name)}\n')
             
-            if svc.get('description'):
-                content += f'  description = {self.escape_string(svc["description"])}\n'
+            if svc.description:
+                parts.append(f'  description = {self.escape_string(svc.description)}\n')
             
-            protocol = svc.get('protocol', 'tcp')
-            content += f'  protocol = {self.escape_string(protocol)}\n'
+            protocol = svc.protocol or 'tcp'
+            parts.append(f'  protocol = {self.escape_string(protocol)}\n')
             
-            if svc.get('port'):
-                content += f'  destination_port = {self.escape_string(svc["port"])}\n'
+            if svc.port:
+                parts.append(f'  destination_port = {self.escape_string(svc.port)}\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'service_objects.tf', 'w') as f:
-            f.write(content)
+        self._write('service_objects.tf', ''.join(parts))
+    
+    _SERVICE_GROUP_FIELDS = (
+        ('description', 'description', _tf_string),
+        ('members', 'services', _tf_list),
+    )
     
     def generate_service_groups(self, groups: List[Dict]):
         """Generate service groups Terraform configuration"""
         if not groups:
             return
         
-        content = '# Service Groups\n\n'
+        parts = ['# Service Groups\n\n']
         
         for grp in groups:
             resource_name = self.sanitize_name(grp['name'])
             
-            content += f'resource "panos_service_group" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(grp["name"])}\n'
-            
-            if grp.get('description'):
-                content += f'  description = {self.escape_string(grp["description"])}\n'
-            
-            if grp.get('members'):
-                members_str = ', '.join([self.escape_string(m) for m in grp['members']])
-                content += f'  services = [{members_str}]\n'
-            
-            content += '}\n\n'
+            parts.append(f'resource "panos_service_group" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(grp["name"])}\n')
+            self._append_fields(parts, grp, self._SERVICE_GROUP_FIELDS)
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'service_groups.tf', 'w') as f:
-            f.write(content)
+        self._write('service_groups.tf', ''.join(parts))
+    
+    _TAG_FIELDS = (
+        ('color', 'color', _tf_string),
+        ('comments', 'comment', _tf_string),
+    )
     
     def generate_tags(self, tags: List[Dict]):
         """Generate tags Terraform configuration"""
         if not tags:
             return
         
-        content = '# Tags\n\n'
+        parts = ['# Tags\n\n']
         
         for tag in tags:
             resource_name = self.sanitize_name(tag['name'])
             
-            content += f'resource "panos_administrative_tag" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(tag["name"])}\n'
-            
-            if tag.get('color'):
-                content += f'  color = {self.escape_string(tag["color"])}\n'
-            
-            if tag.get('comments'):
-                content += f'  comment = {self.escape_string(tag["comments"])}\n'
-            
-            content += '}\n\n'
+            parts.append(f'resource "panos_administrative_tag" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(tag["name"])}\n')
+            self._append_fields(parts, tag, self._TAG_FIELDS)
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'tags.tf', 'w') as f:
-            f.write(content)
+        self._write('tags.tf', ''.join(parts))
+    
+    _CUSTOM_URL_CATEGORY_FIELDS = (
+        ('description', 'description', _tf_string),
+        ('list', 'sites', _tf_list),
+    )
     
     def generate_custom_url_categories(self, categories: List[Dict]):
         """Generate custom URL categories Terraform configuration"""
         if not categories:
             return
         
-        content = '# Custom URL Categories\n\n'
+        parts = ['# Custom URL Categories\n\n']
         
         for cat in categories:
             resource_name = self.sanitize_name(cat['name'])
             
-            content += f'resource "panos_custom_url_category" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(cat["name"])}\n'
-            
-            if cat.get('description'):
-                content += f'  description = {self.escape_string(cat["description"])}\n'
-            
-            if cat.get('list'):
-                # Split into sites
-                sites_str = ', '.join([self.escape_string(url) for url in cat['list']])
-                content += f'  sites = [{sites_str}]\n'
-            
-            content += '}\n\n'
+            parts.append(f'resource "panos_custom_url_category" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(cat["name"])}\n')
+            self._append_fields(parts, cat, self._CUSTOM_URL_CATEGORY_FIELDS)
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'custom_url_categories.tf', 'w') as f:
-            f.write(content)
+        self._write('custom_url_categories.tf', ''.join(parts))
     
     def generate_application_groups(self, app_groups: List[Dict]):
         """Generate application groups Terraform configuration"""
         if not app_groups:
             return
         
-        content = '# Application Groups\n\n'
+        parts = ['# Application Groups\n\n']
         
         for ag in app_groups:
             resource_name = self.sanitize_name(ag['name'])
             
-            content += f'resource "panos_application_group" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(ag["name"])}\n'
+            parts.append(f'resource "panos_application_group" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(ag["name"])}\n')
             
             if ag.get('members'):
-                members_str = ', '.join([self.escape_string(m) for m in ag['members']])
-                content += f'  applications = [{members_str}]\n'
+                parts.append(f'  applications = {_tf_list(ag["members"])}\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'application_groups.tf', 'w') as f:
-            f.write(content)
+        self._write('application_groups.tf', ''.join(parts))
     
     def generate_application_filters(self, app_filters: List[Dict]):
         """Generate application filters Terraform configuration"""
         if not app_filters:
             return
         
-        content = '# Application Filters\n'
-        content += '# Note: Application filters may require manual configuration of all attributes\n\n'
+        parts = ['# Application Filters\n']
+        parts.append('# Note: Application filters may require manual configuration of all attributes\n\n')
         
         for af in app_filters:
             resource_name = self.sanitize_name(af['name'])
             
-            content += f'resource "panos_application_filter" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(af["name"])}\n'
+            parts.append(f'resource "panos_application_filter" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(af["name"])}\n')
             
             if af.get('category'):
-                cat_str = ', '.join([self.escape_string(c) for c in af['category']])
-                content += f'  category = [{cat_str}]\n'
+                parts.append(f'  category = {_tf_list(af["category"])}\n')
             
             if af.get('subcategory'):
-                subcat_str = ', '.join([self.escape_string(s) for s in af['subcategory']])
-                content += f'  subcategory = [{subcat_str}]\n'
+                parts.append(f'  subcategory = {_tf_list(af["subcategory"])}\n')
             
             if af.get('technology'):
-                tech_str = ', '.join([self.escape_string(t) for t in af['technology']])
-                content += f'  technology = [{tech_str}]\n'
+                parts.append(f'  technology = {_tf_list(af["technology"])}\n')
             
             if af.get('risk'):
-                risk_str = ', '.join([self.escape_string(r) for r in af['risk']])
-                content += f'  risk = [{risk_str}]\n'
+                parts.append(f'  risk = {_tf_list(af["risk"])}\n')
             
             if af.get('evasive') == 'yes':
-                content += f'  evasive = true\n'
+                parts.append(f'  evasive = true\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'application_filters.tf', 'w') as f:
-            f.write(content)
+        self._write('application_filters.tf', ''.join(parts))
     
     def generate_external_lists(self, ext_lists: List[Dict]):
         """Generate external dynamic lists Terraform configuration"""
         if not ext_lists:
             return
         
-        content = '# External Dynamic Lists\n\n'
+        parts = ['# External Dynamic Lists\n\n']
         
         for ext_list in ext_lists:
             resource_name = self.sanitize_name(ext_list['name'])
             
-            content += f'resource "panos_external_list" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(ext_list["name"])}\n'
+            parts.append(f'resource "panos_external_list" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(ext_list["name"])}\n')
             
             if ext_list.get('type'):
-                content += f'  type = {self.escape_string(ext_list["type"])}\n'
+                parts.append(f'  type = {self.escape_string(ext_list["type"])}\n')
             
             if ext_list.get('url'):
-                content += f'  url = {self.escape_string(ext_list["url"])}\n'
+                parts.append(f'  url = {self.escape_string(ext_list["url"])}\n')
             
             if ext_list.get('recurring'):
-                content += f'  recurring = {self.escape_string(ext_list["recurring"])}\n'
+                parts.append(f'  recurring = {self.escape_string(ext_list["recurring"])}\n')
             
             if ext_list.get('description'):
-                content += f'  description = {self.escape_string(ext_list["description"])}\n'
+                parts.append(f'  description = {self.escape_string(ext_list["description"])}\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'external_lists.tf', 'w') as f:
-            f.write(content)
+        self._write('external_lists.tf', ''.join(parts))
     
     def generate_schedules(self, schedules: List[Dict]):
         """Generate schedules Terraform configuration"""
         if not schedules:
             return
         
-        content = '# Schedules\n'
-        content += '# Note: Schedules require detailed recurring/non-recurring configuration\n'
-        content += '# Manual configuration may be needed for complex schedules\n\n'
+        parts = ['# Schedules\n']
+        parts.append('# Note: Schedules require detailed recurring/non-recurring configuration\n')
+        parts.append('# Manual configuration may be needed for complex schedules\n\n')
         
         for sched in schedules:
             resource_name = self.sanitize_name(sched['name'])
             
-            content += f'# Schedule: {sched["name"]}\n'
-            content += f'# Type: {sched.get("schedule_type", "unknown")}\n'
-            content += f'# Manual Terraform configuration required\n\n'
+            parts.append(f'# Schedule: {sched["name"]}\n')
+            parts.append(f'# Type: {sched.get("schedule_type", "unknown")}\n')
+            parts.append(f'# Manual Terraform configuration required\n\n')
         
-        with open(self.output_dir / 'schedules.tf', 'w') as f:
-            f.write(content)
+        self._write('schedules.tf', ''.join(parts))
     
-    def generate_security_rules(self, rules: List[Dict]):
+    def generate_security_rules(self, rules: List[SecurityRule]):
         """Generate security policy rules Terraform configuration"""
         if not rules:
             return
         
-        content = '# Security Policy Rules\n\n'
+        parts = ['# Security Policy Rules\n\n']
         
         for idx, rule in enumerate(rules, start=1):
-            resource_name = self.sanitize_name(rule['name'])
+            resource_name = self.sanitize_name(rule.name)
             
-            content += f'resource "panos_security_rule_group" "{resource_name}" {{\n'
-            content += f'  position_keyword = "bottom"\n\n'
-            content += f'  rule {{\n'
-            content += f'    name = {self.escape_string(rule["name"])}\n'
+            parts.append(f'resource "panos_security_rule_group" "{resource_name}" {{\n'
+                         f'  position_keyword = "bottom"\n\n'
+                         f'  rule {{\n')
+            parts.append(f'    name = {self.escape_string(rule.name)}\n')
             
-            if rule.get('description'):
-                content += f'    description = {self.escape_string(rule["description"])}\n'
+            if rule.description:
+                parts.append(f'    description = {self.escape_string(rule.description)}\n')
             
-            if rule.get('source_zones'):
-                zones_str = ', '.join([self.escape_string(z) for z in rule['source_zones']])
-                content += f'    source_zones = [{zones_str}]\n'
+            if rule.source_zones:
+                parts.append(f'    source_zones = {_tf_list(rule.source_zones)}\n')
             
-            if rule.get('source_addresses'):
-                addrs_str = ', '.join([self.escape_string(a) for a in rule['source_addresses']])
-                content += f'    source_addresses = [{addrs_str}]\n'
+            if rule.source_addresses:
+                parts.append(f'    source_addresses = {_tf_list(rule.source_addresses)}\n')
             
-            if rule.get('destination_zones'):
-                zones_str = ', '.join([self.escape_string(z) for z in rule['destination_zones']])
-                content += f'    destination_zones = [{zones_str}]\n'
+            if rule.destination_zones:
+                parts.append(f'    destination_zones = {_tf_list(rule.destination_zones)}\n')
             
-            if rule.get('destination_addresses'):
-                addrs_str = ', '.join([self.escape_string(a) for a in rule['destination_addresses']])
-                content += f'    destination_addresses = [{addrs_str}]\n'
+            if rule.destination_addresses:
+                parts.append(f'    destination_addresses = {_tf_list(rule.destination_addresses)}\n')
             
-            if rule.get('applications'):
-                apps_str = ', '.join([self.escape_string(a) for a in rule['applications']])
-                content += f'    applications = [{apps_str}]\n'
+            if rule.applications:
+                parts.append(f'    applications = {_tf_list(rule.applications)}\n')
             
-            if rule.get('services'):
-                svcs_str = ', '.join([self.escape_string(s) for s in rule['services']])
-                content += f'    services = [{svcs_str}]\n'
+            if rule.services:
+                parts.append(f'    services = {_tf_list(rule.services)}\n')
             
-            action = rule.get('action', 'allow')
-            content += f'    action = {self.escape_string(action)}\n'
+            action = rule.action
+            parts.append(f'    action = {self.escape_string(action)}\n')
             
-            if rule.get('log_start'):
-                content += f'    log_start = true\n'
+            if rule.log_start:
+                parts.append('    log_start = true\n')
             
-            if rule.get('log_end'):
-                content += f'    log_end = true\n'
+            if rule.log_end:
+                parts.append('    log_end = true\n')
             
-            if rule.get('disabled'):
-                content += f'    disabled = true\n'
+            if rule.disabled:
+                parts.append('    disabled = true\n')
             
-            content += '  }\n'
-            content += '}\n\n'
+            parts.append('  }\n}\n\n')
         
-        with open(self.output_dir / 'security_rules.tf', 'w') as f:
-            f.write(content)
+        self._write('security_rules.tf', ''.join(parts))
     
-    def generate_nat_rules(self, rules: List[Dict]):
+    def generate_nat_rules(self, rules: List[NatRule]):
         """Generate NAT policy rules Terraform configuration"""
         if not rules:
             return
         
-        content = '# NAT Policy Rules\n\n'
+        parts = ['# NAT Policy Rules\n\n']
         
         for idx, rule in enumerate(rules, start=1):
-            resource_name = self.sanitize_name(rule['name'])
+            resource_name = self.sanitize_name(rule.name)
             
-            content += f'resource "panos_nat_rule_group" "{resource_name}" {{\n'
-            content += f'  position_keyword = "bottom"\n\n'
-            content += f'  rule {{\n'
-            content += f'    name = {self.escape_string(rule["name"])}\n'
+            parts.append(f'resource "panos_nat_rule_group" "{resource_name}" {{\n'
+                         f'  position_keyword = "bottom"\n\n'
+                         f'  rule {{\n')
+            parts.append(f'    name = {self.escape_string(rule.name)}\n')
             
-            if rule.get('description'):
-                content += f'    description = {self.escape_string(rule["description"])}\n'
+            if rule.description:
+                parts.append(f'    description = {self.escape_string(rule.description)}\n')
             
-            if rule.get('source_zones'):
-                zones_str = ', '.join([self.escape_string(z) for z in rule['source_zones']])
-                content += f'    original_packet {{\n'
-                content += f'      source_zones = [{zones_str}]\n'
+            if rule.source_zones:
+                parts.append(f'    original_packet {{\n')
+                parts.append(f'      source_zones = {_tf_list(rule.source_zones)}\n')
             
-            if rule.get('destination_zone'):
-                content += f'      destination_zone = {self.escape_string(rule["destination_zone"])}\n'
+            if rule.destination_zone:
+                parts.append(f'      destination_zone = {self.escape_string(rule.destination_zone)}\n')
             
-            if rule.get('source_addresses'):
-                addrs_str = ', '.join([self.escape_string(a) for a in rule['source_addresses']])
-                content += f'      source_addresses = [{addrs_str}]\n'
+            if rule.source_addresses:
+                parts.append(f'      source_addresses = {_tf_list(rule.source_addresses)}\n')
             
-            if rule.get('destination_addresses'):
-                addrs_str = ', '.join([self.escape_string(a) for a in rule['destination_addresses']])
-                content += f'      destination_addresses = [{addrs_str}]\n'
+            if rule.destination_addresses:
+                parts.append(f'      destination_addresses = {_tf_list(rule.destination_addresses)}\n')
             
-            if rule.get('service'):
-                content += f'      service = {self.escape_string(rule["service"])}\n'
+            if rule.service:
+                parts.append(f'      service = {self.escape_string(rule.service)}\n')
             
-            content += f'    }}\n\n'
+            parts.append('    }\n\n')
             
             # Source translation
-            if rule.get('source_translation_type'):
-                content += f'    source_translation {{\n'
-                content += f'      type = {self.escape_string(rule["source_translation_type"])}\n'
-                if rule.get('source_translation_address'):
-                    addrs_str = ', '.join([self.escape_string(a) for a in rule['source_translation_address']])
-                    content += f'      translated_addresses = [{addrs_str}]\n'
-                content += f'    }}\n\n'
+            if rule.source_translation_type:
+                parts.append(f'    source_translation {{\n')
+                parts.append(f'      type = {self.escape_string(rule.source_translation_type)}\n')
+                if rule.source_translation_address:
+                    parts.append(f'      translated_addresses = {_tf_list(rule.source_translation_address)}\n')
+                parts.append('    }\n\n')
             
             # Destination translation
-            if rule.get('destination_translation_address'):
-                content += f'    destination_translation {{\n'
-                content += f'      translated_address = {self.escape_string(rule["destination_translation_address"])}\n'
-                if rule.get('destination_translation_port'):
-                    content += f'      translated_port = {self.escape_string(rule["destination_translation_port"])}\n'
-                content += f'    }}\n\n'
+            if rule.destination_translation_address:
+                parts.append(f'    destination_translation {{\n')
+                parts.append(f'      translated_address = {self.escape_string(rule.destination_translation_address)}\n')
+                if rule.destination_translation_port:
+                    parts.append(f'      translated_port = {self.escape_string(rule.destination_translation_port)}\n')
+                parts.append('    }\n\n')
             
-            if rule.get('disabled'):
-                content += f'    disabled = true\n'
+            if rule.disabled:
+                parts.append('    disabled = true\n')
             
-            content += '  }\n'
-            content += '}\n\n'
+            parts.append('  }\n}\n\n')
+        
+        self._write('nat_rules.tf', ''.join(parts))
+    
+    def _write_placeholder(self, filename: str, header: str, items: List[Dict],
+                           label: str, fields: tuple):
+        """Write items as comments for manual configuration
+        
+        fields are (label, key, default); a default of None means the line is
+        only written when the item has a value for key.
+        """
+        parts = [header]
+        
+        for item in items:
+            parts.append(f'# {label}: {item["name"]}\n')
+            for field_label, key, default in fields:
+                if default is None:
+                    if item.get(key):
+                        parts.append(f'#   {field_label}: {item[key]}\n')
+                else:
+                    parts.append(f'#   {field_label}: {item.get(key, default)}\n')
+            parts.append('\n')
         
-        with open(self.output_dir / 'nat_rules.tf', 'w') as f:
-            f.write(content)
+        self._write(filename, ''.join(parts))
     
     def generate_decryption_rules(self, rules: List[Dict]):
         """Generate decryption rules - placeholder for manual configuration"""
         if not rules:
             return
         
-        content = '# Decryption Rules\n'
-        content += '# Note: Decryption rules require detailed SSL/TLS configuration\n'
-        content += '# Manual Terraform configuration is required\n\n'
-        
-        for rule in rules:
-            content += f'# Rule: {rule["name"]}\n'
-            content += f'#   Type: {rule.get("type", "unknown")}\n'
-            content += f'#   Action: {rule.get("action", "unknown")}\n'
-            content += f'#   Profile: {rule.get("profile", "none")}\n'
-            if rule.get('description'):
-                content += f'#   Description: {rule["description"]}\n'
-            content += '\n'
-        
-        with open(self.output_dir / 'decryption_rules.tf', 'w') as f:
-            f.write(content)
-    
-    def generate_pbf_rules(self, rules: List[Dict]):
+        self._write_placeholder(
+            'decryption_rules.tf',
+            '# Decryption Rules\n'
+            '# Note: Decryption rules require detailed SSL/TLS configuration\n'
+            '# Manual Terraform configuration is required\n\n',
+            rules, 'Rule',
+            (('Type', 'type', 'unknown'),
+             ('Action', 'action', 'unknown'),
+             ('Profile', 'profile', 'none'),
+             ('Description', 'description', None)))
+    
+    def generate_pbf_rules(self, rules: List[PBFRule]):
         """Generate Policy-Based Forwarding rules - placeholder"""
         if not rules:
             return
         
-        content = '# Policy-Based Forwarding Rules\n'
-        content += '# Note: PBF rules require careful configuration with virtual routers\n'
-        content += '# Manual Terraform configuration is required\n\n'
+        parts = ['# Policy-Based Forwarding Rules\n']
+        parts.append('# Note: PBF rules require careful configuration with virtual routers\n')
+        parts.append('# Manual Terraform configuration is required\n\n')
         
         for rule in rules:
-            content += f'# Rule: {rule["name"]}\n'
-            if rule.get('action'):
-                action = rule['action']
+            parts.append(f'# Rule: {rule.name}\n')
+            if rule.action:
+                action = rule.action
                 if action.get('type') == 'forward':
-                    content += f'#   Action: Forward to {action.get("nexthop_ip")} via {action.get("egress_interface")}\n'
+                    parts.append(f'#   Action: Forward to {action.get("nexthop_ip")} via {action.get("egress_interface")}\n')
                 else:
-                    content += f'#   Action: {action.get("type")}\n'
-            if rule.get('description'):
-                content += f'#   Description: {rule["description"]}\n'
-            content += '\n'
+                    parts.append(f'#   Action: {action.get("type")}\n')
+            if rule.description:
+                parts.append(f'#   Description: {rule.description}\n')
+            parts.append('\n')
         
-        with open(self.output_dir / 'pbf_rules.tf', 'w') as f:
-            f.write(content)
+        self._write('pbf_rules.tf', ''.join(parts))
     
     def generate_application_override_rules(self, rules: List[Dict]):
         """Generate application override rules - placeholder"""
         if not rules:
             return
         
-        content = '# Application Override Rules\n'
-        content += '# Note: Application override rules require manual configuration\n\n'
-        
-        for rule in rules:
-            content += f'# Rule: {rule["name"]}\n'
-            content += f'#   Protocol: {rule.get("protocol", "unknown")}\n'
-            content += f'#   Port: {rule.get("port", "any")}\n'
-            content += f'#   Application: {rule.get("application", "unknown")}\n'
-            content += '\n'
-        
-        with open(self.output_dir / 'application_override_rules.tf', 'w') as f:
-            f.write(content)
+        self._write_placeholder(
+            'application_override_rules.tf',
+            '# Application Override Rules\n'
+            '# Note: Application override rules require manual configuration\n\n',
+            rules, 'Rule',
+            (('Protocol', 'protocol', 'unknown'),
+             ('Port', 'port', 'any'),
+             ('Application', 'application', 'unknown')))
     
     def generate_zone_protection_profiles(self, profiles: List[Dict]):
         """Generate zone protection profiles - placeholder"""
         if not profiles:
             return
         
-        content = '# Zone Protection Profiles\n'
-        content += '# Note: Zone protection profiles require detailed configuration\n'
-        content += '# Manual Terraform configuration is required\n\n'
-        
-        for prof in profiles:
-            content += f'# Profile: {prof["name"]}\n'
-            if prof.get('description'):
-                content += f'#   Description: {prof["description"]}\n'
-            content += '\n'
-        
-        with open(self.output_dir / 'zone_protection_profiles.tf', 'w') as f:
-            f.write(content)
+        self._write_placeholder(
+            'zone_protection_profiles.tf',
+            '# Zone Protection Profiles\n'
+            '# Note: Zone protection profiles require detailed configuration\n'
+            '# Manual Terraform configuration is required\n\n',
+            profiles, 'Profile',
+            (('Description', 'description', None),))
     
     def generate_log_settings(self, profiles: List[Dict]):
         """Generate log forwarding profiles - placeholder"""
         if not profiles:
             return
         
-        content = '# Log Forwarding Profiles\n'
-        content += '# Note: Log forwarding profiles require syslog/email configuration\n'
-        content += '# Manual Terraform configuration is required\n\n'
-        
-        for prof in profiles:
-            content += f'# Profile: {prof["name"]}\n'
-            if prof.get('description'):
-                content += f'#   Description: {prof["description"]}\n'
-            content += '\n'
-        
-        with open(self.output_dir / 'log_settings.tf', 'w') as f:
-            f.write(content)
+        self._write_placeholder(
+            'log_settings.tf',
+            '# Log Forwarding Profiles\n'
+            '# Note: Log forwarding profiles require syslog/email configuration\n'
+            '# Manual Terraform configuration is required\n\n',
+            profiles, 'Profile',
+            (('Description', 'description', None),))
     
     def generate_qos_profiles(self, profiles: List[Dict]):
         """Generate QoS profiles - placeholder"""
         if not profiles:
             return
         
-        content = '# QoS Profiles\n'
-        content += '# Note: QoS profiles require bandwidth and class configuration\n'
-        content += '# Manual Terraform configuration is required\n\n'
+        parts = ['# QoS Profiles\n']
+        parts.append('# Note: QoS profiles require bandwidth and class configuration\n')
+        parts.append('# Manual Terraform configuration is required\n\n')
         
         for prof in profiles:
-            content += f'# Profile: {prof["name"]}\n'
+            parts.append(f'# Profile: {prof["name"]}\n')
             if prof.get('class_bandwidth_type'):
-                content += f'#   Classes: {", ".join(prof["class_bandwidth_type"].keys())}\n'
-            content += '\n'
+                parts.append(f'#   Classes: {", ".join(prof["class_bandwidth_type"].keys())}\n')
+            parts.append('\n')
         
-        with open(self.output_dir / 'qos_profiles.tf', 'w') as f:
-            f.write(content)
+        self._write('qos_profiles.tf', ''.join(parts))
     
     def generate_tunnel_monitor_profiles(self, profiles: List[Dict]):
         """Generate tunnel monitor profiles - placeholder"""
         if not profiles:
             return
         
-        content = '# Tunnel Monitor Profiles\n'
-        content += '# Note: Tunnel monitor profiles require destination IP configuration\n'
-        content += '# Manual Terraform configuration is required\n\n'
-        
-        for prof in profiles:
-            content += f'# Profile: {prof["name"]}\n'
-            content += f'#   Interval: {prof.get("interval", "unknown")}\n'
-            content += f'#   Threshold: {prof.get("threshold", "unknown")}\n'
-            content += f'#   Action: {prof.get("action", "unknown")}\n'
-            content += '\n'
-        
-        with open(self.output_dir / 'tunnel_monitor_profiles.tf', 'w') as f:
-            f.write(content)
+        self._write_placeholder(
+            'tunnel_monitor_profiles.tf',
+            '# Tunnel Monitor Profiles\n'
+            '# Note: Tunnel monitor profiles require destination IP configuration\n'
+            '# Manual Terraform configuration is required\n\n',
+            profiles, 'Profile',
+            (('Interval', 'interval', 'unknown'),
+             ('Threshold', 'threshold', 'unknown'),
+             ('Action', 'action', 'unknown')))
     
     
-    def generate_zones(self, zones: List[Dict]):
+    def generate_zones(self, zones: List[Zone]):
         """Generate zone Terraform configuration"""
         if not zones:
             return
         
-        content = '# Zone Configurations\n\n'
+        parts = ['# Zone Configurations\n\n']
         
         for zone in zones:
-            resource_name = self.sanitize_name(zone['name'])
+            resource_name = self.sanitize_name(zone.name)
             
-            content += f'resource "panos_zone" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(zone["name"])}\n'
-            content += f'  mode = {self.escape_string(zone["type"])}\n'
+            parts.append(f'resource "panos_zone" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(zone.name)}\n')
+            parts.append(f'  mode = {self.escape_string(zone.type)}\n')
             
-            if zone.get('interfaces'):
-                ifaces_str = ', '.join([self.escape_string(i) for i in zone['interfaces']])
-                content += f'  interfaces = [{ifaces_str}]\n'
+            if zone.interfaces:
+                parts.append(f'  interfaces = {_tf_list(zone.interfaces)}\n')
             
-            if zone.get('zone_protection_profile'):
-                content += f'  zone_protection_profile = {self.escape_string(zone["zone_protection_profile"])}\n'
+            if zone.zone_protection_profile:
+                parts.append(f'  zone_protection_profile = {self.escape_string(zone.zone_protection_profile)}\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'zones.tf', 'w') as f:
-            f.write(content)
+        self._write('zones.tf', ''.join(parts))
+    
+    def _unique_resource_names(self, items: Iterable) -> List[str]:
+        """Sanitized resource names for items' .name, suffixing repeats with _2, _3, ..."""
+        counts = Counter()
+        names = []
+        for item in items:
+            base = self.sanitize_name(item.name)
+            counts[base] += 1
+            count = counts[base]
+            names.append(base if count == 1 else f"{base}_{count}")
+        return names
     
-    def generate_virtual_routers(self, vrouters: List[Dict]):
+    def generate_virtual_routers(self, vrouters: List[VirtualRouter]):
         """Generate virtual/logical router Terraform configuration
         
         Supports both:
@@ -2676,326 +2760,255 @@ variable "device_group" {
             return
         
         # Separate routers by type
-        virtual_routers = [r for r in vrouters if r.get('router_type') != 'logical']
-        logical_routers = [r for r in vrouters if r.get('router_type') == 'logical']
+        virtual_routers = [r for r in vrouters if r.router_type != 'logical']
+        logical_routers = [r for r in vrouters if r.router_type == 'logical']
         
-        content = '# Router Configurations\n'
-        content += '# Supports both Virtual Routers (legacy) and Logical Routers (Advanced Routing Engine)\n\n'
+        parts = ['# Router Configurations\n']
+        parts.append('# Supports both Virtual Routers (legacy) and Logical Routers (Advanced Routing Engine)\n\n')
         
         if logical_routers:
-            content += f'# NOTE: Your config uses Advanced Routing Engine (PAN-OS 10.2+)\n'
-            content += f'# - {len(virtual_routers)} Virtual Routers (legacy)\n'
-            content += f'# - {len(logical_routers)} Logical Routers (advanced)\n'
-            content += f'#\n'
-            content += f'# Terraform provider panos supports both types.\n'
-            content += f'# Virtual routers use: panos_virtual_router\n'
-            content += f'# Logical routers use: panos_logical_router (if supported by provider version)\n'
-            content += f'# Check: https://registry.terraform.io/providers/PaloAltoNetworks/panos/latest/docs\n\n'
-        
-        # Track resource names to handle duplicates
-        resource_name_counts = {}
-        
-        for router in vrouters:
-            # Generate base resource name
-            base_resource_name = self.sanitize_name(router['name'])
-            
-            # If we've seen this name before, add a suffix
-            if base_resource_name in resource_name_counts:
-                resource_name_counts[base_resource_name] += 1
-                resource_name = f"{base_resource_name}_{resource_name_counts[base_resource_name]}"
-            else:
-                resource_name_counts[base_resource_name] = 1
-                resource_name = base_resource_name
-            
+            parts.append(f'# NOTE: Your config uses Advanced Routing Engine (PAN-OS 10.2+)\n')
+            parts.append(f'# - {len(virtual_routers)} Virtual Routers (legacy)\n')
+            parts.append(f'# - {len(logical_routers)} Logical Routers (advanced)\n')
+            parts.append(f'#\n')
+            parts.append(f'# Terraform provider panos supports both types.\n')
+            parts.append(f'# Virtual routers use: panos_virtual_router\n')
+            parts.append(f'# Logical routers use: panos_logical_router (if supported by provider version)\n')
+            parts.append(f'# Check: https://registry.terraform.io/providers/PaloAltoNetworks/panos/latest/docs\n\n')
+        
+        for router, resource_name in zip(vrouters, self._unique_resource_names(vrouters)):
             # Determine router type and resource type
-            router_type = router.get('router_type', 'virtual')
+            router_type = router.router_type or 'virtual'
             is_logical = router_type == 'logical'
             
             # Add comment showing source and type
-            template = router.get('template', 'unknown')
-            content += f'# Source: {template}\n'
-            content += f'# Type: {"Logical Router (Advanced Routing Engine)" if is_logical else "Virtual Router (Legacy)"}\n'
+            template = router.template
+            parts.append(f'# Source: {template}\n')
+            parts.append(f'# Type: {"Logical Router (Advanced Routing Engine)" if is_logical else "Virtual Router (Legacy)"}\n')
             
             if is_logical:
                 # Note: panos_logical_router may not exist in all provider versions
                 # Users may need to use panos_virtual_router even for logical routers
-                content += f'# NOTE: Terraform provider may use panos_virtual_router for logical routers\n'
-                content += f'# Check provider documentation for logical router support\n'
-                content += f'resource "panos_virtual_router" "{resource_name}" {{\n'
+                parts.append(f'# NOTE: Terraform provider may use panos_virtual_router for logical routers\n')
+                parts.append(f'# Check provider documentation for logical router support\n')
+                parts.append(f'resource "panos_virtual_router" "{resource_name}" {{\n')
             else:
-                content += f'resource "panos_virtual_router" "{resource_name}" {{\n'
+                parts.append(f'resource "panos_virtual_router" "{resource_name}" {{\n')
             
-            content += f'  name = {self.escape_string(router["name"])}\n'
+            parts.append(f'  name = {self.escape_string(router.name)}\n')
             
-            if router.get('interfaces'):
-                ifaces_str = ', '.join([self.escape_string(i) for i in router['interfaces']])
-                content += f'  interfaces = [{ifaces_str}]\n'
+            if router.interfaces:
+                parts.append(f'  interfaces = {_tf_list(router.interfaces)}\n')
             
-            content += '}\n\n'
+            parts.append('}\n\n')
             
             # Generate static routes
-            if router.get('static_routes'):
-                for route in router['static_routes']:
-                    route_resource = self.sanitize_name(f"{resource_name}_{route['name']}")
+            if router.static_routes:
+                for route in router.static_routes:
+                    route_resource = self.sanitize_name(f"{resource_name}_{route.name}")
                     
-                    content += f'resource "panos_static_route_ipv4" "{route_resource}" {{\n'
-                    content += f'  name = {self.escape_string(route["name"])}\n'
-                    content += f'  virtual_router = panos_virtual_router.{resource_name}.name\n'
+                    parts.append(f'resource "panos_static_route_ipv4" "{route_resource}" {{\n')
+                    parts.append(f'  name = {self.escape_string(route.name)}\n')
+                    parts.append(f'  virtual_router = panos_virtual_router.{resource_name}.name\n')
                     
-                    if route.get('destination'):
-                        content += f'  destination = {self.escape_string(route["destination"])}\n'
+                    if route.destination:
+                        parts.append(f'  destination = {self.escape_string(route.destination)}\n')
                     
-                    if route.get('nexthop_ip'):
-                        content += f'  next_hop = {self.escape_string(route["nexthop_ip"])}\n'
-                    elif route.get('nexthop_interface'):
-                        content += f'  interface = {self.escape_string(route["nexthop_interface"])}\n'
+                    if route.nexthop_ip:
+                        parts.append(f'  next_hop = {self.escape_string(route.nexthop_ip)}\n')
+                    elif route.nexthop_interface:
+                        parts.append(f'  interface = {self.escape_string(route.nexthop_interface)}\n')
                     
-                    if route.get('metric'):
-                        content += f'  metric = {route["metric"]}\n'
+                    if route.metric:
+                        parts.append(f'  metric = {route.metric}\n')
                     
-                    content += '}\n\n'
+                    parts.append('}\n\n')
         
-        with open(self.output_dir / 'virtual_routers.tf', 'w') as f:
-            f.write(content)
+        self._write('virtual_routers.tf', ''.join(parts))
     
-    def generate_ethernet_interfaces(self, interfaces: List[Dict]):
+    def generate_ethernet_interfaces(self, interfaces: List[Interface]):
         """Generate ethernet interface Terraform configuration"""
         if not interfaces:
             return
         
-        content = '# Ethernet Interface Configurations\n'
-        content += '# Note: These are reference configurations. Adjust for your hardware platform.\n\n'
+        parts = ['# Ethernet Interface Configurations\n']
+        parts.append('# Note: These are reference configurations. Adjust for your hardware platform.\n\n')
         
         for iface in interfaces:
-            if iface['type'] != 'ethernet':
+            if iface.type != 'ethernet':
                 continue
             
-            resource_name = self.sanitize_name(iface['name'])
+            resource_name = self.sanitize_name(iface.name)
             
-            if iface['mode'] == 'layer3':
-                content += f'resource "panos_ethernet_interface" "{resource_name}" {{\n'
-                content += f'  name = {self.escape_string(iface["name"])}\n'
-                content += f'  mode = "layer3"\n'
+            if iface.mode == 'layer3':
+                parts.append(f'resource "panos_ethernet_interface" "{resource_name}" {{\n')
+                parts.append(f'  name = {self.escape_string(iface.name)}\n')
+                parts.append(f'  mode = "layer3"\n')
                 
-                if iface.get('comment'):
-                    content += f'  comment = {self.escape_string(iface["comment"])}\n'
+                if iface.comment:
+                    parts.append(f'  comment = {self.escape_string(iface.comment)}\n')
                 
-                if iface.get('ip_addresses'):
-                    ips_str = ', '.join([self.escape_string(ip) for ip in iface['ip_addresses']])
-                    content += f'  static_ips = [{ips_str}]\n'
+                if iface.ip_addresses:
+                    parts.append(f'  static_ips = {_tf_list(iface.ip_addresses)}\n')
                 
-                if iface.get('management_profile'):
-                    content += f'  management_profile = {self.escape_string(iface["management_profile"])}\n'
+                if iface.management_profile:
+                    parts.append(f'  management_profile = {self.escape_string(iface.management_profile)}\n')
                 
-                content += '}\n\n'
+                parts.append('}\n\n')
             
-            elif iface['mode'] == 'layer2':
-                content += f'resource "panos_layer2_subinterface" "{resource_name}" {{\n'
-                content += f'  name = {self.escape_string(iface["name"])}\n'
+            elif iface.mode == 'layer2':
+                parts.append(f'resource "panos_layer2_subinterface" "{resource_name}" {{\n')
+                parts.append(f'  name = {self.escape_string(iface.name)}\n')
                 
-                if iface.get('comment'):
-                    content += f'  comment = {self.escape_string(iface["comment"])}\n'
+                if iface.comment:
+                    parts.append(f'  comment = {self.escape_string(iface.comment)}\n')
                 
-                content += '}\n\n'
+                parts.append('}\n\n')
         
-        with open(self.output_dir / 'interfaces.tf', 'w') as f:
-            f.write(content)
+        self._write('interfaces.tf', ''.join(parts))
     
-    def generate_interface_report(self, interfaces: List[Dict]):
+    def generate_interface_report(self, interfaces: List[Interface]):
         """Generate a text report of interfaces and their IP addresses"""
         if not interfaces:
             return
         
-        content = '=' * 80 + '\n'
-        content += 'INTERFACE AND IP ADDRESS MIGRATION REPORT\n'
-        content += 'Generated for Firewall Migration Planning\n'
-        content += '=' * 80 + '\n\n'
+        parts = ['=' * 80 + '\n']
+        parts.append('INTERFACE AND IP ADDRESS MIGRATION REPORT\n')
+        parts.append('Generated for Firewall Migration Planning\n')
+        parts.append('=' * 80 + '\n\n')
         
-        content += 'This report lists all interfaces and their assigned IP addresses from the\n'
-        content += 'source configuration. Use this to plan interface mapping for the new platform.\n\n'
+        parts.append('This report lists all interfaces and their assigned IP addresses from the\n')
+        parts.append('source configuration. Use this to plan interface mapping for the new platform.\n\n')
         
-        content += '=' * 80 + '\n'
-        content += 'INTERFACE SUMMARY\n'
-        content += '=' * 80 + '\n\n'
+        parts.append('=' * 80 + '\n')
+        parts.append('INTERFACE SUMMARY\n')
+        parts.append('=' * 80 + '\n\n')
         
         # Group by type
-        by_type = {}
+        by_type = defaultdict(list)
         for iface in interfaces:
-            iface_type = iface['type']
-            if iface_type not in by_type:
-                by_type[iface_type] = []
-            by_type[iface_type].append(iface)
+            by_type[iface.type].append(iface)
         
+        by_name = attrgetter('name')
         for iface_type, iface_list in sorted(by_type.items()):
-            content += f'\n{iface_type.upper()} INTERFACES ({len(iface_list)})\n'
-            content += '-' * 80 + '\n'
-            
-            for iface in sorted(iface_list, key=lambda x: x['name']):
-                content += f'\nInterface: {iface["name"]}\n'
-                content += f'  Type: {iface["type"]}\n'
-                content += f'  Mode: {iface["mode"]}\n'
-                
-                if iface.get('comment'):
-                    content += f'  Comment: {iface["comment"]}\n'
-                
-                if iface.get('ip_addresses'):
-                    content += f'  IPv4 Addresses:\n'
-                    for ip in iface['ip_addresses']:
-                        content += f'    - {ip}\n'
-                
-                if iface.get('ipv6_addresses'):
-                    content += f'  IPv6 Addresses:\n'
-                    for ip in iface['ipv6_addresses']:
-                        content += f'    - {ip}\n'
-                
-                if iface.get('management_profile'):
-                    content += f'  Management Profile: {iface["management_profile"]}\n'
-                
-                if iface.get('tag'):
-                    content += f'  VLAN Tag: {iface["tag"]}\n'
-        
-        content += '\n' + '=' * 80 + '\n'
-        content += 'MIGRATION CHECKLIST\n'
-        content += '=' * 80 + '\n\n'
-        
-        content += '1. Review interface naming differences between platforms\n'
-        content += '2. Map source interfaces to target platform interfaces\n'
-        content += '3. Verify IP addressing scheme is compatible\n'
-        content += '4. Check for interface-specific features that may not translate\n'
-        content += '5. Update zone and virtual router configurations accordingly\n'
-        content += '6. Test connectivity after migration\n\n'
-        
-        content += '=' * 80 + '\n'
-        content += 'PLATFORM MIGRATION NOTES\n'
-        content += '=' * 80 + '\n\n'
-        
-        content += 'Common Interface Naming Patterns:\n\n'
-        content += '  PA-200/500 Series:    ethernet1/1 - ethernet1/8\n'
-        content += '  PA-800 Series:        ethernet1/1 - ethernet1/8\n'
-        content += '  PA-3000 Series:       ethernet1/1 - ethernet1/20+\n'
-        content += '  PA-5000 Series:       ethernet1/1 - ethernet1/24+\n'
-        content += '  PA-7000 Series:       ethernet1/1 - ethernet1/48+ (per slot)\n'
-        content += '  VM-Series:            ethernet1/1 - ethernet1/X (configurable)\n\n'
-        
-        content += 'Remember:\n'
-        content += '  - Management interface naming varies by platform\n'
-        content += '  - Some platforms support additional interface types (QSFP, SFP+, etc.)\n'
-        content += '  - Aggregate interfaces may have different limitations\n'
-        content += '  - Verify transceiver compatibility for the new platform\n\n'
-        
-        with open(self.output_dir / 'INTERFACE_MIGRATION_REPORT.txt', 'w') as f:
-            f.write(content)
-    
-    def generate_security_profiles(self, profiles: Dict[str, List[Dict]]):
+            parts.append(f'\n{iface_type.upper()} INTERFACES ({len(iface_list)})\n')
+            parts.append('-' * 80 + '\n')
+            
+            for iface in sorted(iface_list, key=by_name):
+                parts.append(f'\nInterface: {iface.name}\n')
+                parts.append(f'  Type: {iface.type}\n')
+                parts.append(f'  Mode: {iface.mode}\n')
+                
+                if iface.comment:
+                    parts.append(f'  Comment: {iface.comment}\n')
+                
+                if iface.ip_addresses:
+                    parts.append(f'  IPv4 Addresses:\n')
+                    for ip in iface.ip_addresses:
+                        parts.append(f'    - {ip}\n')
+                
+                if iface.ipv6_addresses:
+                    parts.append(f'  IPv6 Addresses:\n')
+                    for ip in iface.ipv6_addresses:
+                        parts.append(f'    - {ip}\n')
+                
+                if iface.management_profile:
+                    parts.append(f'  Management Profile: {iface.management_profile}\n')
+                
+                if iface.tag:
+                    parts.append(f'  VLAN Tag: {iface.tag}\n')
+        
+        parts.append('\n' + '=' * 80 + '\n')
+        parts.append('MIGRATION CHECKLIST\n')
+        parts.append('=' * 80 + '\n\n')
+        
+        parts.append('1. Review interface naming differences between platforms\n')
+        parts.append('2. Map source interfaces to target platform interfaces\n')
+        parts.append('3. Verify IP addressing scheme is compatible\n')
+        parts.append('4. Check for interface-specific features that may not translate\n')
+        parts.append('5. Update zone and virtual router configurations accordingly\n')
+        parts.append('6. Test connectivity after migration\n\n')
+        
+        parts.append('=' * 80 + '\n')
+        parts.append('PLATFORM MIGRATION NOTES\n')
+        parts.append('=' * 80 + '\n\n')
+        
+        parts.append('Common Interface Naming Patterns:\n\n')
+        parts.append('  PA-200/500 Series:    ethernet1/1 - ethernet1/8\n')
+        parts.append('  PA-800 Series:        ethernet1/1 - ethernet1/8\n')
+        parts.append('  PA-3000 Series:       ethernet1/1 - ethernet1/20+\n')
+        parts.append('  PA-5000 Series:       ethernet1/1 - ethernet1/24+\n')
+        parts.append('  PA-7000 Series:       ethernet1/1 - ethernet1/48+ (per slot)\n')
+        parts.append('  VM-Series:            ethernet1/1 - ethernet1/X (configurable)\n\n')
+        
+        parts.append('Remember:\n')
+        parts.append('  - Management interface naming varies by platform\n')
+        parts.append('  - Some platforms support additional interface types (QSFP, SFP+, etc.)\n')
+        parts.append('  - Aggregate interfaces may have different limitations\n')
+        parts.append('  - Verify transceiver compatibility for the new platform\n\n')
+        
+        self._write('INTERFACE_MIGRATION_REPORT.txt', ''.join(parts))
+    
+    # (profiles key, heading, resource type), in output order
+    _SECURITY_PROFILE_KINDS = (
+        ('antivirus', 'Antivirus Profiles', 'panos_antivirus_security_profile'),
+        ('vulnerability', 'Vulnerability Protection Profiles', 'panos_vulnerability_security_profile'),
+        ('anti_spyware', 'Anti-Spyware Profiles', 'panos_anti_spyware_security_profile'),
+        ('url_filtering', 'URL Filtering Profiles', 'panos_url_filtering_security_profile'),
+        ('file_blocking', 'File Blocking Profiles', 'panos_file_blocking_security_profile'),
+        ('wildfire_analysis', 'WildFire Analysis Profiles', 'panos_wildfire_analysis_security_profile'),
+    )
+    
+    def generate_security_profiles(self, profiles: Dict[str, List[SecurityProfile]]):
         """Generate security profile Terraform configuration"""
         if not any(profiles.values()):
             return
         
-        content = '# Security Profiles\n'
-        content += '# Note: These are simplified profile references.\n'
-        content += '# Detailed profile rules must be configured manually or imported.\n\n'
+        parts = ['# Security Profiles\n']
+        parts.append('# Note: These are simplified profile references.\n')
+        parts.append('# Detailed profile rules must be configured manually or imported.\n\n')
         
         # Note: Full profile configuration with all rules is complex
         # This generates basic profile declarations that can be enhanced
         
-        # Antivirus profiles
-        if profiles.get('antivirus'):
-            content += '# Antivirus Profiles\n'
-            for prof in profiles['antivirus']:
-                resource_name = self.sanitize_name(prof['name'])
-                content += f'# Profile: {prof["name"]}\n'
-                if prof.get('description'):
-                    content += f'# Description: {prof["description"]}\n'
-                content += f'# Resource: panos_antivirus_security_profile.{resource_name}\n\n'
-        
-        # Vulnerability profiles
-        if profiles.get('vulnerability'):
-            content += '# Vulnerability Protection Profiles\n'
-            for prof in profiles['vulnerability']:
-                resource_name = self.sanitize_name(prof['name'])
-                content += f'# Profile: {prof["name"]}\n'
-                if prof.get('description'):
-                    content += f'# Description: {prof["description"]}\n'
-                content += f'# Resource: panos_vulnerability_security_profile.{resource_name}\n\n'
-        
-        # Anti-spyware profiles
-        if profiles.get('anti_spyware'):
-            content += '# Anti-Spyware Profiles\n'
-            for prof in profiles['anti_spyware']:
-                resource_name = self.sanitize_name(prof['name'])
-                content += f'# Profile: {prof["name"]}\n'
-                if prof.get('description'):
-                    content += f'# Description: {prof["description"]}\n'
-                content += f'# Resource: panos_anti_spyware_security_profile.{resource_name}\n\n'
-        
-        # URL filtering profiles  
-        if profiles.get('url_filtering'):
-            content += '# URL Filtering Profiles\n'
-            for prof in profiles['url_filtering']:
-                resource_name = self.sanitize_name(prof['name'])
-                content += f'# Profile: {prof["name"]}\n'
-                if prof.get('description'):
-                    content += f'# Description: {prof["description"]}\n'
-                content += f'# Resource: panos_url_filtering_security_profile.{resource_name}\n\n'
-        
-        # File blocking profiles
-        if profiles.get('file_blocking'):
-            content += '# File Blocking Profiles\n'
-            for prof in profiles['file_blocking']:
-                resource_name = self.sanitize_name(prof['name'])
-                content += f'# Profile: {prof["name"]}\n'
-                if prof.get('description'):
-                    content += f'# Description: {prof["description"]}\n'
-                content += f'# Resource: panos_file_blocking_security_profile.{resource_name}\n\n'
-        
-        # WildFire profiles
-        if profiles.get('wildfire_analysis'):
-            content += '# WildFire Analysis Profiles\n'
-            for prof in profiles['wildfire_analysis']:
-                resource_name = self.sanitize_name(prof['name'])
-                content += f'# Profile: {prof["name"]}\n'
-                if prof.get('description'):
-                    content += f'# Description: {prof["description"]}\n'
-                content += f'# Resource: panos_wildfire_analysis_security_profile.{resource_name}\n\n'
-        
-        with open(self.output_dir / 'security_profiles.tf', 'w') as f:
-            f.write(content)
-    
-    def generate_security_profile_groups(self, groups: List[Dict]):
+        for key, heading, resource_type in self._SECURITY_PROFILE_KINDS:
+            if not profiles.get(key):
+                continue
+            parts.append(f'# {heading}\n')
+            for prof in profiles[key]:
+                resource_name = self.sanitize_name(prof.name)
+                parts.append(f'# Profile: {prof.name}\n')
+                if prof.description:
+                    parts.append(f'# Description: {prof.description}\n')
+                parts.append(f'# Resource: {resource_type}.{resource_name}\n\n')
+        
+        self._write('security_profiles.tf', ''.join(parts))
+    
+    # Profile group fields, in output order; only the first member is emitted
+    _PROFILE_GROUP_FIELDS = ('virus', 'spyware', 'vulnerability', 'url_filtering',
+                             'file_blocking', 'wildfire_analysis')
+    
+    def generate_security_profile_groups(self, groups: List[SecurityProfileGroup]):
         """Generate security profile group Terraform configuration"""
         if not groups:
             return
         
-        content = '# Security Profile Groups\n\n'
+        parts = ['# Security Profile Groups\n\n']
         
         for grp in groups:
-            resource_name = self.sanitize_name(grp['name'])
-            
-            content += f'resource "panos_security_profile_group" "{resource_name}" {{\n'
-            content += f'  name = {self.escape_string(grp["name"])}\n'
+            resource_name = self.sanitize_name(grp.name)
             
-            if grp.get('virus') and grp['virus']:
-                content += f'  virus = {self.escape_string(grp["virus"][0])}\n'
+            parts.append(f'resource "panos_security_profile_group" "{resource_name}" {{\n')
+            parts.append(f'  name = {self.escape_string(grp.name)}\n')
             
-            if grp.get('spyware') and grp['spyware']:
-                content += f'  spyware = {self.escape_string(grp["spyware"][0])}\n'
+            for field in self._PROFILE_GROUP_FIELDS:
+                members = getattr(grp, field)
+                if members:
+                    parts.append(f'  {field} = {self.escape_string(members[0])}\n')
             
-            if grp.get('vulnerability') and grp['vulnerability']:
-                content += f'  vulnerability = {self.escape_string(grp["vulnerability"][0])}\n'
-            
-            if grp.get('url_filtering') and grp['url_filtering']:
-                content += f'  url_filtering = {self.escape_string(grp["url_filtering"][0])}\n'
-            
-            if grp.get('file_blocking') and grp['file_blocking']:
-                content += f'  file_blocking = {self.escape_string(grp["file_blocking"][0])}\n'
-            
-            if grp.get('wildfire_analysis') and grp['wildfire_analysis']:
-                content += f'  wildfire_analysis = {self.escape_string(grp["wildfire_analysis"][0])}\n'
-            
-            content += '}\n\n'
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'security_profile_groups.tf', 'w') as f:
-            f.write(content)
+        self._write('security_profile_groups.tf', ''.join(parts))
     
     
     def generate_bgp_config(self, bgp_config: Dict[str, Any]):
@@ -3003,113 +3016,111 @@ variable "device_group" {
         if not bgp_config:
             return
         
-        content = '# BGP Configuration\n'
-        content += '# Note: BGP configuration requires careful validation.\n'
-        content += '# Verify all peer addresses and AS numbers before applying.\n\n'
+        parts = ['# BGP Configuration\n']
+        parts.append('# Note: BGP configuration requires careful validation.\n')
+        parts.append('# Verify all peer addresses and AS numbers before applying.\n\n')
         
-        content += f'resource "panos_bgp" "default" {{\n'
-        content += f'  virtual_router = panos_virtual_router.default.name\n'
-        content += f'  enable = true\n'
+        parts.append(f'resource "panos_bgp" "default" {{\n')
+        parts.append(f'  virtual_router = panos_virtual_router.default.name\n')
+        parts.append(f'  enable = true\n')
         
         if bgp_config.get('router_id'):
-            content += f'  router_id = {self.escape_string(bgp_config["router_id"])}\n'
+            parts.append(f'  router_id = {self.escape_string(bgp_config["router_id"])}\n')
         
         if bgp_config.get('as_number'):
-            content += f'  as_number = {self.escape_string(bgp_config["as_number"])}\n'
+            parts.append(f'  as_number = {self.escape_string(bgp_config["as_number"])}\n')
         
-        content += '}\n\n'
+        parts.append('}\n\n')
         
         # BGP Peer Groups
         for pg in bgp_config.get('peer_groups', []):
             resource_name = self.sanitize_name(f"pg_{pg['name']}")
-            content += f'resource "panos_bgp_peer_group" "{resource_name}" {{\n'
-            content += f'  virtual_router = panos_virtual_router.default.name\n'
-            content += f'  name = {self.escape_string(pg["name"])}\n'
+            parts.append(f'resource "panos_bgp_peer_group" "{resource_name}" {{\n')
+            parts.append(f'  virtual_router = panos_virtual_router.default.name\n')
+            parts.append(f'  name = {self.escape_string(pg["name"])}\n')
             
             if pg.get('type'):
-                content += f'  type = {self.escape_string(pg["type"])}\n'
+                parts.append(f'  type = {self.escape_string(pg["type"])}\n')
             
-            content += f'  depends_on = [panos_bgp.default]\n'
-            content += '}\n\n'
+            parts.append(f'  depends_on = [panos_bgp.default]\n')
+            parts.append('}\n\n')
         
         # BGP Peers
         for peer in bgp_config.get('peers', []):
             resource_name = self.sanitize_name(f"peer_{peer['name']}")
-            content += f'resource "panos_bgp_peer" "{resource_name}" {{\n'
-            content += f'  virtual_router = panos_virtual_router.default.name\n'
-            content += f'  bgp_peer_group = {self.escape_string(peer.get("peer_group", ""))}\n'
-            content += f'  name = {self.escape_string(peer["name"])}\n'
-            content += f'  enable = {str(peer.get("enable", True)).lower()}\n'
+            parts.append(f'resource "panos_bgp_peer" "{resource_name}" {{\n')
+            parts.append(f'  virtual_router = panos_virtual_router.default.name\n')
+            parts.append(f'  bgp_peer_group = {self.escape_string(peer.get("peer_group", ""))}\n')
+            parts.append(f'  name = {self.escape_string(peer["name"])}\n')
+            parts.append(f'  enable = {_TF_BOOL[peer.get("enable", True)]}\n')
             
             if peer.get('peer_as'):
-                content += f'  peer_as = {self.escape_string(peer["peer_as"])}\n'
+                parts.append(f'  peer_as = {self.escape_string(peer["peer_as"])}\n')
             
             if peer.get('local_address_interface'):
-                content += f'  local_address_interface = {self.escape_string(peer["local_address_interface"])}\n'
+                parts.append(f'  local_address_interface = {self.escape_string(peer["local_address_interface"])}\n')
             
             if peer.get('local_address_ip'):
-                content += f'  local_address_ip = {self.escape_string(peer["local_address_ip"])}\n'
+                parts.append(f'  local_address_ip = {self.escape_string(peer["local_address_ip"])}\n')
             
             if peer.get('peer_address_ip'):
-                content += f'  peer_address_ip = {self.escape_string(peer["peer_address_ip"])}\n'
+                parts.append(f'  peer_address_ip = {self.escape_string(peer["peer_address_ip"])}\n')
             
-            content += f'  depends_on = [panos_bgp.default]\n'
-            content += '}\n\n'
+            parts.append(f'  depends_on = [panos_bgp.default]\n')
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'bgp.tf', 'w') as f:
-            f.write(content)
+        self._write('bgp.tf', ''.join(parts))
     
     def generate_ospf_config(self, ospf_config: Dict[str, Any]):
         """Generate OSPF Terraform configuration"""
         if not ospf_config:
             return
         
-        content = '# OSPF Configuration\n'
-        content += '# Note: OSPF configuration requires careful validation.\n'
-        content += '# Verify all area configurations and interface assignments.\n\n'
+        parts = ['# OSPF Configuration\n']
+        parts.append('# Note: OSPF configuration requires careful validation.\n')
+        parts.append('# Verify all area configurations and interface assignments.\n\n')
         
-        content += f'resource "panos_ospf" "default" {{\n'
-        content += f'  virtual_router = panos_virtual_router.default.name\n'
-        content += f'  enable = true\n'
+        parts.append(f'resource "panos_ospf" "default" {{\n')
+        parts.append(f'  virtual_router = panos_virtual_router.default.name\n')
+        parts.append(f'  enable = true\n')
         
         if ospf_config.get('router_id'):
-            content += f'  router_id = {self.escape_string(ospf_config["router_id"])}\n'
+            parts.append(f'  router_id = {self.escape_string(ospf_config["router_id"])}\n')
         
-        content += '}\n\n'
+        parts.append('}\n\n')
         
         # OSPF Areas
         for area in ospf_config.get('areas', []):
             resource_name = self.sanitize_name(f"area_{area['area_id']}")
-            content += f'resource "panos_ospf_area" "{resource_name}" {{\n'
-            content += f'  virtual_router = panos_virtual_router.default.name\n'
-            content += f'  name = {self.escape_string(area["area_id"])}\n'
+            parts.append(f'resource "panos_ospf_area" "{resource_name}" {{\n')
+            parts.append(f'  virtual_router = panos_virtual_router.default.name\n')
+            parts.append(f'  name = {self.escape_string(area["area_id"])}\n')
             
             if area['type'] != 'normal':
-                content += f'  type = {self.escape_string(area["type"])}\n'
+                parts.append(f'  type = {self.escape_string(area["type"])}\n')
             
-            content += f'  depends_on = [panos_ospf.default]\n'
-            content += '}\n\n'
+            parts.append(f'  depends_on = [panos_ospf.default]\n')
+            parts.append('}\n\n')
         
         # OSPF Interfaces
         for iface in ospf_config.get('interfaces', []):
             resource_name = self.sanitize_name(f"ospf_{iface['interface']}")
-            content += f'resource "panos_ospf_area_interface" "{resource_name}" {{\n'
-            content += f'  virtual_router = panos_virtual_router.default.name\n'
-            content += f'  ospf_area = "0.0.0.0"  # Adjust to correct area\n'
-            content += f'  name = {self.escape_string(iface["interface"])}\n'
-            content += f'  enable = {str(iface.get("enable", True)).lower()}\n'
+            parts.append(f'resource "panos_ospf_area_interface" "{resource_name}" {{\n')
+            parts.append(f'  virtual_router = panos_virtual_router.default.name\n')
+            parts.append(f'  ospf_area = "0.0.0.0"  # Adjust to correct area\n')
+            parts.append(f'  name = {self.escape_string(iface["interface"])}\n')
+            parts.append(f'  enable = {_TF_BOOL[iface.get("enable", True)]}\n')
             
             if iface.get('passive'):
-                content += f'  passive = true\n'
+                parts.append(f'  passive = true\n')
             
             if iface.get('metric'):
-                content += f'  metric = {iface["metric"]}\n'
+                parts.append(f'  metric = {iface["metric"]}\n')
             
-            content += f'  depends_on = [panos_ospf.default]\n'
-            content += '}\n\n'
+            parts.append(f'  depends_on = [panos_ospf.default]\n')
+            parts.append('}\n\n')
         
-        with open(self.output_dir / 'ospf.tf', 'w') as f:
-            f.write(content)
+        self._write('ospf.tf', ''.join(parts))
     
     def generate_vpn_config(self, ike_gateways: List[Dict], ipsec_tunnels: List[Dict], 
                            ike_profiles: List[Dict], ipsec_profiles: List[Dict]):
@@ -3117,265 +3128,267 @@ variable "device_group" {
         if not (ike_gateways or ipsec_tunnels):
             return
         
-        content = '# IPsec VPN Configuration\n'
-        content += '# IMPORTANT: Pre-shared keys are set to generic placeholders.\n'
-        content += '# You MUST update all pre-shared keys before applying!\n'
-        content += '# Search for "***CHANGE_ME***" and replace with actual keys.\n\n'
+        parts = ['# IPsec VPN Configuration\n']
+        parts.append('# IMPORTANT: Pre-shared keys are set to generic placeholders.\n')
+        parts.append('# You MUST update all pre-shared keys before applying!\n')
+        parts.append('# Search for "***CHANGE_ME***" and replace with actual keys.\n\n')
         
         # IKE Crypto Profiles
         if ike_profiles:
-            content += '# IKE Crypto Profiles\n\n'
+            parts.append('# IKE Crypto Profiles\n\n')
             for profile in ike_profiles:
                 resource_name = self.sanitize_name(f"ike_profile_{profile['name']}")
-                content += f'resource "panos_ike_crypto_profile" "{resource_name}" {{\n'
-                content += f'  name = {self.escape_string(profile["name"])}\n'
+                parts.append(f'resource "panos_ike_crypto_profile" "{resource_name}" {{\n')
+                parts.append(f'  name = {self.escape_string(profile["name"])}\n')
                 
                 if profile.get('dh_groups'):
-                    dh_str = ', '.join([self.escape_string(dh) for dh in profile['dh_groups']])
-                    content += f'  dh_groups = [{dh_str}]\n'
+                    parts.append(f'  dh_groups = {_tf_list(profile["dh_groups"])}\n')
                 
                 if profile.get('authentications'):
-                    auth_str = ', '.join([self.escape_string(a) for a in profile['authentications']])
-                    content += f'  authentications = [{auth_str}]\n'
+                    parts.append(f'  authentications = {_tf_list(profile["authentications"])}\n')
                 
                 if profile.get('encryptions'):
-                    enc_str = ', '.join([self.escape_string(e) for e in profile['encryptions']])
-                    content += f'  encryptions = [{enc_str}]\n'
+                    parts.append(f'  encryptions = {_tf_list(profile["encryptions"])}\n')
                 
                 if profile.get('lifetime_hours'):
-                    content += f'  lifetime_hours = {profile["lifetime_hours"]}\n'
+                    parts.append(f'  lifetime_hours = {profile["lifetime_hours"]}\n')
                 
-                content += '}\n\n'
+                parts.append('}\n\n')
         
         # IPsec Crypto Profiles
         if ipsec_profiles:
-            content += '# IPsec Crypto Profiles\n\n'
+            parts.append('# IPsec Crypto Profiles\n\n')
             for profile in ipsec_profiles:
                 resource_name = self.sanitize_name(f"ipsec_profile_{profile['name']}")
-                content += f'resource "panos_ipsec_crypto_profile" "{resource_name}" {{\n'
-                content += f'  name = {self.escape_string(profile["name"])}\n'
-                content += f'  protocol = {self.escape_string(profile.get("protocol", "esp"))}\n'
+                parts.append(f'resource "panos_ipsec_crypto_profile" "{resource_name}" {{\n')
+                parts.append(f'  name = {self.escape_string(profile["name"])}\n')
+                parts.append(f'  protocol = {self.escape_string(profile.get("protocol", "esp"))}\n')
                 
                 if profile.get('encryptions'):
-                    enc_str = ', '.join([self.escape_string(e) for e in profile['encryptions']])
-                    content += f'  encryptions = [{enc_str}]\n'
+                    parts.append(f'  encryptions = {_tf_list(profile["encryptions"])}\n')
                 
                 if profile.get('authentications'):
-                    auth_str = ', '.join([self.escape_string(a) for a in profile['authentications']])
-                    content += f'  authentications = [{auth_str}]\n'
+                    parts.append(f'  authentications = {_tf_list(profile["authentications"])}\n')
                 
                 if profile.get('dh_group'):
-                    content += f'  dh_group = {self.escape_string(profile["dh_group"])}\n'
+                    parts.append(f'  dh_group = {self.escape_string(profile["dh_group"])}\n')
                 
                 if profile.get('lifetime_hours'):
-                    content += f'  lifetime_hours = {profile["lifetime_hours"]}\n'
+                    parts.append(f'  lifetime_hours = {profile["lifetime_hours"]}\n')
                 
-                content += '}\n\n'
+                parts.append('}\n\n')
         
         # IKE Gateways
         if ike_gateways:
-            content += '# IKE Gateways\n'
-            content += '# WARNING: Pre-shared keys use placeholder "***CHANGE_ME***"\n'
-            content += '# Update these with actual keys from your key management system!\n\n'
+            parts.append('# IKE Gateways\n')
+            parts.append('# WARNING: Pre-shared keys use placeholder "***CHANGE_ME***"\n')
+            parts.append('# Update these with actual keys from your key management system!\n\n')
             
             for gw in ike_gateways:
                 resource_name = self.sanitize_name(f"ike_gw_{gw['name']}")
-                content += f'resource "panos_ike_gateway" "{resource_name}" {{\n'
-                content += f'  name = {self.escape_string(gw["name"])}\n'
-                content += f'  version = {self.escape_string(gw.get("version", "ikev1"))}\n'
+                parts.append(f'resource "panos_ike_gateway" "{resource_name}" {{\n')
+                parts.append(f'  name = {self.escape_string(gw["name"])}\n')
+                parts.append(f'  version = {self.escape_string(gw.get("version", "ikev1"))}\n')
                 
                 if gw.get('peer_address'):
                     if gw.get('peer_address_type') == 'fqdn':
-                        content += f'  peer_address_type = "fqdn"\n'
-                        content += f'  peer_address_value = {self.escape_string(gw["peer_address"])}\n'
+                        parts.append(f'  peer_address_type = "fqdn"\n')
+                        parts.append(f'  peer_address_value = {self.escape_string(gw["peer_address"])}\n')
                     else:
-                        content += f'  peer_address_type = "ip"\n'
-                        content += f'  peer_address_value = {self.escape_string(gw["peer_address"])}\n'
+                        parts.append(f'  peer_address_type = "ip"\n')
+                        parts.append(f'  peer_address_value = {self.escape_string(gw["peer_address"])}\n')
                 
                 if gw.get('local_address_interface'):
-                    content += f'  interface = {self.escape_string(gw["local_address_interface"])}\n'
+                    parts.append(f'  interface = {self.escape_string(gw["local_address_interface"])}\n')
                 elif gw.get('local_address'):
-                    content += f'  local_address_value = {self.escape_string(gw["local_address"])}\n'
+                    parts.append(f'  local_address_value = {self.escape_string(gw["local_address"])}\n')
                 
-                content += f'  auth_type = {self.escape_string(gw.get("auth_type", "pre-shared-key"))}\n'
+                parts.append(f'  auth_type = {self.escape_string(gw.get("auth_type", "pre-shared-key"))}\n')
                 
                 if gw.get('auth_type') == 'pre-shared-key':
                     # Use placeholder - actual key not in export for security
-                    content += f'  pre_shared_key = {self.escape_string(gw["pre_shared_key"])}  # *** CHANGE THIS KEY ***\n'
+                    parts.append(f'  pre_shared_key = {self.escape_string(gw["pre_shared_key"])}  # *** CHANGE THIS KEY ***\n')
                 
                 if gw.get('ike_crypto_profile'):
                     profile_ref = self.sanitize_name(f"ike_profile_{gw['ike_crypto_profile']}")
-                    content += f'  ike_crypto_profile = panos_ike_crypto_profile.{profile_ref}.name\n'
+                    parts.append(f'  ike_crypto_profile = panos_ike_crypto_profile.{profile_ref}.name\n')
                 
                 if gw.get('local_id'):
-                    content += f'  local_id_type = "ufqdn"\n'
-                    content += f'  local_id_value = {self.escape_string(gw["local_id"])}\n'
+                    parts.append(f'  local_id_type = "ufqdn"\n')
+                    parts.append(f'  local_id_value = {self.escape_string(gw["local_id"])}\n')
                 
                 if gw.get('peer_id'):
-                    content += f'  peer_id_type = "ufqdn"\n'
-                    content += f'  peer_id_value = {self.escape_string(gw["peer_id"])}\n'
+                    parts.append(f'  peer_id_type = "ufqdn"\n')
+                    parts.append(f'  peer_id_value = {self.escape_string(gw["peer_id"])}\n')
                 
-                content += '}\n\n'
+                parts.append('}\n\n')
         
         # IPsec Tunnels
         if ipsec_tunnels:
-            content += '# IPsec Tunnels\n\n'
+            parts.append('# IPsec Tunnels\n\n')
             for tunnel in ipsec_tunnels:
                 resource_name = self.sanitize_name(f"tunnel_{tunnel['name']}")
-                content += f'resource "panos_ipsec_tunnel" "{resource_name}" {{\n'
-                content += f'  name = {self.escape_string(tunnel["name"])}\n'
+                parts.append(f'resource "panos_ipsec_tunnel" "{resource_name}" {{\n')
+                parts.append(f'  name = {self.escape_string(tunnel["name"])}\n')
                 
                 if tunnel.get('tunnel_interface'):
-                    content += f'  tunnel_interface = {self.escape_string(tunnel["tunnel_interface"])}\n'
+                    parts.append(f'  tunnel_interface = {self.escape_string(tunnel["tunnel_interface"])}\n')
                 
                 if tunnel.get('type') == 'auto-key':
-                    content += f'  type = "auto-key"\n'
+                    parts.append(f'  type = "auto-key"\n')
                     
                     if tunnel.get('ike_gateway'):
                         gw_ref = self.sanitize_name(f"ike_gw_{tunnel['ike_gateway']}")
-                        content += f'  ak_ike_gateway = panos_ike_gateway.{gw_ref}.name\n'
+                        parts.append(f'  ak_ike_gateway = panos_ike_gateway.{gw_ref}.name\n')
                     
                     if tunnel.get('ipsec_crypto_profile'):
                         profile_ref = self.sanitize_name(f"ipsec_profile_{tunnel['ipsec_crypto_profile']}")
-                        content += f'  ak_ipsec_crypto_profile = panos_ipsec_crypto_profile.{profile_ref}.name\n'
+                        parts.append(f'  ak_ipsec_crypto_profile = panos_ipsec_crypto_profile.{profile_ref}.name\n')
                 
-                content += '}\n\n'
+                parts.append('}\n\n')
                 
                 # Proxy IDs
                 for proxy in tunnel.get('proxy_ids', []):
                     proxy_resource = self.sanitize_name(f"proxy_{tunnel['name']}_{proxy['name']}")
-                    content += f'resource "panos_ipsec_tunnel_proxy_id_ipv4" "{proxy_resource}" {{\n'
-                    content += f'  ipsec_tunnel = panos_ipsec_tunnel.{resource_name}.name\n'
-                    content += f'  name = {self.escape_string(proxy["name"])}\n'
+                    parts.append(f'resource "panos_ipsec_tunnel_proxy_id_ipv4" "{proxy_resource}" {{\n')
+                    parts.append(f'  ipsec_tunnel = panos_ipsec_tunnel.{resource_name}.name\n')
+                    parts.append(f'  name = {self.escape_string(proxy["name"])}\n')
                     
                     if proxy.get('local'):
-                        content += f'  local = {self.escape_string(proxy["local"])}\n'
+                        parts.append(f'  local = {self.escape_string(proxy["local"])}\n')
                     
                     if proxy.get('remote'):
-                        content += f'  remote = {self.escape_string(proxy["remote"])}\n'
+                        parts.append(f'  remote = {self.escape_string(proxy["remote"])}\n')
                     
                     if proxy.get('protocol'):
-                        content += f'  protocol_number = {proxy["protocol"]}\n'
+                        parts.append(f'  protocol_number = {proxy["protocol"]}\n')
                     
-                    content += '}\n\n'
-        
-        with open(self.output_dir / 'vpn.tf', 'w') as f:
-            f.write(content)
+                    parts.append('}\n\n')
+        
+        self._write('vpn.tf', ''.join(parts))
+    
+    # Fixed text before the gateway list and after the tunnel list
+    _VPN_REPORT_HEADER = ''.join((
+        '=' * 80 + '\n',
+        'VPN CONFIGURATION MIGRATION REPORT\n',
+        '=' * 80 + '\n\n',
+        
+        '⚠️  CRITICAL: PRE-SHARED KEY MANAGEMENT\n\n',
+        'Pre-shared keys are NOT included in Panorama exports for security reasons.\n',
+        'All VPN configurations use placeholder keys: ***CHANGE_ME***\n\n',
+        'REQUIRED ACTIONS:\n',
+        '1. Retrieve actual pre-shared keys from your secure key management system\n',
+        '2. Update vpn.tf file with real keys before applying\n',
+        '3. Consider using Terraform variables or secrets management\n',
+        '4. Never commit actual keys to version control\n\n',
+        
+        '=' * 80 + '\n',
+        'IKE GATEWAYS\n',
+        '=' * 80 + '\n\n',
+    ))
+    
+    _VPN_REPORT_FOOTER = ''.join((
+        '=' * 80 + '\n',
+        'KEY MANAGEMENT BEST PRACTICES\n',
+        '=' * 80 + '\n\n',
+        
+        'Option 1: Terraform Variables (Recommended)\n',
+        '-' * 40 + '\n',
+        'Create terraform.tfvars (DO NOT COMMIT):\n',
+        '  vpn_psk_gateway1 = "actual-pre-shared-key-here"\n',
+        '  vpn_psk_gateway2 = "actual-pre-shared-key-here"\n\n',
+        
+        'Update vpn.tf:\n',
+        '  pre_shared_key = var.vpn_psk_gateway1\n\n',
+        
+        'Option 2: Environment Variables\n',
+        '-' * 40 + '\n',
+        'Set environment variables:\n',
+        '  export TF_VAR_vpn_psk_gateway1="actual-key"\n\n',
+        
+        'Option 3: Secrets Management\n',
+        '-' * 40 + '\n',
+        'Use HashiCorp Vault, AWS Secrets Manager, or similar:\n',
+        '  data "vault_generic_secret" "vpn_keys" {\n',
+        '    path = "secret/vpn-keys"\n',
+        '  }\n\n',
+        
+        'Option 4: Manual Entry (Least Secure)\n',
+        '-' * 40 + '\n',
+        'Directly in vpn.tf (NOT RECOMMENDED):\n',
+        '  pre_shared_key = "actual-key"  # DO NOT COMMIT TO GIT\n\n',
+        
+        '=' * 80 + '\n',
+        'MIGRATION CHECKLIST\n',
+        '=' * 80 + '\n\n',
+        
+        '[ ] Retrieve all VPN pre-shared keys from secure storage\n',
+        '[ ] Update vpn.tf with actual keys (use variables/secrets)\n',
+        '[ ] Verify IKE gateway peer addresses\n',
+        '[ ] Confirm tunnel interface assignments\n',
+        '[ ] Check proxy ID configurations\n',
+        '[ ] Validate crypto profile settings\n',
+        '[ ] Test VPN connectivity in lab\n',
+        '[ ] Verify routing through tunnels\n',
+        '[ ] Monitor Phase 1 and Phase 2 negotiations\n',
+        '[ ] Ensure .gitignore includes terraform.tfvars\n\n',
+        
+        '=' * 80 + '\n',
+        'IMPORTANT SECURITY NOTES\n',
+        '=' * 80 + '\n\n',
+        
+        '1. Never commit pre-shared keys to version control\n',
+        '2. Use .gitignore to exclude terraform.tfvars and *.auto.tfvars\n',
+        '3. Rotate keys regularly according to security policy\n',
+        '4. Use strong, unique keys for each VPN tunnel\n',
+        '5. Consider using certificate-based authentication\n',
+        '6. Implement proper key escrow and recovery procedures\n',
+        '7. Audit key access and usage\n\n',
+    ))
     
     def generate_vpn_report(self, ike_gateways: List[Dict], ipsec_tunnels: List[Dict]):
         """Generate VPN migration report with key management instructions"""
         if not (ike_gateways or ipsec_tunnels):
             return
         
-        content = '=' * 80 + '\n'
-        content += 'VPN CONFIGURATION MIGRATION REPORT\n'
-        content += '=' * 80 + '\n\n'
-        
-        content += '⚠️  CRITICAL: PRE-SHARED KEY MANAGEMENT\n\n'
-        content += 'Pre-shared keys are NOT included in Panorama exports for security reasons.\n'
-        content += 'All VPN configurations use placeholder keys: ***CHANGE_ME***\n\n'
-        content += 'REQUIRED ACTIONS:\n'
-        content += '1. Retrieve actual pre-shared keys from your secure key management system\n'
-        content += '2. Update vpn.tf file with real keys before applying\n'
-        content += '3. Consider using Terraform variables or secrets management\n'
-        content += '4. Never commit actual keys to version control\n\n'
-        
-        content += '=' * 80 + '\n'
-        content += 'IKE GATEWAYS\n'
-        content += '=' * 80 + '\n\n'
+        parts = [self._VPN_REPORT_HEADER]
         
         for gw in ike_gateways:
-            content += f'Gateway: {gw["name"]}\n'
-            content += f'  Version: {gw.get("version", "ikev1")}\n'
-            content += f'  Peer Address: {gw.get("peer_address", "N/A")}\n'
-            content += f'  Local Address: {gw.get("local_address") or gw.get("local_address_interface", "N/A")}\n'
-            content += f'  Auth Type: {gw.get("auth_type", "pre-shared-key")}\n'
+            parts.append(f'Gateway: {gw["name"]}\n')
+            parts.append(f'  Version: {gw.get("version", "ikev1")}\n')
+            parts.append(f'  Peer Address: {gw.get("peer_address", "N/A")}\n')
+            parts.append(f'  Local Address: {gw.get("local_address") or gw.get("local_address_interface", "N/A")}\n')
+            parts.append(f'  Auth Type: {gw.get("auth_type", "pre-shared-key")}\n')
             
             if gw.get('auth_type') == 'pre-shared-key':
-                content += f'  ⚠️  Pre-Shared Key: ***MUST BE UPDATED***\n'
-                content += f'     Current placeholder: ***CHANGE_ME***\n'
-                content += f'     Action: Replace with actual key in vpn.tf\n'
+                parts.append(f'  ⚠️  Pre-Shared Key: ***MUST BE UPDATED***\n')
+                parts.append(f'     Current placeholder: ***CHANGE_ME***\n')
+                parts.append(f'     Action: Replace with actual key in vpn.tf\n')
             
-            content += f'  IKE Crypto Profile: {gw.get("ike_crypto_profile", "N/A")}\n'
-            content += '\n'
+            parts.append(f'  IKE Crypto Profile: {gw.get("ike_crypto_profile", "N/A")}\n')
+            parts.append('\n')
         
-        content += '=' * 80 + '\n'
-        content += 'IPSEC TUNNELS\n'
-        content += '=' * 80 + '\n\n'
+        parts.append('=' * 80 + '\n')
+        parts.append('IPSEC TUNNELS\n')
+        parts.append('=' * 80 + '\n\n')
         
         for tunnel in ipsec_tunnels:
-            content += f'Tunnel: {tunnel["name"]}\n'
-            content += f'  Type: {tunnel.get("type", "auto-key")}\n'
-            content += f'  Tunnel Interface: {tunnel.get("tunnel_interface", "N/A")}\n'
-            content += f'  IKE Gateway: {tunnel.get("ike_gateway", "N/A")}\n'
-            content += f'  IPsec Crypto Profile: {tunnel.get("ipsec_crypto_profile", "N/A")}\n'
+            parts.append(f'Tunnel: {tunnel["name"]}\n')
+            parts.append(f'  Type: {tunnel.get("type", "auto-key")}\n')
+            parts.append(f'  Tunnel Interface: {tunnel.get("tunnel_interface", "N/A")}\n')
+            parts.append(f'  IKE Gateway: {tunnel.get("ike_gateway", "N/A")}\n')
+            parts.append(f'  IPsec Crypto Profile: {tunnel.get("ipsec_crypto_profile", "N/A")}\n')
             
             if tunnel.get('proxy_ids'):
-                content += f'  Proxy IDs:\n'
+                parts.append(f'  Proxy IDs:\n')
                 for proxy in tunnel['proxy_ids']:
-                    content += f'    - {proxy["name"]}: {proxy.get("local", "any")} <-> {proxy.get("remote", "any")}\n'
-            
-            content += '\n'
-        
-        content += '=' * 80 + '\n'
-        content += 'KEY MANAGEMENT BEST PRACTICES\n'
-        content += '=' * 80 + '\n\n'
-        
-        content += 'Option 1: Terraform Variables (Recommended)\n'
-        content += '-' * 40 + '\n'
-        content += 'Create terraform.tfvars (DO NOT COMMIT):\n'
-        content += '  vpn_psk_gateway1 = "actual-pre-shared-key-here"\n'
-        content += '  vpn_psk_gateway2 = "actual-pre-shared-key-here"\n\n'
-        
-        content += 'Update vpn.tf:\n'
-        content += '  pre_shared_key = var.vpn_psk_gateway1\n\n'
-        
-        content += 'Option 2: Environment Variables\n'
-        content += '-' * 40 + '\n'
-        content += 'Set environment variables:\n'
-        content += '  export TF_VAR_vpn_psk_gateway1="actual-key"\n\n'
-        
-        content += 'Option 3: Secrets Management\n'
-        content += '-' * 40 + '\n'
-        content += 'Use HashiCorp Vault, AWS Secrets Manager, or similar:\n'
-        content += '  data "vault_generic_secret" "vpn_keys" {\n'
-        content += '    path = "secret/vpn-keys"\n'
-        content += '  }\n\n'
-        
-        content += 'Option 4: Manual Entry (Least Secure)\n'
-        content += '-' * 40 + '\n'
-        content += 'Directly in vpn.tf (NOT RECOMMENDED):\n'
-        content += '  pre_shared_key = "actual-key"  # DO NOT COMMIT TO GIT\n\n'
-        
-        content += '=' * 80 + '\n'
-        content += 'MIGRATION CHECKLIST\n'
-        content += '=' * 80 + '\n\n'
-        
-        content += '[ ] Retrieve all VPN pre-shared keys from secure storage\n'
-        content += '[ ] Update vpn.tf with actual keys (use variables/secrets)\n'
-        content += '[ ] Verify IKE gateway peer addresses\n'
-        content += '[ ] Confirm tunnel interface assignments\n'
-        content += '[ ] Check proxy ID configurations\n'
-        content += '[ ] Validate crypto profile settings\n'
-        content += '[ ] Test VPN connectivity in lab\n'
-        content += '[ ] Verify routing through tunnels\n'
-        content += '[ ] Monitor Phase 1 and Phase 2 negotiations\n'
-        content += '[ ] Ensure .gitignore includes terraform.tfvars\n\n'
-        
-        content += '=' * 80 + '\n'
-        content += 'IMPORTANT SECURITY NOTES\n'
-        content += '=' * 80 + '\n\n'
-        
-        content += '1. Never commit pre-shared keys to version control\n'
-        content += '2. Use .gitignore to exclude terraform.tfvars and *.auto.tfvars\n'
-        content += '3. Rotate keys regularly according to security policy\n'
-        content += '4. Use strong, unique keys for each VPN tunnel\n'
-        content += '5. Consider using certificate-based authentication\n'
-        content += '6. Implement proper key escrow and recovery procedures\n'
-        content += '7. Audit key access and usage\n\n'
-        
-        with open(self.output_dir / 'VPN_MIGRATION_REPORT.txt', 'w') as f:
-            f.write(content)
+                    parts.append(f'    - {proxy["name"]}: {proxy.get("local", "any")} <-> {proxy.get("remote", "any")}\n')
+            
+            parts.append('\n')
+        
+        parts.append(self._VPN_REPORT_FOOTER)
+        
+        self._write('VPN_MIGRATION_REPORT.txt', ''.join(parts))
     
     def generate_readme(self):
         """Generate README with usage instructions"""
@@ -3446,8 +3459,7 @@ For more information on the PAN-OS Terraform provider:
 https://registry.terraform.io/providers/PaloAltoNetworks/panos/latest/docs
 '''
         
-        with open(self.output_dir / 'README.md', 'w') as f:
-            f.write(content)
+        self._write('README.md', content)
 
 
 def main():
@@ -3463,6 +3475,11 @@ def main():
         default='terraform_output',
         help='Output directory for Terraform files (default: terraform_output)'
     )
+    parser.add_argument(
+        '--huge-tree',
+        action='store_true',
+        help="Lift lxml's depth and text-size limits for very large exports (trusted input only)"
+    )
     
     args = parser.parse_args()
     
@@ -3473,61 +3490,63 @@ def main():
     
     try:
         print(f"Parsing Panorama configuration from {args.input_file}...")
-        panorama = PanoramaParser(args.input_file)
+        panorama = PanoramaParser(args.input_file, huge_tree=args.huge_tree)
         
         print("Extracting configuration elements...")
-        device_groups = panorama.parse_device_groups()
+        parsed = panorama.parse_all()
+        
+        device_groups = parsed['device_groups']
         
         # New: Tags and Regions
-        tags = panorama.parse_tags()
-        regions = panorama.parse_regions()
+        tags = parsed['tags']
+        regions = parsed['regions']
         
         # New: URL and Application objects
-        custom_url_categories = panorama.parse_custom_url_categories()
-        application_groups = panorama.parse_application_groups()
-        application_filters = panorama.parse_application_filters()
-        external_lists = panorama.parse_external_lists()
-        schedules = panorama.parse_schedules()
+        custom_url_categories = parsed['custom_url_categories']
+        application_groups = parsed['application_groups']
+        application_filters = parsed['application_filters']
+        external_lists = parsed['external_lists']
+        schedules = parsed['schedules']
         
         # Address and Service objects
-        addresses = panorama.parse_address_objects()
-        address_groups = panorama.parse_address_groups()
-        services = panorama.parse_service_objects()
-        service_groups = panorama.parse_service_groups()
+        addresses = parsed['address_objects']
+        address_groups = parsed['address_groups']
+        services = parsed['service_objects']
+        service_groups = parsed['service_groups']
         
         # Rules
-        security_rules = panorama.parse_security_rules()
-        nat_rules = panorama.parse_nat_rules()
-        decryption_rules = panorama.parse_decryption_rules()
-        pbf_rules = panorama.parse_pbf_rules()
-        app_override_rules = panorama.parse_application_override_rules()
+        security_rules = parsed['security_rules']
+        nat_rules = parsed['nat_rules']
+        decryption_rules = parsed['decryption_rules']
+        pbf_rules = parsed['pbf_rules']
+        app_override_rules = parsed['application_override_rules']
         
         # Network
-        zones = panorama.parse_zones()
-        interfaces = panorama.parse_interfaces()
-        virtual_routers = panorama.parse_virtual_routers()
-        logical_routers = panorama.parse_logical_routers()  # Advanced Routing Engine
+        zones = parsed['zones']
+        interfaces = parsed['interfaces']
+        virtual_routers = parsed['virtual_routers']
+        logical_routers = parsed['logical_routers']  # Advanced Routing Engine
         
         # Combine virtual and logical routers for unified handling
         all_routers = virtual_routers + logical_routers
         
         # Security Profiles
-        security_profiles = panorama.parse_security_profiles()
-        security_profile_groups = panorama.parse_security_profile_groups()
-        zone_protection_profiles = panorama.parse_zone_protection_profiles()
-        log_settings = panorama.parse_log_settings()
-        qos_profiles = panorama.parse_qos_profiles()
-        tunnel_monitor_profiles = panorama.parse_tunnel_monitor_profiles()
+        security_profiles = parsed['security_profiles']
+        security_profile_groups = parsed['security_profile_groups']
+        zone_protection_profiles = parsed['zone_protection_profiles']
+        log_settings = parsed['log_settings']
+        qos_profiles = parsed['qos_profiles']
+        tunnel_monitor_profiles = parsed['tunnel_monitor_profiles']
         
         # Dynamic routing
-        bgp_config = panorama.parse_bgp()
-        ospf_config = panorama.parse_ospf()
+        bgp_config = parsed['bgp']
+        ospf_config = parsed['ospf']
         
         # VPN configurations
-        ike_gateways = panorama.parse_ike_gateways()
-        ipsec_tunnels = panorama.parse_ipsec_tunnels()
-        ike_crypto_profiles = panorama.parse_ike_crypto_profiles()
-        ipsec_crypto_profiles = panorama.parse_ipsec_crypto_profiles()
+        ike_gateways = parsed['ike_gateways']
+        ipsec_tunnels = parsed['ipsec_tunnels']
+        ike_crypto_profiles = parsed['ike_crypto_profiles']
+        ipsec_crypto_profiles = parsed['ipsec_crypto_profiles']
         
         print(f"\nFound:")
         print(f"  - {len(device_groups)} device groups")
@@ -3580,59 +3599,64 @@ def main():
         print(f"\nGenerating Terraform configuration in {args.output_dir}...")
         tf_gen = TerraformGenerator(args.output_dir)
         
-        # Core configuration
-        tf_gen.generate_provider_config()
-        tf_gen.generate_variables()
-        
-        # New: Tags and URL/App objects
-        tf_gen.generate_tags(tags)
-        tf_gen.generate_custom_url_categories(custom_url_categories)
-        tf_gen.generate_application_groups(application_groups)
-        tf_gen.generate_application_filters(application_filters)
-        tf_gen.generate_external_lists(external_lists)
-        tf_gen.generate_schedules(schedules)
-        
-        # Address and Service objects
-        tf_gen.generate_address_objects(addresses)
-        tf_gen.generate_address_groups(address_groups)
-        tf_gen.generate_service_objects(services)
-        tf_gen.generate_service_groups(service_groups)
-        
-        # Network
-        tf_gen.generate_zones(zones)
-        tf_gen.generate_virtual_routers(all_routers)  # Handles both virtual & logical routers
-        tf_gen.generate_ethernet_interfaces(interfaces)
-        
-        # Security Profiles
-        tf_gen.generate_security_profiles(security_profiles)
-        tf_gen.generate_security_profile_groups(security_profile_groups)
-        tf_gen.generate_zone_protection_profiles(zone_protection_profiles)
-        tf_gen.generate_log_settings(log_settings)
-        tf_gen.generate_qos_profiles(qos_profiles)
-        tf_gen.generate_tunnel_monitor_profiles(tunnel_monitor_profiles)
-        
-        # Rules
-        tf_gen.generate_security_rules(security_rules)
-        tf_gen.generate_nat_rules(nat_rules)
-        tf_gen.generate_decryption_rules(decryption_rules)
-        tf_gen.generate_pbf_rules(pbf_rules)
-        tf_gen.generate_application_override_rules(app_override_rules)
+        # Each generator writes its own file; they run in this order
+        calls = [
+            # Core configuration
+            (tf_gen.generate_provider_config,),
+            (tf_gen.generate_variables,),
+            
+            # New: Tags and URL/App objects
+            (tf_gen.generate_tags, tags),
+            (tf_gen.generate_custom_url_categories, custom_url_categories),
+            (tf_gen.generate_application_groups, application_groups),
+            (tf_gen.generate_application_filters, application_filters),
+            (tf_gen.generate_external_lists, external_lists),
+            (tf_gen.generate_schedules, schedules),
+            
+            # Address and Service objects
+            (tf_gen.generate_address_objects, addresses),
+            (tf_gen.generate_address_groups, address_groups),
+            (tf_gen.generate_service_objects, services),
+            (tf_gen.generate_service_groups, service_groups),
+            
+            # Network
+            (tf_gen.generate_zones, zones),
+            (tf_gen.generate_virtual_routers, all_routers),  # Handles both virtual & logical routers
+            (tf_gen.generate_ethernet_interfaces, interfaces),
+            
+            # Security Profiles
+            (tf_gen.generate_security_profiles, security_profiles),
+            (tf_gen.generate_security_profile_groups, security_profile_groups),
+            (tf_gen.generate_zone_protection_profiles, zone_protection_profiles),
+            (tf_gen.generate_log_settings, log_settings),
+            (tf_gen.generate_qos_profiles, qos_profiles),
+            (tf_gen.generate_tunnel_monitor_profiles, tunnel_monitor_profiles),
+            
+            # Rules
+            (tf_gen.generate_security_rules, security_rules),
+            (tf_gen.generate_nat_rules, nat_rules),
+            (tf_gen.generate_decryption_rules, decryption_rules),
+            (tf_gen.generate_pbf_rules, pbf_rules),
+            (tf_gen.generate_application_override_rules, app_override_rules),
+        ]
         
         # Dynamic routing
         if bgp_config:
-            tf_gen.generate_bgp_config(bgp_config)
+            calls.append((tf_gen.generate_bgp_config, bgp_config))
         if ospf_config:
-            tf_gen.generate_ospf_config(ospf_config)
+            calls.append((tf_gen.generate_ospf_config, ospf_config))
         
         # VPN
         if ike_gateways or ipsec_tunnels:
-            tf_gen.generate_vpn_config(ike_gateways, ipsec_tunnels, 
-                                      ike_crypto_profiles, ipsec_crypto_profiles)
-            tf_gen.generate_vpn_report(ike_gateways, ipsec_tunnels)
+            calls.append((tf_gen.generate_vpn_config, ike_gateways, ipsec_tunnels,
+                          ike_crypto_profiles, ipsec_crypto_profiles))
+            calls.append((tf_gen.generate_vpn_report, ike_gateways, ipsec_tunnels))
         
         # Reports
-        tf_gen.generate_interface_report(interfaces)
-        tf_gen.generate_readme()
+        calls.append((tf_gen.generate_interface_report, interfaces))
+        calls.append((tf_gen.generate_readme,))
+        
+        tf_gen.generate_all(calls)
         
         print(f"\n✓ Successfully generated Terraform configuration!")
         print(f"\n📄 Generated Migration Reports:")
@@ -29,25 +29,178 @@ Useful for multi-HA-pair to multi-virtual-router migrations.
 """
 
 import argparse
-import xml.etree.ElementTree as ET
+from copy import deepcopy
 from pathlib import Path
 import sys
 
-def parse_device_groups(root: ET.Element) -> list:
+try:
+    # lxml parses and serializes in C (libxml2); fall back to the standard
+    # library when it isn't installed.
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+def _copy_into(parent: ET.Element, element: ET.Element):
+    """Append element to parent without taking it out of the source tree"""
+    # lxml elements have a single parent, so append() would move the
+    # element out of the export. The splitter only gets here under lxml
+    # from merge_shared_sections(), since lxml configs are streamed from
+    # the source tree; ElementTree elements can sit in several trees
+    if HAS_LXML:
+        element = deepcopy(element)
+    parent.append(element)
+    return element
+
+# Containers the splitter looks up, indexed while the export is parsed
+_INDEXED_TAGS = ('device-group', 'template', 'template-stack', 'shared')
+
+def load_config(input_file: str, huge_tree: bool = False) -> tuple:
+    """Parse a Panorama export and index the containers the splitter reads
+    
+    Returns (root, index); index maps each of _INDEXED_TAGS to its elements
+    in document order, so lookups don't rescan the whole tree. huge_tree
+    lifts lxml's depth and text-size limits; only use it for trusted input.
+    """
+    index = {tag: [] for tag in _INDEXED_TAGS}
+    if HAS_LXML:
+        # Comments and processing instructions are dropped, as ElementTree
+        # does; indentation is rewritten on output
+        context = ET.iterparse(input_file, events=('start',), tag=_INDEXED_TAGS,
+                               huge_tree=huge_tree, remove_blank_text=True,
+                               remove_comments=True, remove_pis=True)
+        for _, elem in context:
+            index[elem.tag].append(elem)
+    else:
+        context = ET.iterparse(input_file, events=('start',))
+        for _, elem in context:
+            elements = index.get(elem.tag)
+            if elements is not None:
+                elements.append(elem)
+    return context.root, index
+
+def _entries(index: dict, tag: str) -> list:
+    """<entry> children of the indexed tag elements, i.e. findall('.//tag/entry')"""
+    return [entry for container in index[tag] for entry in container.iterfind('entry')]
+
+def _find_entry(index: dict, tag: str, name: str):
+    """First entry named name under the indexed tag elements, or None"""
+    for container in index[tag]:
+        for entry in container.iterfind('entry'):
+            if entry.get('name') == name:
+                return entry
+    return None
+
+def template_stacks_by_device_group(index: dict) -> dict:
+    """Map each device name listed in a template stack to its stacks, in order"""
+    ts_by_dg = {}
+    for ts in _entries(index, 'template-stack'):
+        # A stack is listed once per name, however often the name appears
+        names = dict.fromkeys(member.get('name') for member in ts.iterfind('.//devices/entry'))
+        for name in names:
+            ts_by_dg.setdefault(name, []).append(ts)
+    return ts_by_dg
+
+def template_lookup(index: dict) -> tuple:
+    """Template entries as ({name: first entry}, [(lowercased name, entry), ...])"""
+    by_name = {}
+    lowered = []
+    for template in _entries(index, 'template'):
+        name = template.get('name')
+        by_name.setdefault(name, template)
+        lowered.append(((name or '').lower(), template))
+    return by_name, lowered
+
+def merge_shared_sections(index: dict):
+    """Merge every <shared> section into one, or None if there are none
+    
+    The result is the same for every device group, so it is built once.
+    """
+    # Note: Panorama configs can have MULTIPLE <shared> sections
+    # We need to merge them all to capture all objects
+    shared_sections = index['shared']
+    if not shared_sections:
+        return None
+    
+    # Create a merged shared section
+    merged_shared = ET.Element('shared')
+    
+    # Track what we've added to avoid duplicates
+    seen_children = {}
+    # Names of all entries under each merged child, built on first merge
+    seen_names = {}
+    
+    for shared in shared_sections:
+        for child in shared:
+            child_tag = child.tag
+            
+            # If we haven't seen this tag yet, add it
+            if child_tag not in seen_children:
+                seen_children[child_tag] = _copy_into(merged_shared, child)
+            else:
+                # If the tag exists, merge the entries
+                existing = seen_children[child_tag]
+                existing_names = seen_names.get(child_tag)
+                if existing_names is None:
+                    existing_names = {e.get('name') for e in existing.iterfind('.//entry')}
+                    seen_names[child_tag] = existing_names
+                for entry in child.findall('.//entry'):
+                    entry_name = entry.get('name')
+                    # Only add if not already present
+                    if entry_name and entry_name not in existing_names:
+                        _copy_into(existing, entry)
+                        # Nested entries come along with it
+                        existing_names.update(e.get('name') for e in entry.iter('entry'))
+    
+    return merged_shared
+
+def parse_device_groups(index: dict) -> list:
     """Get list of device groups from Panorama config"""
-    device_groups = []
-    seen = set()
+    # dict.fromkeys drops repeated names and keeps first-seen order
+    names = dict.fromkeys(dg.get('name') for dg in _entries(index, 'device-group'))
+    return [name for name in names if name]
+
+def device_group_sources(index: dict, device_group_name: str, ts_by_dg: dict,
+                         templates: tuple):
+    """Source elements for a device group's config
+    
+    Returns (device group entry, template entry or None, template stacks),
+    or None if the device group isn't found.
+    """
+    # Find the specific device group
+    source_dg = _find_entry(index, 'device-group', device_group_name)
+    
+    if source_dg is None:
+        return None
+    
+    # Find template if it exists (network config)
+    # Try to find template with matching name or reference
+    template_name = device_group_name.replace('DG-', '').replace('dg-', '')
+    templates_by_name, templates_lowered = templates
+    source_template = templates_by_name.get(template_name)
     
-    for dg in root.findall(".//device-group/entry"):
-        name = dg.get('name')
-        if name and name not in seen:
-            device_groups.append(name)
-            seen.add(name)
+    if source_template is None:
+        # Try without prefix
+        dg_lower = device_group_name.lower()
+        for t_name, template in templates_lowered:
+            if dg_lower in t_name:
+                source_template = template
+                break
     
-    return device_groups
+    # Template stacks that reference this device group
+    return source_dg, source_template, ts_by_dg.get(device_group_name, ())
 
-def extract_device_group_config(root: ET.Element, device_group_name: str) -> ET.Element:
-    """Extract configuration for a specific device group"""
+def extract_device_group_config(root: ET.Element, sources: tuple,
+                                merged_shared: ET.Element) -> ET.Element:
+    """Extract configuration for a specific device group
+    
+    This is the standard library path: with lxml, split_panorama_config()
+    writes configs with stream_device_group_config() instead. Source
+    elements and merged_shared are attached to the new config, not copied.
+    """
+    source_dg, source_template, template_stacks = sources
+    
     # Create new root config element
     new_config = ET.Element('config')
     new_config.set('version', root.get('version', '10.0.0'))
@@ -57,90 +210,88 @@ def extract_device_group_config(root: ET.Element, device_group_name: str) -> ET.
     localhost = ET.SubElement(devices, 'entry')
     localhost.set('name', 'localhost.localdomain')
     
-    # Find the specific device group
-    dg_xpath = f".//device-group/entry[@name='{device_group_name}']"
-    source_dg = root.find(dg_xpath)
-    
-    if source_dg is None:
-        return None
-    
-    # Copy device-group
+    # Move device-group; each one is written to a single config, so the
+    # source tree doesn't need to keep it
     device_group_container = ET.SubElement(localhost, 'device-group')
     device_group_container.append(source_dg)
     
-    # Copy shared objects (they're referenced by device groups)
-    # Note: Panorama configs can have MULTIPLE <shared> sections
-    # We need to merge them all to capture all objects
-    shared_sections = root.findall('.//shared')
-    if shared_sections:
-        # Create a merged shared section
-        merged_shared = ET.Element('shared')
-        
-        # Track what we've added to avoid duplicates
-        seen_children = {}
-        
-        for shared in shared_sections:
-            for child in shared:
-                child_tag = child.tag
-                
-                # If we haven't seen this tag yet, add it
-                if child_tag not in seen_children:
-                    merged_shared.append(child)
-                    seen_children[child_tag] = child
-                else:
-                    # If the tag exists, merge the entries
-                    existing = seen_children[child_tag]
-                    for entry in child.findall('.//entry'):
-                        entry_name = entry.get('name')
-                        # Only add if not already present
-                        if entry_name:
-                            existing_names = [e.get('name') for e in existing.findall('.//entry')]
-                            if entry_name not in existing_names:
-                                existing.append(entry)
-        
+    # Add shared objects (they're referenced by device groups); the merged
+    # section belongs to the split, and each config is written before the
+    # next one takes it over
+    if merged_shared is not None:
         new_config.append(merged_shared)
     
-    # Copy template if it exists (network config)
-    # Try to find template with matching name or reference
-    template_name = device_group_name.replace('DG-', '').replace('dg-', '')
-    template_xpath = f".//template/entry[@name='{template_name}']"
-    source_template = root.find(template_xpath)
-    
-    if source_template is None:
-        # Try without prefix
-        for template in root.findall(".//template/entry"):
-            t_name = template.get('name', '')
-            if device_group_name.lower() in t_name.lower():
-                source_template = template
-                break
-    
+    # Copy template if it exists (network config); templates and stacks
+    # can be shared by several device groups
     if source_template is not None:
         template_container = ET.SubElement(localhost, 'template')
-        template_container.append(source_template)
-    
-    # Copy template stack if exists
-    for ts in root.findall(".//template-stack/entry"):
-        # Check if this stack references our device group
-        members = ts.findall('.//devices/entry')
-        for member in members:
-            if member.get('name') == device_group_name:
-                ts_container = ET.SubElement(localhost, 'template-stack')
-                ts_container.append(ts)
-                break
+        _copy_into(template_container, source_template)
+    
+    # Copy template stacks that reference this device group
+    for ts in template_stacks:
+        ts_container = ET.SubElement(localhost, 'template-stack')
+        _copy_into(ts_container, ts)
     
     return new_config
 
-def split_panorama_config(input_file: str, output_dir: str = None):
+def stream_device_group_config(output_file: Path, root: ET.Element, sources: tuple,
+                               merged_shared: ET.Element, indent: bool = True):
+    """Write a device group's config straight from the source elements (lxml only)
+    
+    Produces the same document as extract_device_group_config(), indented
+    as ET.indent() would, without building a copy of it first. With indent,
+    the source elements are re-indented in place for the depth they're
+    written at.
+    """
+    source_dg, source_template, template_stacks = sources
+    
+    # (container tag, source entry) pairs under localhost.localdomain
+    containers = [('device-group', source_dg)]
+    if source_template is not None:
+        containers.append(('template', source_template))
+    containers.extend(('template-stack', ts) for ts in template_stacks)
+    
+    with ET.xmlfile(str(output_file), encoding='UTF-8') as xf:
+        def newline(level: int):
+            # Whitespace ET.indent() puts before a child at this level
+            if indent:
+                xf.write('\n' + '  ' * level)
+        
+        def write_subtree(element: ET.Element, level: int):
+            if indent:
+                ET.indent(element, space="  ", level=level)
+            xf.write(element, with_tail=False)
+        
+        xf.write_declaration()
+        with xf.element('config', version=root.get('version', '10.0.0')):
+            newline(1)
+            with xf.element('devices'):
+                newline(2)
+                with xf.element('entry', name='localhost.localdomain'):
+                    for tag, source in containers:
+                        newline(3)
+                        with xf.element(tag):
+                            newline(4)
+                            write_subtree(source, 4)
+                            newline(3)
+                    newline(2)
+                newline(1)
+            if merged_shared is not None:
+                newline(1)
+                write_subtree(merged_shared, 1)
+            newline(0)
+
+def split_panorama_config(input_file: str, output_dir: str = None, indent: bool = True,
+                          huge_tree: bool = False):
     """Split Panorama configuration by device group"""
     try:
-        tree = ET.parse(input_file)
-        root = tree.getroot()
+        root, index = load_config(input_file, huge_tree)
     except ET.ParseError as e:
         print(f"Error: Failed to parse XML file: {e}")
         return False
     
     # Get list of device groups
-    device_groups = parse_device_groups(root)
+    device_groups = parse_device_groups(index)
     
     if not device_groups:
         print("No device groups found in Panorama configuration.")
@@ -161,13 +312,17 @@ def split_panorama_config(input_file: str, output_dir: str = None):
     
     print(f"\nSplitting configurations into: {output_dir}")
     
+    ts_by_dg = template_stacks_by_device_group(index)
+    templates = template_lookup(index)
+    merged_shared = merge_shared_sections(index)
+    
     # Extract and save each device group
     for dg_name in device_groups:
         print(f"\nProcessing device group: {dg_name}")
         
-        dg_config = extract_device_group_config(root, dg_name)
+        sources = device_group_sources(index, dg_name, ts_by_dg, templates)
         
-        if dg_config is None:
+        if sources is None:
             print(f"  ⚠ Warning: Could not extract config for {dg_name}")
             continue
         
@@ -176,9 +331,19 @@ def split_panorama_config(input_file: str, output_dir: str = None):
         output_file = output_dir / f"{safe_name}.xml"
         
         # Write to file
-        tree = ET.ElementTree(dg_config)
-        ET.indent(tree, space="  ")
-        tree.write(output_file, encoding='utf-8', xml_declaration=True)
+        if HAS_LXML:
+            # Serialize from the source tree instead of building a copy
+            stream_device_group_config(output_file, root, sources, merged_shared, indent)
+            # Each device group is written once; release it (and the
+            # indentation added to it) rather than keep it in the tree
+            source_dg = sources[0]
+            source_dg.getparent().remove(source_dg)
+        else:
+            dg_config = extract_device_group_config(root, sources, merged_shared)
+            tree = ET.ElementTree(dg_config)
+            if indent:
+                ET.indent(tree, space="  ")
+            tree.write(output_file, encoding='utf-8', xml_declaration=True)
         
         print(f"  ✓ Saved to: {output_file}")
     
@@ -202,6 +367,9 @@ Examples:
   # Specify custom output directory
   python3 split_device_groups.py panorama_export.xml --output-dir ./device-groups
   
+  # Skip re-indenting the output (faster for large exports)
+  python3 split_device_groups.py panorama_export.xml --no-indent
+  
   # Then convert each device group separately
   python3 panorama_to_terraform.py device-groups/DG-Internet.xml --output-dir internet-tf
   python3 panorama_to_terraform.py device-groups/DG-DMZ.xml --output-dir dmz-tf
@@ -216,6 +384,10 @@ Use Case:
     
     parser.add_argument('input_file', help='Panorama XML export file')
     parser.add_argument('--output-dir', '-o', help='Output directory for split configs')
+    parser.add_argument('--no-indent', action='store_true',
+                        help='Write split configs without re-indenting (faster for large exports)')
+    parser.add_argument('--huge-tree', action='store_true',
+                        help="Lift lxml's depth and text-size limits for very large exports (trusted input only)")
     
     args = parser.parse_args()
     
@@ -223,7 +395,8 @@ Use Case:
         print(f"Error: Input file not found: {args.input_file}")
         return 1
     
-    success = split_panorama_config(args.input_file, args.output_dir)
+    success = split_panorama_config(args.input_file, args.output_dir, indent=not args.no_indent,
+                                    huge_tree=args.huge_tree)
     
     return 0 if success else 1
 